@@ -0,0 +1,299 @@
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import json
+import platform
+import time
+import pygame
+from Constantes import *
+from Tablero import *
+from Motor import *
+from Solucionador import *
+from Funciones import *
+
+############################ Configuracion ################################
+
+# (filas, columnas) a medir: los tres niveles del juego y tableros a medida
+# hasta 1000x1000.
+TAMAÑOS = [(8, 8), (16, 16), (24, 24), (100, 100), (300, 300), (1000, 1000)]
+TAMAÑOS_RAPIDOS = [(8, 8), (16, 16), (24, 24), (100, 100)]
+# Fraccion de casillas con mina.
+DENSIDADES = [0.12, 0.2, 0.5]
+# El solucionador solo se mide hasta este tamaño y esta densidad: mas alla
+# una sola partida tarda segundos o se traba enseguida.
+MAXIMO_CASILLAS_SOLUCIONADOR = 100 * 100
+MAXIMA_DENSIDAD_SOLUCIONADOR = 0.2
+
+
+# ===============================================================================
+# MEDICION
+# ===============================================================================
+
+def percentil(muestras: list[float], porcentaje: float) -> float:
+    """
+    Devuelve el percentil de una lista de muestras (el valor mas cercano, sin interpolar).
+
+    Recibe:
+        muestras (List[float]): Muestras, en cualquier orden.
+        porcentaje (float): Percentil entre 0 y 100.
+
+    Devuelve:
+        float: Valor del percentil.
+    """
+    ordenadas = sorted(muestras)
+    indice = round(porcentaje / 100 * (len(ordenadas) - 1))
+
+    return ordenadas[indice]
+
+
+def medir(operacion, preparar=None, tiempo_minimo: float = 1.0, repeticiones_minimas: int = 5,
+          repeticiones_maximas: int = 1000, llamadas_por_muestra: int = 1) -> dict:
+    """
+    Mide una operacion repitiendola hasta juntar tiempo_minimo segundos y al menos
+    repeticiones_minimas muestras.
+
+    Recibe:
+        operacion (callable): Funcion a medir. Recibe lo que devuelve preparar.
+        preparar (callable, opcional): Funcion que arma los datos de cada muestra,
+                                       fuera del tiempo medido.
+        tiempo_minimo (float, opcional): Segundos medidos como minimo.
+        repeticiones_minimas (int, opcional): Muestras como minimo.
+        repeticiones_maximas (int, opcional): Muestras como maximo.
+        llamadas_por_muestra (int, opcional): Veces que se llama a la operacion en
+                                              cada muestra, para operaciones muy cortas.
+
+    Devuelve:
+        dict: Un diccionario con las claves:
+            - repeticiones (int): Muestras tomadas.
+            - ops_por_segundo (float): Operaciones por segundo segun la media.
+            - media_ms (float): Duracion media de una operacion.
+            - p50_ms (float): Mediana de la duracion de una operacion.
+            - p99_ms (float): Percentil 99 de la duracion de una operacion.
+    """
+    muestras = []
+    total = 0.0
+
+    while len(muestras) < repeticiones_maximas and (len(muestras) < repeticiones_minimas or total < tiempo_minimo):
+        datos = preparar() if preparar is not None else None
+
+        inicio = time.perf_counter()
+        for _ in range(llamadas_por_muestra):
+            operacion(datos)
+        duracion = (time.perf_counter() - inicio) / llamadas_por_muestra
+
+        muestras.append(duracion)
+        total += duracion * llamadas_por_muestra
+
+    media = sum(muestras) / len(muestras)
+
+    return {
+        'repeticiones': len(muestras),
+        'ops_por_segundo': 1 / media if media > 0 else float('inf'),
+        'media_ms': media * 1000,
+        'p50_ms': percentil(muestras, 50) * 1000,
+        'p99_ms': percentil(muestras, 99) * 1000,
+    }
+
+
+# ===============================================================================
+# CASOS
+# ===============================================================================
+
+def medir_tablero(filas: int, columnas: int, minas: int, tiempo_minimo: float,
+                  medir_dibujo: bool) -> list[dict]:
+    """
+    Mide todas las operaciones para un tamaño de tablero y una cantidad de minas.
+
+    Recibe:
+        filas (int): Filas del tablero.
+        columnas (int): Columnas del tablero.
+        minas (int): Minas del tablero.
+        tiempo_minimo (float): Segundos medidos como minimo por operacion.
+        medir_dibujo (bool): Si tambien se miden el descubrimiento del tablero
+                             vacio y el dibujo, que no dependen de las minas.
+                             Los tableros que no entran en la ventana se dibujan
+                             con la camara, como en el juego.
+
+    Devuelve:
+        List[dict]: Un resultado por operacion (ver medir), con la operacion,
+                    el tamaño y las minas agregados.
+    """
+    resultados = []
+    semillas = iter(range(1, 1 << 30))
+
+    def agregar(nombre: str, medicion: dict) -> None:
+        medicion.update({'operacion': nombre, 'filas': filas, 'columnas': columnas, 'minas': minas})
+        resultados.append(medicion)
+
+    agregar('motor_nuevo', medir(lambda _: MotorTablero(filas, columnas, minas, next(semillas)),
+                                 tiempo_minimo=tiempo_minimo))
+    agregar('inicializar_matriz', medir(lambda _: inicializar_matriz(filas, columnas, minas, next(semillas)),
+                                        tiempo_minimo=tiempo_minimo))
+    agregar('generar_matriz_numeros', medir(generar_matriz_numeros,
+                                            lambda: inicializar_matriz(filas, columnas, minas, next(semillas)),
+                                            tiempo_minimo=tiempo_minimo))
+
+    motor = MotorTablero(filas, columnas, minas, semilla=0)
+    agregar('verificar_victoria', medir(lambda _: verificar_victoria(motor.tablero),
+                                        tiempo_minimo=tiempo_minimo, llamadas_por_muestra=1000))
+
+    if filas * columnas <= MAXIMO_CASILLAS_SOLUCIONADOR and minas <= filas * columnas * MAXIMA_DENSIDAD_SOLUCIONADOR:
+        def tablero_empezado() -> dict:
+            partida = MotorTablero(filas, columnas, minas, next(semillas), zona_libre=True)
+            asegurar_primer_click(partida.tablero, filas // 2, columnas // 2, True, partida.semilla)
+            return partida.tablero
+
+        estadisticas = crear_estadisticas_solucionador()
+        agregar('es_resoluble', medir(lambda tablero: es_resoluble(tablero, filas // 2, columnas // 2, estadisticas),
+                                      tablero_empezado, tiempo_minimo=tiempo_minimo))
+        resultados[-1]['etapas'] = estadisticas
+
+    if not medir_dibujo:
+        return resultados
+
+    def tablero_vacio() -> dict:
+        return crear_tablero(filas, columnas)
+
+    vacio = medir(lambda tablero: descubrir_celda(tablero, 0, 0), tablero_vacio, tiempo_minimo=tiempo_minimo)
+    vacio.update({'operacion': 'descubrir_celda_vacio', 'filas': filas, 'columnas': columnas, 'minas': 0})
+    resultados.append(vacio)
+
+    ventana = pygame.display.get_surface()
+    reiniciar_camara()
+    fuente = obtener_fuente("Verdana", 25)
+    imagen_bomba = cargar_imagen(IMAGEN_BOMBA)
+    imagen_bandera = cargar_imagen(IMAGEN_BANDERA)
+
+    motor.descubrir(filas // 2, columnas // 2)
+    agregar('dibujar_matriz_buscaminas', medir(lambda _: dibujar_matriz_buscaminas(ventana, motor.tablero, fuente,
+                                                                                   imagen_bomba, imagen_bandera),
+                                               tiempo_minimo=tiempo_minimo))
+    agregar('mostrar_pantalla_juego', medir(lambda _: mostrar_pantalla_juego(2, motor, fuente, imagen_bomba,
+                                                                             imagen_bandera, False, -1, ventana),
+                                            tiempo_minimo=tiempo_minimo))
+
+    return resultados
+
+
+# ===============================================================================
+# RESULTADOS
+# ===============================================================================
+
+def clave_resultado(resultado: dict) -> tuple:
+    """
+    Devuelve lo que identifica a un resultado, para compararlo con otra corrida.
+    """
+    return (resultado['operacion'], resultado['filas'], resultado['columnas'], resultado['minas'])
+
+
+def mostrar_resultados(resultados: list[dict], anteriores: list[dict] = None) -> None:
+    """
+    Imprime una tabla con los resultados y, si se pasan, la mejora respecto de otra corrida.
+
+    Recibe:
+        resultados (List[dict]): Resultados de esta corrida.
+        anteriores (List[dict], opcional): Resultados de una corrida anterior.
+
+    Devuelve:
+        None
+    """
+    por_clave = {clave_resultado(r): r for r in anteriores or []}
+
+    print(f"{'operacion':<26} {'tablero':>10} {'minas':>7} {'ops/s':>12} {'p50 ms':>10} {'p99 ms':>10}  cambio")
+    for resultado in resultados:
+        tablero = f"{resultado['filas']}x{resultado['columnas']}"
+        linea = (f"{resultado['operacion']:<26} {tablero:>10} {resultado['minas']:>7} "
+                 f"{resultado['ops_por_segundo']:>12.1f} {resultado['p50_ms']:>10.4f} {resultado['p99_ms']:>10.4f}")
+
+        anterior = por_clave.get(clave_resultado(resultado))
+        if anterior is not None:
+            linea += f"  x{anterior['p50_ms'] / resultado['p50_ms']:.2f}"
+
+        print(linea)
+
+
+def mostrar_etapas(resultados: list[dict]) -> None:
+    """
+    Imprime cuanto tiempo uso cada tecnica del solucionador en las mediciones que lo usan.
+
+    Recibe:
+        resultados (List[dict]): Resultados de esta corrida.
+
+    Devuelve:
+        None
+    """
+    con_etapas = [r for r in resultados if 'etapas' in r]
+    if not con_etapas:
+        return
+
+    print()
+    print(f"{'solucionador':<26} {'tablero':>10} {'minas':>7} {'etapa':>14} {'llamadas':>9} {'ms':>10} {'deducciones':>12}")
+    for resultado in con_etapas:
+        tablero = f"{resultado['filas']}x{resultado['columnas']}"
+        for etapa in ETAPAS_SOLUCIONADOR:
+            contadores = resultado['etapas'][etapa]
+            print(f"{resultado['operacion']:<26} {tablero:>10} {resultado['minas']:>7} {etapa:>14} "
+                  f"{contadores['llamadas']:>9} {contadores['segundos'] * 1000:>10.1f} {contadores['deducciones']:>12}")
+
+
+def ejecutar(tamaños: list[tuple], densidades: list[float], tiempo_minimo: float) -> dict:
+    """
+    Corre todas las mediciones.
+
+    Recibe:
+        tamaños (List[tuple]): (filas, columnas) a medir.
+        densidades (List[float]): Fracciones de casillas con mina a medir.
+        tiempo_minimo (float): Segundos medidos como minimo por operacion.
+
+    Devuelve:
+        dict: Resultados y datos del entorno, listos para guardar como JSON.
+    """
+    pygame.display.init()
+    pygame.font.init()
+    obtener_diseño(pygame.display.set_mode(DIMENSIONES_VENTANA))
+
+    resultados = []
+    for filas, columnas in tamaños:
+        for i, densidad in enumerate(densidades):
+            minas = int(filas * columnas * densidad)
+            resultados.extend(medir_tablero(filas, columnas, minas, tiempo_minimo, medir_dibujo=i == 0))
+
+    tiempos_carga = obtener_tiempos_carga()
+    pygame.quit()
+
+    return {
+        'fecha': int(time.time()),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'numpy': np.__version__ if np is not None else None,
+        'resultados': resultados,
+        'tiempos_carga': tiempos_carga,
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Mide las operaciones principales del Buscaminas.")
+    parser.add_argument('--rapido', action='store_true', help="solo tableros de hasta 100x100")
+    parser.add_argument('--tiempo', type=float, default=1.0, help="segundos minimos por medicion")
+    parser.add_argument('--salida', help="archivo JSON donde guardar los resultados")
+    parser.add_argument('--comparar', help="archivo JSON de una corrida anterior")
+    argumentos = parser.parse_args()
+
+    informe = ejecutar(TAMAÑOS_RAPIDOS if argumentos.rapido else TAMAÑOS, DENSIDADES, argumentos.tiempo)
+
+    anteriores = None
+    if argumentos.comparar:
+        with open(argumentos.comparar) as archivo:
+            anteriores = json.load(archivo)['resultados']
+
+    mostrar_resultados(informe['resultados'], anteriores)
+    mostrar_etapas(informe['resultados'])
+
+    print()
+    for recurso, segundos in informe['tiempos_carga'].items():
+        print(f"carga {recurso:<24} {segundos * 1000:>10.2f} ms")
+
+    if argumentos.salida:
+        with open(argumentos.salida, 'w') as archivo:
+            json.dump(informe, archivo, indent=2)
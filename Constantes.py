@@ -21,17 +21,181 @@ COLOR_FONDO = (44, 171, 76)
 COLOR_CASILLA_OCULTA = (140, 137, 137)     
 COLOR_CASILLA_DESCUBIERTA = (220, 220, 220)  
 COLOR_CASILLA_BORDE = (0, 0, 0)
+COLOR_CASILLA_EXPLOTADA = (230, 40, 40)
+
+#### Ritmo de cuadros ####
+
+# Cuadros por segundo maximos del loop principal.
+FPS_MAXIMO = 60
+# Si es True, cuando no hay nada que animar el loop espera bloqueado a que
+# llegue un evento (o a que pase ESPERA_INACTIVA_MS) en lugar de redibujar.
+MODO_INACTIVO = True
+ESPERA_INACTIVA_MS = 1000
+
+#### Redibujado ####
+
+# Si en un cuadro cambian mas casillas que esto, se envia a la pantalla un
+# unico rectangulo que las contiene en lugar de uno por casilla.
+MAXIMO_RECTANGULOS_SUCIOS = 64
+
+#### Camara ####
+
+# Si al achicar las casillas para que entre todo el tablero quedan mas chicas
+# que esto, el tablero se muestra con una camara que se puede mover y acercar.
+TAMAÑO_MINIMO_CASILLA = 16
+# Tamaño de casilla inicial y limites del zoom de la camara.
+TAMAÑO_CASILLA_CAMARA = 24
+ZOOM_MINIMO = 6
+ZOOM_MAXIMO = 64
+# Pixeles que se mueve la camara con cada pulsacion de las flechas.
+DESPLAZAMIENTO_TECLAS = 60
+
+#### Textos ####
+
+# Cantidad maxima de textos renderizados que se guardan para reutilizar.
+MAXIMO_TEXTOS_EN_CACHE = 256
+
+#### Fondos ####
+
+# Cantidad maxima de fondos escalados que se guardan (imagen y tamaño de ventana).
+MAXIMO_FONDOS_EN_CACHE = 4
+# Si es True los fondos se escalan con suavizado (mas lento, pero se hace una sola vez por tamaño).
+SUAVIZAR_FONDOS = True
+
+#### Recursos ####
+
+# Rutas relativas a la carpeta del juego.
+IMAGEN_FONDO = 'Imagenes/Fondo.jpg'
+IMAGEN_FONDO_PUNTAJES = 'Imagenes/Puntajes.jpg'
+IMAGEN_BOMBA = 'Imagenes/bomb.png'
+IMAGEN_BANDERA = 'Imagenes/bandera.png'
+# Cantidad maxima de variantes (escaladas o teñidas) de imagenes que se guardan.
+MAXIMO_VARIANTES_EN_CACHE = 32
+# Si es True, al cerrar el juego se muestra cuanto tardo en cargarse cada recurso.
+MOSTRAR_TIEMPOS_CARGA = False
+
+#### Sonido ####
+
+MUSICA_FONDO = 'Musica/Musica.mp3'
+SONIDOS = {
+    "click": 'Musica/click.mp3',
+    "victoria": 'Musica/victoria.mp3',
+    "derrota": 'Musica/derrota.mp3',
+}
+# Sonidos de la interfaz, que se reproducen en canales reservados para que
+# nunca esperen a que se libere un canal.
+SONIDOS_INTERFAZ = ("click",)
+VOLUMEN_MUSICA = 0.2
+VOLUMEN_SONIDOS = 0.3
+FRECUENCIA_AUDIO = 44100
+# Muestras por buffer del mezclador. Cuanto mas chico, menos demora entre el
+# click y el sonido (512 muestras son unos 12 ms a 44100 Hz).
+TAMAÑO_BUFFER_AUDIO = 512
+CANALES_AUDIO = 16
+CANALES_RESERVADOS_INTERFAZ = 2
+# Carpeta (relativa a la carpeta del juego) donde se guardan los sonidos ya
+# decodificados, para no decodificar los MP3 en cada inicio.
+DIRECTORIO_CACHE_SONIDOS = '.cache_sonidos'
 
 #### Dificultades ####
 
 NOMBRES_DIFICULTAD = {
     0: "Facil",
     1: "Medio",
-    2: "Dificil"
+    2: "Dificil",
+    3: "Personalizado",
+    4: "Infinito"
 }
+DIFICULTAD_PERSONALIZADA = 3
+DIFICULTAD_INFINITA = 4
+# (filas, columnas, minas) del tablero personalizado. Se cambian al arrancar con
+# "python Main.py --personalizado FILAS COLUMNAS MINAS". Se pueden usar tableros
+# de hasta MAXIMO_LADO_PERSONALIZADO de lado: si no entran en la ventana se
+# recorren con la camara.
+TABLERO_PERSONALIZADO = (200, 200, 6000)
+MAXIMO_LADO_PERSONALIZADO = 2000
 
 #### Puntajes ####
 
 ARCHIVO_PUNTAJES = "puntajes.csv"
+# Registro donde se agrega cada puntaje nuevo hasta compactarlo en ARCHIVO_PUNTAJES.
+ARCHIVO_REGISTRO_PUNTAJES = "puntajes.log"
+MAXIMO_REGISTROS_SIN_COMPACTAR = 20
+# Linea que numera cada registro vaciado al compactar. La instantanea anota el
+# ultimo numero que ya incluye, asi un registro que no se llego a vaciar no se
+# vuelve a sumar.
+MARCA_GENERACION_PUNTAJES = "#generacion"
+MAXIMO_PUNTAJES = 10
+# Si es True los puntajes se guardan en una base SQLite con todo el historial
+# de partidas, en lugar de los archivos CSV.
+USAR_SQLITE = False
+ARCHIVO_BASE_PUNTAJES = "puntajes.db"
+# Cada cuantos segundos se revisa si el archivo de puntajes cambio desde afuera.
+INTERVALO_REVISION_PUNTAJES = 2
+
+#### Tablero ####
+
+# Cada casilla del tablero ocupa un solo byte: los 4 bits bajos guardan la
+# cantidad de minas adyacentes (0-8) y los bits altos las marcas de estado.
+MASCARA_NUMERO = 0x0F
+BIT_MINA = 0x10
+BIT_DESCUBIERTA = 0x20
+BIT_BANDERA = 0x40
+
+# Si es True, el primer click tambien deja sin minas las 8 casillas vecinas.
+PRIMER_CLICK_ZONA_LIBRE = False
+
+#### Tablero infinito ####
+
+# El tablero infinito se divide en bloques de TAMAÑO_BLOQUE x TAMAÑO_BLOQUE
+# casillas que se crean recien cuando se ven o se descubren.
+TAMAÑO_BLOQUE = 32
+# Fraccion de casillas con mina. Con densidades muy bajas las zonas vacias
+# pueden ser enormes; MAXIMO_DESCUBIERTAS_POR_CLICK corta cada jugada.
+DENSIDAD_MINAS_INFINITO = 0.16
+MAXIMO_DESCUBIERTAS_POR_CLICK = 100000
+# Bloques sin jugadas que se guardan a la vez; los que sobran se descartan
+# porque se pueden volver a generar desde la semilla.
+MAXIMO_BLOQUES_EN_MEMORIA = 512
+# Lado del tablero que ve la interfaz. El origen (0, 0) del tablero infinito
+# queda en el centro, asi que hay millones de casillas hacia cada lado.
+LADO_TABLERO_INFINITO = 1 << 24
+
+#### Solucionador ####
+
+# La enumeracion exacta solo se intenta en grupos de casillas de la frontera
+# de hasta este tamaño, y se abandona si prueba mas asignaciones que el maximo.
+MAXIMO_VARIABLES_ENUMERACION = 40
+MAXIMO_NODOS_ENUMERACION = 100000
+
+#### Tableros sin adivinar ####
+
+# Si es True las partidas usan tableros que se pueden ganar sin adivinar,
+# empezando por la casilla central, que ya aparece descubierta. En el tablero
+# personalizado (200x200 con 6000 minas) casi nunca se encuentra uno a tiempo,
+# asi que en la practica siempre termina siendo un tablero comun.
+TABLEROS_SIN_ADIVINAR = False
+# Tableros candidatos que se prueban como maximo antes de rendirse y usar uno comun.
+MAXIMO_INTENTOS_SIN_ADIVINAR = 2000
+# Segundos que se buscan candidatos como maximo, para que la partida empiece en
+# menos de un segundo aunque no haya una preparada. En 24x24 sirve uno de cada
+# diez candidatos y se prueban unos 170 por segundo, asi que alcanza de sobra.
+SEGUNDOS_MAXIMOS_SIN_ADIVINAR = 0.8
+# Cada cuantos segundos se revisa, mientras se espera a los procesos, si la
+# busqueda se cancelo o se le acabo el tiempo.
+INTERVALO_REVISION_SIN_ADIVINAR = 0.05
+# Procesos que prueban candidatos a la vez. None para usar todos los nucleos.
+PROCESOS_SIN_ADIVINAR = None
+# Segundos que se espera a que arranque cada proceso antes de rendirse y
+# probar los candidatos sin procesos.
+SEGUNDOS_INICIO_SIN_ADIVINAR = 10
 
+#### Partidas preparadas ####
 
+# Partidas que se generan de antemano, en segundo plano, para cada dificultad,
+# asi Jugar y Reiniciar empiezan sin esperar a que se arme el tablero.
+PREPARAR_PARTIDAS = True
+TAMAÑO_COLA_PARTIDAS = 2
+# Segundos que espera el hilo antes de volver a intentar cuando una partida
+# falla al generarse, para no quedarse reintentando sin parar.
+ESPERA_TRAS_ERROR_PARTIDAS = 1.0
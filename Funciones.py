@@ -1,107 +1,18 @@
-import os
 import pygame
-import random
+from collections import OrderedDict
 from Constantes import *
-
-
-def configurar_dificultad(dificultad: int) -> tuple:
-    """
-    Configura la dificultad del juego de Buscaminas.
-
-    Recibe:
-        dificultad (int): Un entero que representa el nivel de dificultad.
-                        0 para facil, 1 para medio, 2 para dificil.
-
-    Devuelve:
-        tuple: Una tupla que contiene tres enteros:
-            - filas (int): Numero de filas del tablero.
-            - columnas (int): Numero de columnas del tablero.
-            - minas (int): Numero de minas en el tablero.
-            
-    """
-    filas = 0
-    columnas = 0
-    minas = 0
-
-    if dificultad == 0:
-        filas, columnas, minas = (8, 8, 10)       
-    elif dificultad == 1:
-        filas, columnas, minas = (16, 16, 50)  
-    else:
-        filas, columnas, minas = (24, 24, 120)  
-
-    return (filas, columnas, minas)
-
-
-def inicializar_tablero(dificultad_actual: int) -> dict:
-    """
-    Inicializa el tablero del juego de Buscaminas.
-
-    Recibe:
-        dificultad_actual (int): El nivel de dificultad actual del juego.
-
-    Devuelve:
-        dict: Un diccionario que contiene las siguientes claves:
-            - matriz_minas: Matriz de booleanos que indica la ubicacion de las minas.
-                Cada celda contiene:
-                    - True si hay una mina.
-                    - False si no hay mina.
-            - matriz_numeros: Matriz de enteros que indica la cantidad de minas adyacentes a cada celda.
-                Cada celda contiene un número del 0 al 8.
-            - matriz_estado: Matriz de booleanos que indica si una celda fue descubierta o no.
-                Cada celda contiene:
-                    - True si la celda esta descubierta.
-                    - False si esta oculta.
-            - matriz_banderas: Matriz de booleanos que indica si una celda tiene una bandera colocada por el jugador.
-                Cada celda contiene:
-                    - True si hay una bandera.
-                    - False si no la hay.
-            - minas_totales (int): Numero total de minas generadas en el tablero.
-            - tiempo_inicio (int): Valor inicial del temporizador del juego (0 al comenzar).
-            - timer_activo (bool): Indica si el temporizador esta actualmente en funcionamiento.
-            - filas (int): Cantidad de filas del tablero.
-            - columnas (int): Cantidad de columnas del tablero.
-    """
-
-    filas, columnas, cantidad_minas = configurar_dificultad(dificultad_actual)
-    
-    matriz_minas = inicializar_matriz(filas, columnas, cantidad_minas)
-    matriz_numeros = generar_matriz_numeros(matriz_minas)
-    
-    matriz_estado = []
-    
-    for _ in range(filas):
-        fila = []
-        for _ in range(columnas):
-            fila.append(False)
-        matriz_estado.append(fila)
-    
-    matriz_banderas = []
-    
-    for _ in range(filas):
-        fila = []
-        for _ in range(columnas):
-            fila.append(False)
-        matriz_banderas.append(fila)
-    
-    return {
-        'matriz_minas': matriz_minas,
-        'matriz_numeros': matriz_numeros,
-        'matriz_estado': matriz_estado,
-        'matriz_banderas': matriz_banderas,
-        'minas_totales': cantidad_minas,
-        'tiempo_inicio': 0,
-        'timer_activo': False,
-        'filas': filas,
-        'columnas': columnas
-    }
+from Tablero import *
+from Motor import *
+from Puntajes import *
+from Recursos import *
 
 
 def mostrar_pantalla_menu_principal(indice: int, ventana, imagen_fondo, dificultad_actual: int) -> None:
     """
     Muestra la pantalla del menu principal del juego Buscaminas.
 
-    Dibuja el fondo, el titulo del juego y los botones principales del menu.
+    Dibuja el fondo escalado al tamaño de la ventana, el titulo del juego y los
+    botones principales del menu.
     Resalta el boton actualmente seleccionado segun el indice proporcionado.
 
     Recibe:
@@ -113,7 +24,7 @@ def mostrar_pantalla_menu_principal(indice: int, ventana, imagen_fondo, dificult
     Retorna:
         None
     """
-    ventana.blit(imagen_fondo, (0, 0))
+    ventana.blit(obtener_fondo(imagen_fondo, ventana), (0, 0))
     dibujar_titulo_centrado("BUSCAMINAS", 100, "grande")
     texto_dificultad = NOMBRES_DIFICULTAD[dificultad_actual]
     
@@ -128,7 +39,7 @@ def mostrar_pantalla_menu_principal(indice: int, ventana, imagen_fondo, dificult
         dibujar_boton_en_pantalla(botones[i][0], botones[i][1], indice == i)
 
 
-def mostrar_pantalla_juego(dificultad_actual: int, estado_juego: dict, banderas_colocadas: int,
+def mostrar_pantalla_juego(dificultad_actual: int, estado_juego: MotorTablero,
                            fuente_texto_boton: pygame.font.Font, imagen_bomba: pygame.Surface,
                            imagen_bandera: pygame.Surface, mostrar_todas_bombas: bool,
                            indice_hover_actual: int, ventana_juego: pygame.Surface) -> None:
@@ -140,15 +51,8 @@ def mostrar_pantalla_juego(dificultad_actual: int, estado_juego: dict, banderas_
     
     Recibe:
         dificultad_actual (int): El indice de la dificultad actual del juego.
-        estado_juego (dict): Diccionario con el estado del juego que contiene:
-            - 'timer_activo' (bool): Si el cronometro esta funcionando
-            - 'tiempo_transcurrido' (int): Tiempo transcurrido en segundos
-            - 'tiempo_inicio' (int): Momento del inicio del juego
-            - 'minas_totales' (int): Numero total de minas en el tablero
-            - 'matriz_numeros' (list): Matriz con los numeros del buscaminas
-            - 'matriz_estado' (list): Matriz con el estado de cada casilla
-            - 'matriz_banderas' (list): Matriz con las banderas colocadas
-        banderas_colocadas (int): Numero de banderas que el jugador ha colocado.
+        estado_juego (MotorTablero): Partida en curso, con el tablero, el cronometro
+                                     y las banderas colocadas.
         fuente_texto_boton (pygame.font.Font): Fuente para renderizar el texto.
         imagen_bomba (pygame.Surface): Imagen que representa una bomba.
         imagen_bandera (pygame.Surface): Imagen que representa una bandera.
@@ -161,41 +65,138 @@ def mostrar_pantalla_juego(dificultad_actual: int, estado_juego: dict, banderas_
     """
     ventana_juego.fill(COLOR_FONDO)
     
+    dibujar_titulo_centrado(f"Nivel {NOMBRES_DIFICULTAD[dificultad_actual]}", 50, "mediana")
+    
+    textos_informacion = calcular_textos_informacion(estado_juego)
+    dibujar_informacion_juego(ventana_juego, textos_informacion, fuente_texto_boton)
+    
+    dibujar_matriz_buscaminas(ventana_juego, estado_juego.tablero, fuente_texto_boton, imagen_bomba,
+                             imagen_bandera, mostrar_todas_bombas)
+    
+    dibujar_boton_en_pantalla(crear_boton('reiniciar', ventana_juego), "Reiniciar", indice_hover_actual == 1)
+    dibujar_boton_en_pantalla(crear_boton('volver', ventana_juego), "Volver", indice_hover_actual == 0)
+
+
+def calcular_textos_informacion(estado_juego: MotorTablero) -> tuple:
+    """
+    Arma los textos de informacion de la partida (tiempo, banderas y minas).
+
+    Recibe:
+        estado_juego (MotorTablero): Partida en curso.
+
+    Devuelve:
+        tuple: (texto_tiempo, texto_banderas, texto_minas). texto_tiempo es None
+               si la partida todavia no empezo.
+    """
+    texto_tiempo = None
+    
+    if estado_juego.inicio is not None:
+        tiempo_transcurrido = int(estado_juego.tiempo_transcurrido())
+        
+        minutos = tiempo_transcurrido // 60
+        segundos = tiempo_transcurrido % 60
+        texto_tiempo = f"Tiempo: {minutos:02d}:{segundos:02d}"
+    
+    banderas_colocadas = estado_juego.banderas_colocadas
+    minas_restantes = estado_juego.minas_restantes()
+    
+    if minas_restantes is None:
+        texto_minas = f"Descubiertas: {estado_juego.puntaje()}"
+    else:
+        texto_minas = f"Minas: {minas_restantes}"
+    
+    return (texto_tiempo, f"Banderas: {banderas_colocadas}", texto_minas)
+
+
+def dibujar_informacion_juego(ventana_juego: pygame.Surface, textos: tuple,
+                              fuente_texto_boton: pygame.font.Font) -> pygame.Rect:
+    """
+    Dibuja los textos de tiempo, banderas y minas a la derecha del tablero.
+
+    Primero pinta el fondo de la zona, asi se puede volver a dibujar sola
+    cuando cambia alguno de los textos.
+
+    Recibe:
+        ventana_juego (pygame.Surface): La ventana donde se dibuja.
+        textos (tuple): Textos devueltos por calcular_textos_informacion.
+        fuente_texto_boton (pygame.font.Font): Fuente para renderizar el texto.
+
+    Devuelve:
+        pygame.Rect: Zona de la ventana ocupada por la informacion.
+    """
     ancho_ventana = ventana_juego.get_width()
     alto_ventana = ventana_juego.get_height()
     
-    dibujar_titulo_centrado(f"Nivel {NOMBRES_DIFICULTAD[dificultad_actual]}", 50, "mediana")
-    
     pos_x_info = int(ancho_ventana * 0.8)  
     pos_y_inicial = int(alto_ventana * 0.45)  
     espaciado_vertical = fuente_texto_boton.get_height() + 5  
     
-    if estado_juego['timer_activo']:
-        estado_juego['tiempo_transcurrido'] = (pygame.time.get_ticks() - estado_juego['tiempo_inicio']) // 1000
-        
-        minutos = estado_juego['tiempo_transcurrido'] // 60
-        segundos = estado_juego['tiempo_transcurrido'] % 60
-        tiempo_formateado = f"{minutos:02d}:{segundos:02d}"
-        
-        texto_tiempo = fuente_texto_boton.render(f"Tiempo: {tiempo_formateado}", True, COLOR_TEXTO_NORMAL)
-        ventana_juego.blit(texto_tiempo, (pos_x_info, pos_y_inicial))
+    zona = pygame.Rect(pos_x_info, pos_y_inicial, ancho_ventana - pos_x_info, espaciado_vertical * 3)
+    ventana_juego.fill(COLOR_FONDO, zona)
     
-
-    texto_banderas = fuente_texto_boton.render(f"Banderas: {banderas_colocadas}", True, COLOR_TEXTO_NORMAL)
-    pos_y_banderas = pos_y_inicial + espaciado_vertical
-    ventana_juego.blit(texto_banderas, (pos_x_info, pos_y_banderas))
-
-    minas_restantes = estado_juego['minas_totales'] - banderas_colocadas
-    texto_minas = fuente_texto_boton.render(f"Minas: {minas_restantes}", True, COLOR_TEXTO_NORMAL)
-    pos_y_minas = pos_y_banderas + espaciado_vertical
-    ventana_juego.blit(texto_minas, (pos_x_info, pos_y_minas))
+    texto_tiempo, texto_banderas, texto_minas = textos
     
-    dibujar_matriz_buscaminas(ventana_juego, estado_juego['matriz_numeros'], estado_juego['matriz_estado'],
-                             estado_juego['matriz_banderas'], fuente_texto_boton, imagen_bomba, imagen_bandera,
-                             mostrar_todas_bombas)
+    if texto_tiempo is not None:
+        superficie_texto = renderizar_texto(fuente_texto_boton, texto_tiempo, COLOR_TEXTO_NORMAL)
+        ventana_juego.blit(superficie_texto, (pos_x_info, pos_y_inicial))
     
-    dibujar_boton_en_pantalla(crear_boton('reiniciar', ventana_juego), "Reiniciar", indice_hover_actual == 1)
-    dibujar_boton_en_pantalla(crear_boton('volver', ventana_juego), "Volver", indice_hover_actual == 0)
+    superficie_texto = renderizar_texto(fuente_texto_boton, texto_banderas, COLOR_TEXTO_NORMAL)
+    ventana_juego.blit(superficie_texto, (pos_x_info, pos_y_inicial + espaciado_vertical))
+    
+    superficie_texto = renderizar_texto(fuente_texto_boton, texto_minas, COLOR_TEXTO_NORMAL)
+    ventana_juego.blit(superficie_texto, (pos_x_info, pos_y_inicial + espaciado_vertical * 2))
+    
+    return zona
+
+
+# Pantalla de puntajes ya compuesta (fondo escalado + lista), junto con la
+# clave (tamaño, imagen, fuente y puntajes) con la que se armo.
+pantalla_puntajes_compuesta = {'clave': None, 'superficie': None}
+
+
+def componer_pantalla_puntajes(ventana_juego: pygame.Surface, imagen_fondo_puntajes: pygame.Surface,
+                               fuente_texto_boton: pygame.font.Font) -> pygame.Surface:
+    """
+    Devuelve el fondo y la lista de puntajes dibujados en una sola superficie.
+
+    La superficie se arma de nuevo solo si cambiaron el tamaño de la ventana,
+    la imagen, la fuente o los puntajes; el resto de las veces se reutiliza.
+
+    Recibe:
+        ventana_juego (pygame.Surface): Ventana del juego.
+        imagen_fondo_puntajes (pygame.Surface): La imagen de fondo para la pantalla de puntajes.
+        fuente_texto_boton (pygame.font.Font): Fuente para el texto de los puntajes.
+
+    Devuelve:
+        pygame.Surface: Superficie del tamaño de la ventana lista para copiar.
+    """
+    puntajes = leer_puntajes()
+    tamaño = ventana_juego.get_size()
+    clave = (tamaño, id(imagen_fondo_puntajes), id(fuente_texto_boton), tuple(puntajes))
+
+    if pantalla_puntajes_compuesta['clave'] != clave:
+        superficie = pygame.Surface(tamaño, 0, ventana_juego)
+        superficie.blit(obtener_fondo(imagen_fondo_puntajes, ventana_juego), (0, 0))
+        mostrar_lista_puntajes(superficie, fuente_texto_boton, puntajes)
+
+        pantalla_puntajes_compuesta['clave'] = clave
+        pantalla_puntajes_compuesta['superficie'] = superficie
+
+    return pantalla_puntajes_compuesta['superficie']
+
+
+def pantalla_puntajes_desactualizada() -> bool:
+    """
+    Indica si los puntajes cambiaron desde que se compuso la pantalla de
+    puntajes, por ejemplo porque otro proceso guardo uno. leer_puntajes revisa
+    los archivos como mucho cada INTERVALO_REVISION_PUNTAJES segundos.
+
+    Devuelve:
+        bool: True si hay que volver a dibujar la pantalla de puntajes.
+    """
+    clave = pantalla_puntajes_compuesta['clave']
+
+    return clave is not None and clave[3] != tuple(leer_puntajes())
 
 
 def mostrar_pantalla_puntajes(ventana_juego: pygame.Surface, imagen_fondo_puntajes: pygame.Surface,
@@ -205,7 +206,9 @@ def mostrar_pantalla_puntajes(ventana_juego: pygame.Surface, imagen_fondo_puntaj
     
     Dibuja el fondo de puntajes escalado al tamaño de la ventana, la lista de mejores 
     puntajes y el boton para volver al menu principal. Todos los elementos se adaptan
-    automáticamente a diferentes resoluciones de pantalla.
+    automáticamente a diferentes resoluciones de pantalla. El fondo y la lista se
+    copian ya compuestos (ver componer_pantalla_puntajes); solo el boton se dibuja
+    en cada llamada.
     
     Recibe:
         ventana_juego (pygame.Surface): La ventana/superficie donde se dibuja la pantalla.
@@ -216,13 +219,8 @@ def mostrar_pantalla_puntajes(ventana_juego: pygame.Surface, imagen_fondo_puntaj
     Devuelve:
         None
     """
-    ancho_ventana = ventana_juego.get_width()
-    alto_ventana = ventana_juego.get_height()
-    
-    imagen_fondo_escalada = pygame.transform.scale(imagen_fondo_puntajes, (ancho_ventana, alto_ventana))
-    ventana_juego.blit(imagen_fondo_escalada, (0, 0))
-    
-    mostrar_lista_puntajes(ventana=ventana_juego, fuente=fuente_texto_boton)
+    fondo = componer_pantalla_puntajes(ventana_juego, imagen_fondo_puntajes, fuente_texto_boton)
+    ventana_juego.blit(fondo, (0, 0))
     
     dibujar_boton_en_pantalla(crear_boton('volver', ventana_juego), "Volver", indice_hover_actual == 0)
 
@@ -232,21 +230,32 @@ def mostrar_pantalla_puntajes(ventana_juego: pygame.Surface, imagen_fondo_puntaj
 # ===============================================================================
 
 
-def crear_boton(tipo_de_valor: str, ventana: pygame.Surface, pos_x: int = None, pos_y: int = None) -> pygame.Rect:
+# Diseño de la ventana para su tamaño actual. Se recalcula solo cuando cambia
+# el tamaño de la ventana, y lo usan tanto el dibujo como la deteccion de clicks.
+diseño_actual = {}
+
+
+def calcular_diseño(ancho_ventana: int, alto_ventana: int) -> dict:
     """
-    Crea un rectangulo de boton con posicion y tamaño especificos segun el tipo.
-    
+    Calcula la posicion de todos los botones para un tamaño de ventana.
+
     Recibe:
-        tipo_de_valor (str): Tipo de boton a crear.
-        ventana (pygame.Surface): Superficie de la ventana donde se dibujara el boton.
-        pos_x (int, opcional): Posición X personalizada. Si no se proporciona, usa la predefinida.
-        pos_y (int, opcional): Posición Y personalizada. Si no se proporciona, usa la predefinida.
-    
+        ancho_ventana (int): Ancho de la ventana en pixeles.
+        alto_ventana (int): Alto de la ventana en pixeles.
+
     Devuelve:
-        pygame.Rect: Rectangulo que representa el boton con posicion y dimensiones.
+        dict: Un diccionario que contiene las siguientes claves:
+            - tamaño (tuple): (ancho_ventana, alto_ventana).
+            - ancho_boton (int): Ancho de todos los botones.
+            - alto_boton (int): Alto de todos los botones.
+            - botones (dict): pygame.Rect de cada boton por tipo ('jugar', 'dificultad',
+                'puntajes', 'salir', 'reiniciar', 'volver').
+            - botones_menu (list): Rects de los botones del menu principal en orden.
+            - vista_tablero (pygame.Rect): Zona de la ventana donde se muestra el
+                tablero cuando se recorre con la camara (entre los botones y la informacion).
+            - matrices (dict): Geometria del tablero por (filas, columnas), que
+                completa calcular_geometria_matriz a medida que se pide.
     """
-    ancho_ventana = ventana.get_width()
-    alto_ventana = ventana.get_height()
     ancho = int(ancho_ventana * 0.2)
     alto = int(alto_ventana * 0.07)
     x_centro = (ancho_ventana - ancho) // 2
@@ -260,13 +269,68 @@ def crear_boton(tipo_de_valor: str, ventana: pygame.Surface, pos_x: int = None,
         'volver':     (int(ancho_ventana * 0.02), int(alto_ventana * 0.55))
     }
     
+    botones = {}
+    
+    for tipo, (x, y) in posiciones.items():
+        botones[tipo] = pygame.Rect(x, y, ancho, alto)
+    
+    return {
+        'tamaño': (ancho_ventana, alto_ventana),
+        'ancho_boton': ancho,
+        'alto_boton': alto,
+        'botones': botones,
+        'botones_menu': [botones['jugar'], botones['dificultad'], botones['puntajes'], botones['salir']],
+        'vista_tablero': pygame.Rect(int(ancho_ventana * 0.24), 100,
+                                     int(ancho_ventana * 0.78) - int(ancho_ventana * 0.24), alto_ventana - 140),
+        'matrices': {}
+    }
+
+
+def obtener_diseño(ventana: pygame.Surface) -> dict:
+    """
+    Devuelve el diseño de la ventana, recalculandolo solo si cambio su tamaño.
+
+    Recibe:
+        ventana (pygame.Surface): Superficie de la ventana.
+
+    Devuelve:
+        dict: Diseño con el formato de calcular_diseño. Sus Rects se comparten
+              y no se deben modificar.
+    """
+    tamaño = ventana.get_size()
+    
+    if diseño_actual.get('tamaño') != tamaño:
+        diseño_actual.clear()
+        diseño_actual.update(calcular_diseño(tamaño[0], tamaño[1]))
+    
+    return diseño_actual
+
 
+def crear_boton(tipo_de_valor: str, ventana: pygame.Surface, pos_x: int = None, pos_y: int = None) -> pygame.Rect:
+    """
+    Crea un rectangulo de boton con posicion y tamaño especificos segun el tipo.
+    
+    Recibe:
+        tipo_de_valor (str): Tipo de boton a crear.
+        ventana (pygame.Surface): Superficie de la ventana donde se dibujara el boton.
+        pos_x (int, opcional): Posición X personalizada. Si no se proporciona, usa la predefinida.
+        pos_y (int, opcional): Posición Y personalizada. Si no se proporciona, usa la predefinida.
+    
+    Devuelve:
+        pygame.Rect: Rectangulo que representa el boton con posicion y dimensiones.
+                     Para los tipos predefinidos es el Rect del diseño, que no se debe modificar.
+    """
+    diseño = obtener_diseño(ventana)
+    
     if pos_x is not None and pos_y is not None:
-        x, y = pos_x, pos_y
+        boton = pygame.Rect(pos_x, pos_y, diseño['ancho_boton'], diseño['alto_boton'])
+    elif tipo_de_valor in diseño['botones']:
+        boton = diseño['botones'][tipo_de_valor]
     else:
-        x, y = posiciones.get(tipo_de_valor, (x_centro, int(alto_ventana * 0.5)))
+        x_centro = (ventana.get_width() - diseño['ancho_boton']) // 2
+        boton = pygame.Rect(x_centro, int(ventana.get_height() * 0.5), diseño['ancho_boton'], diseño['alto_boton'])
     
-    return pygame.Rect(x, y, ancho, alto)
+    return boton
 
 # ===============================================================================
 # DETECCION DE CLICKS Y HOVER
@@ -276,6 +340,9 @@ def calcular_posicion_matriz(pos: tuple[int, int], superficie: pygame.Surface, f
     """
     Convierte coordenadas de mouse en posicion de matriz del tablero de buscaminas.
     
+    Usa la misma geometria que el dibujo (ver calcular_geometria_matriz), asi que
+    si el tablero se muestra con la camara tiene en cuenta su posicion y zoom.
+    
     Recibe:
         pos (Tuple[int, int]): Coordenadas (x, y) del mouse en la ventana.
         superficie (pygame.Surface): Superficie donde se dibuja la matriz.
@@ -285,32 +352,13 @@ def calcular_posicion_matriz(pos: tuple[int, int], superficie: pygame.Surface, f
     Devuelve:
         Tuple[int, int]: Posicion (fila, columna) en la matriz.
         
-        Retorna (-1, -1) si el click esta fuera de la matriz.
+        Retorna (-1, -1) si el click esta fuera de la parte visible de la matriz.
     """
     x_mouse, y_mouse = pos
     
-    ancho_ventana = superficie.get_width()
-    alto_ventana = superficie.get_height()
-    
-    tamaño_casilla_preferido = 40
-    margen = 130
-    ancho_disponible = ancho_ventana - 2 * margen
-    alto_disponible = alto_ventana - 2 * margen
-    
-    tamaño_casilla = tamaño_casilla_preferido
-    
-    if columnas * tamaño_casilla > ancho_disponible:
-        tamaño_casilla = ancho_disponible // columnas
-    if filas * tamaño_casilla > alto_disponible:
-        tamaño_casilla = min(tamaño_casilla, alto_disponible // filas)
-    
-    ancho_total_matriz = columnas * tamaño_casilla
-    alto_total_matriz = filas * tamaño_casilla
-    x_inicial = (ancho_ventana - ancho_total_matriz) // 2
-    y_inicial = (alto_ventana - alto_total_matriz) // 2
+    x_inicial, y_inicial, tamaño_casilla = calcular_geometria_matriz(superficie, filas, columnas)
     
-    if (x_inicial <= x_mouse < x_inicial + ancho_total_matriz and
-        y_inicial <= y_mouse < y_inicial + alto_total_matriz):
+    if obtener_vista_tablero(superficie, filas, columnas).collidepoint(x_mouse, y_mouse):
         col = (x_mouse - x_inicial) // tamaño_casilla
         fila = (y_mouse - y_inicial) // tamaño_casilla
         resultado = (fila, col)
@@ -337,12 +385,7 @@ def procesar_click_en_menu_nuevo(posicion: tuple[int, int], ventana: pygame.Surf
             - -1: No se clickeo ningun boton
             
     """
-    tipos_de_valor = ['jugar', 'dificultad', 'puntajes', 'salir']
-    botones = []
-    
-    for tipo in tipos_de_valor:
-        boton = crear_boton(tipo, ventana)
-        botones.append(boton)
+    botones = obtener_diseño(ventana)['botones_menu']
     
     indice = -1
     
@@ -371,13 +414,7 @@ def detectar_hover_en_menu_nuevo(posicion: tuple[int, int], ventana: pygame.Surf
             - -1: No esta sobre ningún botón
             
     """
-    tipos_de_valor = ['jugar', 'dificultad', 'puntajes', 'salir']
-   
-    botones = []
-    
-    for tipo in tipos_de_valor:
-        boton = crear_boton(tipo, ventana)
-        botones.append(boton)
+    botones = obtener_diseño(ventana)['botones_menu']
     
     indice = -1
    
@@ -442,6 +479,133 @@ def detectar_hover_en_otras_pantallas(posicion: tuple[int, int], ventana: pygame
 # INTERFAZ
 # ===============================================================================
 
+# Fuentes ya creadas, por (nombre, tamaño, negrita), y textos ya renderizados,
+# por (fuente, texto, color), del menos al mas usado recientemente.
+fuentes_registradas = {}
+textos_renderizados = OrderedDict()
+estadisticas_textos = {'aciertos': 0, 'fallos': 0}
+
+
+def obtener_fuente(nombre: str, tamaño: int, negrita: bool = False) -> pygame.font.Font:
+    """
+    Devuelve una fuente del sistema creandola solo la primera vez que se pide.
+
+    pygame.font.SysFont busca en las carpetas de fuentes del sistema, por lo que
+    no conviene llamarla en cada cuadro.
+
+    Recibe:
+        nombre (str): Nombre de la fuente del sistema, o None para la fuente por defecto.
+        tamaño (int): Tamaño de la fuente.
+        negrita (bool, opcional): Si la fuente es negrita. Por defecto False.
+
+    Devuelve:
+        pygame.font.Font: La fuente pedida.
+    """
+    clave = (nombre, tamaño, negrita)
+    fuente = fuentes_registradas.get(clave)
+    
+    if fuente is None:
+        fuente = pygame.font.SysFont(nombre, tamaño, bold=negrita)
+        fuentes_registradas[clave] = fuente
+    
+    return fuente
+
+
+def renderizar_texto(fuente: pygame.font.Font, texto: str, color: tuple) -> pygame.Surface:
+    """
+    Renderiza un texto con antialiasing reutilizando la superficie si ya se renderizo antes.
+
+    Guarda como maximo MAXIMO_TEXTOS_EN_CACHE superficies; al llenarse descarta
+    la que hace mas tiempo que no se usa.
+
+    Recibe:
+        fuente (pygame.font.Font): Fuente con la que se renderiza.
+        texto (str): Texto a renderizar.
+        color (tuple): Color del texto.
+
+    Devuelve:
+        pygame.Surface: Superficie con el texto. No se debe modificar, porque se comparte.
+    """
+    clave = (fuente, texto, tuple(color))
+    superficie = textos_renderizados.get(clave)
+    
+    if superficie is not None:
+        textos_renderizados.move_to_end(clave)
+        estadisticas_textos['aciertos'] += 1
+    else:
+        superficie = fuente.render(texto, True, color)
+        textos_renderizados[clave] = superficie
+        estadisticas_textos['fallos'] += 1
+        if len(textos_renderizados) > MAXIMO_TEXTOS_EN_CACHE:
+            textos_renderizados.popitem(last=False)
+    
+    return superficie
+
+
+def obtener_estadisticas_textos() -> dict:
+    """
+    Devuelve los contadores de la cache de textos, para medir su efectividad.
+
+    Devuelve:
+        dict: Un diccionario con las claves:
+            - aciertos (int): Textos que se encontraron ya renderizados.
+            - fallos (int): Textos que hubo que renderizar.
+            - guardados (int): Textos guardados actualmente en la cache.
+            - fuentes (int): Fuentes creadas en el registro.
+    """
+    return {
+        'aciertos': estadisticas_textos['aciertos'],
+        'fallos': estadisticas_textos['fallos'],
+        'guardados': len(textos_renderizados),
+        'fuentes': len(fuentes_registradas)
+    }
+
+
+# Fondos ya escalados al tamaño de la ventana y convertidos al formato de la
+# pantalla, por (imagen, tamaño). Se descartan los que hace mas tiempo que no se usan.
+fondos_escalados = OrderedDict()
+
+
+def obtener_fondo(imagen: pygame.Surface, ventana: pygame.Surface) -> pygame.Surface:
+    """
+    Devuelve una imagen de fondo escalada al tamaño de la ventana y en el formato
+    de la pantalla, para que copiarla no requiera ninguna conversion.
+
+    La copia escalada se crea la primera vez que se pide para un tamaño (por
+    ejemplo despues de redimensionar la ventana) y se reutiliza despues. Se
+    guardan como maximo MAXIMO_FONDOS_EN_CACHE copias.
+
+    Recibe:
+        imagen (pygame.Surface): Imagen de fondo original.
+        ventana (pygame.Surface): Ventana donde se va a dibujar.
+
+    Devuelve:
+        pygame.Surface: Fondo del tamaño de la ventana. No se debe modificar, porque se comparte.
+    """
+    tamaño = ventana.get_size()
+    clave = (imagen, tamaño)
+    fondo = fondos_escalados.get(clave)
+
+    if fondo is not None:
+        fondos_escalados.move_to_end(clave)
+        return fondo
+
+    if imagen.get_size() == tamaño:
+        fondo = imagen
+    elif SUAVIZAR_FONDOS and imagen.get_bitsize() >= 24:
+        fondo = pygame.transform.smoothscale(imagen, tamaño)
+    else:
+        fondo = pygame.transform.scale(imagen, tamaño)
+
+    fondo = fondo.convert(ventana)
+    fondos_escalados[clave] = fondo
+
+    if len(fondos_escalados) > MAXIMO_FONDOS_EN_CACHE:
+        fondos_escalados.popitem(last=False)
+
+    return fondo
+
+
 def dibujar_boton_en_pantalla(rect: pygame.Rect, texto: str, hover: bool) -> None:
     """
     Dibuja un boton en la pantalla con el texto especificado.
@@ -463,8 +627,8 @@ def dibujar_boton_en_pantalla(rect: pygame.Rect, texto: str, hover: bool) -> Non
     pygame.draw.rect(pygame.display.get_surface(), color, rect)
     pygame.draw.rect(pygame.display.get_surface(), COLOR_TEXTO_NORMAL, rect, 2)
     
-    fuente = pygame.font.SysFont("Verdana", 25)
-    texto_surf = fuente.render(texto, True, COLOR_TEXTO_NORMAL)
+    fuente = obtener_fuente("Verdana", 25)
+    texto_surf = renderizar_texto(fuente, texto, COLOR_TEXTO_NORMAL)
     texto_rect = texto_surf.get_rect(center=rect.center)
     pygame.display.get_surface().blit(texto_surf, texto_rect)
 
@@ -491,15 +655,15 @@ def dibujar_titulo_centrado(texto: str, y: int, tipo_fuente: str) -> None:
 
     if tipo_fuente == "grande":
         tamaño_fuente = int(ancho_ventana * 0.06)
-        fuente = pygame.font.SysFont("Impact", tamaño_fuente)
+        fuente = obtener_fuente("Impact", tamaño_fuente)
     elif tipo_fuente == "mediana":
         tamaño_fuente = int(ancho_ventana * 0.04)
-        fuente = pygame.font.SysFont("Verdana", tamaño_fuente)
+        fuente = obtener_fuente("Verdana", tamaño_fuente)
     else:
         tamaño_fuente = int(ancho_ventana * 0.025)
-        fuente = pygame.font.SysFont("Verdana", tamaño_fuente)
+        fuente = obtener_fuente("Verdana", tamaño_fuente)
 
-    texto_surf = fuente.render(texto, True, COLOR_TITULO_PRINCIPAL)
+    texto_surf = renderizar_texto(fuente, texto, COLOR_TITULO_PRINCIPAL)
 
     desplazamiento_y = int(alto_ventana * 0.05)
     rect = texto_surf.get_rect(center=(ancho_ventana // 2, y + desplazamiento_y))
@@ -511,106 +675,32 @@ def dibujar_titulo_centrado(texto: str, y: int, tipo_fuente: str) -> None:
 # MATRIZ BUSCAMINAS
 # ===============================================================================
 
-def inicializar_matriz(filas: int, columnas: int, minas: int) -> list[list[str]]:
+def calcular_geometria_ajustada(superficie: pygame.Surface, filas: int, columnas: int) -> tuple[int, int, int]:
     """
-    Crea una matriz del buscaminas con minas distribuidas aleatoriamente.
-    
+    Calcula donde se dibuja el tablero entero y el tamaño de cada casilla.
+
+    Las casillas miden 40 pixeles salvo que el tablero no entre en la ventana
+    dejando un margen de 130 pixeles, en cuyo caso se achican. El resultado se
+    guarda en el diseño de la ventana, asi el dibujo y la deteccion de clicks
+    usan siempre la misma geometria y solo se calcula al cambiar el tamaño.
+
     Recibe:
+        superficie (pygame.Surface): Superficie donde se dibuja la matriz.
         filas (int): Numero de filas de la matriz.
         columnas (int): Numero de columnas de la matriz.
-        minas (int): Numero de minas a colocar en la matriz.
-        
-    Devuelve:
-        List[List[str]]: Matriz 2D donde 'X' representa una mina y '' representa casilla vacia.
-        
-    """
-    matriz = []
-   
-    for _ in range(filas):
-        fila = [''] * columnas
-        matriz.append(fila)
-    
-    cantidad = 0
-    
-    while cantidad < minas:
-        f = random.randint(0, filas - 1)
-        c = random.randint(0, columnas - 1)
-        if matriz[f][c] != 'X':
-            matriz[f][c] = 'X'
-            cantidad += 1
-    
-    return matriz
-
 
-def generar_matriz_numeros(matriz: list[list[str]]) -> list[list[any]]:
-    """
-    Genera una matriz con numeros que indican cuantas minas hay alrededor de cada casilla.
-    
-    Recibe:
-        matriz (List[List[str]]): Matriz original con minas ('X') y casillas vacías ('').
-        
     Devuelve:
-        List[List[Any]]: Matriz donde cada casilla contiene:
-            - 'X' si hay una mina
-            - int (0-8) indicando el numero de minas adyacentes
-            
+        Tuple[int, int, int]: (x_inicial, y_inicial, tamaño_casilla).
     """
-    filas, columnas = len(matriz), len(matriz[0])
-    numeros = []
+    matrices = obtener_diseño(superficie)['matrices']
+    geometria = matrices.get((filas, columnas))
     
-    for i in range(filas):
-        fila_numeros = []
-        for j in range(columnas):
-            if matriz[i][j] == 'X':
-                fila_numeros.append('X')
-            else:
-                cuenta = 0
-                vecinos = [
-                    (i-1, j-1), (i-1, j), (i-1, j+1),
-                    (i, j-1),             (i, j+1),
-                    (i+1, j-1), (i+1, j), (i+1, j+1)
-                ]
-                for ni, nj in vecinos:
-                    if ni < 0 or ni >= filas:
-                        continue
-                    if nj < 0 or nj >= columnas:
-                        continue
-                    if matriz[ni][nj] == 'X':
-                        cuenta += 1
-                fila_numeros.append(cuenta)
-        numeros.append(fila_numeros)
-  
-    return numeros
-
-
-def dibujar_matriz_buscaminas(superficie: pygame.Surface, numeros: list[list[any]], 
-                            estado: list[list[bool]], banderas: list[list[bool]], 
-                            fuente: pygame.font.Font, imagen_bomba: pygame.Surface, 
-                            imagen_bandera: pygame.Surface, mostrar_todas_bombas: bool = False) -> None:
-    """
-    Dibuja la matriz del buscaminas en la pantalla con todos sus elementos visuales.
+    if geometria is not None:
+        return geometria
     
-    Recibe:
-        superficie (pygame.Surface): Superficie donde dibujar la matriz.
-        numeros (List[List[Any]]): Matriz con numeros y minas ('X').
-        estado (List[List[bool]]): Matriz que indica que casillas estan descubiertas.
-        banderas (List[List[bool]]): Matriz que indica que casillas tienen banderas.
-        fuente (pygame.font.Font): Fuente para dibujar los numeros.
-        imagen_bomba (pygame.Surface): Imagen para mostrar las minas.
-        imagen_bandera (pygame.Surface): Imagen para mostrar las banderas.
-        mostrar_todas_bombas (bool, optional): Si True, muestra todas las minas. 
-                                             Por defecto False.
-                                             
-    Devuelve:
-        None
-        
-    """
     ancho_ventana = superficie.get_width()
     alto_ventana = superficie.get_height()
     
-    filas = len(numeros)
-    columnas = len(numeros[0])
-    
     tamaño_casilla_preferido = 40
     
     ancho_total_preferido = columnas * tamaño_casilla_preferido
@@ -637,102 +727,413 @@ def dibujar_matriz_buscaminas(superficie: pygame.Surface, numeros: list[list[any
     x_inicial = (ancho_ventana - ancho_total_matriz) // 2
     y_inicial = (alto_ventana - alto_total_matriz) // 2
     
-    for i in range(filas):
-        for j in range(columnas):
+    geometria = (x_inicial, y_inicial, tamaño_casilla)
+    matrices[(filas, columnas)] = geometria
+    
+    return geometria
 
-            x = x_inicial + (j * tamaño_casilla)
-            y = y_inicial + (i * tamaño_casilla)
-            
-            rect = pygame.Rect(x, y, tamaño_casilla, tamaño_casilla)
-            
-            if estado[i][j] or (mostrar_todas_bombas and numeros[i][j] == 'X'):
-                pygame.draw.rect(superficie, COLOR_CASILLA_DESCUBIERTA, rect)
-            else:
-                pygame.draw.rect(superficie, COLOR_CASILLA_OCULTA, rect)
-            
-            pygame.draw.rect(superficie, COLOR_CASILLA_BORDE, rect, 1)
-            
-            if estado[i][j] or (mostrar_todas_bombas and numeros[i][j] == 'X'):
-                valor = numeros[i][j]
-                if valor == 'X':
-                    if tamaño_casilla != tamaño_casilla_preferido:
-                        imagen_escalada = pygame.transform.scale(imagen_bomba, (tamaño_casilla - 4, tamaño_casilla - 4))
-                        superficie.blit(imagen_escalada, (x + 2, y + 2))
-                    else:
-                        superficie.blit(imagen_bomba, rect)
-                elif valor > 0:
-                    if tamaño_casilla != tamaño_casilla_preferido:
-                        tamaño_fuente = tamaño_casilla // 2
-                        fuente_escalada = pygame.font.Font(None, tamaño_fuente)
-                        texto = fuente_escalada.render(str(valor), True, (0, 0, 0))
-                    else:
-                        texto = fuente.render(str(valor), True, (0, 0, 0))
-                    superficie.blit(texto, texto.get_rect(center=rect.center))
-            else:
-                if banderas[i][j]:
-                    if tamaño_casilla != tamaño_casilla_preferido:
-                        imagen_escalada = pygame.transform.scale(imagen_bandera, (tamaño_casilla - 4, tamaño_casilla - 4))
-                        superficie.blit(imagen_escalada, (x + 2, y + 2))
-                    else:
-                        superficie.blit(imagen_bandera, rect)
 
+# Camara con la que se recorren los tableros que no entran en la ventana:
+# tablero al que corresponde, desplazamiento en pixeles de la esquina de la
+# vista respecto de la esquina del tablero y tamaño de casilla (zoom).
+camara_tablero = {'tablero': None, 'x': 0, 'y': 0, 'tamaño': TAMAÑO_CASILLA_CAMARA}
 
 
-def descubrir_celda(matriz_estado: list[list[bool]], matriz_numeros: list[list[any]], 
-                   fila: int, columna: int) -> None:
+def usa_camara(superficie: pygame.Surface, filas: int, columnas: int) -> bool:
     """
-    Descubre una celda y recursivamente descubre celdas vacias adyacentes.
-    
+    Indica si el tablero se muestra con la camara, porque para que entre entero
+    las casillas quedarian mas chicas que TAMAÑO_MINIMO_CASILLA.
+
     Recibe:
-        matriz_estado (List[List[bool]]): Matriz que indica que celdas estan descubiertas.
-        matriz_numeros (List[List[Any]]): Matriz con numeros y minas.
-        fila (int): Fila de la celda a descubrir.
-        columna (int): Columna de la celda a descubrir.
-        
+        superficie (pygame.Surface): Superficie donde se dibuja la matriz.
+        filas (int): Numero de filas de la matriz.
+        columnas (int): Numero de columnas de la matriz.
+
+    Devuelve:
+        bool: True si el tablero se recorre con la camara.
+    """
+    return calcular_geometria_ajustada(superficie, filas, columnas)[2] < TAMAÑO_MINIMO_CASILLA
+
+
+def reiniciar_camara() -> None:
+    """
+    Hace que la camara vuelva a centrarse con el zoom inicial la proxima vez que
+    se dibuje un tablero (por ejemplo al empezar una partida).
+
     Devuelve:
         None
-        
     """
-    if matriz_estado[fila][columna] or matriz_numeros[fila][columna] == 'X':
-        pass  
+    camara_tablero['tablero'] = None
+
+
+def limitar_camara(vista: pygame.Rect, filas: int, columnas: int) -> None:
+    """
+    Evita que la camara se salga del tablero. En los ejes en que el tablero es
+    mas chico que la vista, lo centra.
+
+    Recibe:
+        vista (pygame.Rect): Zona de la ventana donde se muestra el tablero.
+        filas (int): Numero de filas de la matriz.
+        columnas (int): Numero de columnas de la matriz.
+
+    Devuelve:
+        None
+    """
+    tamaño_casilla = camara_tablero['tamaño']
+    
+    for eje, lado_vista, cantidad in (('x', vista.width, columnas), ('y', vista.height, filas)):
+        lado_tablero = cantidad * tamaño_casilla
+        if lado_tablero <= lado_vista:
+            camara_tablero[eje] = -((lado_vista - lado_tablero) // 2)
+        else:
+            camara_tablero[eje] = min(max(camara_tablero[eje], 0), lado_tablero - lado_vista)
+
+
+def obtener_camara(superficie: pygame.Surface, filas: int, columnas: int) -> dict:
+    """
+    Devuelve la camara del tablero, centrandola si es la primera vez que se usa
+    con este tablero y ajustandola si la ventana cambio de tamaño.
+
+    Recibe:
+        superficie (pygame.Surface): Superficie donde se dibuja la matriz.
+        filas (int): Numero de filas de la matriz.
+        columnas (int): Numero de columnas de la matriz.
+
+    Devuelve:
+        dict: camara_tablero.
+    """
+    vista = obtener_diseño(superficie)['vista_tablero']
+    
+    if camara_tablero['tablero'] != (filas, columnas):
+        camara_tablero['tablero'] = (filas, columnas)
+        camara_tablero['tamaño'] = TAMAÑO_CASILLA_CAMARA
+        camara_tablero['x'] = (columnas * TAMAÑO_CASILLA_CAMARA - vista.width) // 2
+        camara_tablero['y'] = (filas * TAMAÑO_CASILLA_CAMARA - vista.height) // 2
+    
+    limitar_camara(vista, filas, columnas)
+    
+    return camara_tablero
+
+
+def calcular_geometria_matriz(superficie: pygame.Surface, filas: int, columnas: int) -> tuple[int, int, int]:
+    """
+    Calcula donde se dibuja el tablero y el tamaño de cada casilla.
+
+    Si el tablero entra en la ventana es la geometria de calcular_geometria_ajustada.
+    Si no, depende de la camara: la esquina del tablero puede quedar fuera de la
+    ventana y solo se ve la parte que cae en la vista (ver obtener_vista_tablero).
+    El dibujo y la deteccion de clicks usan siempre esta funcion.
+
+    Recibe:
+        superficie (pygame.Surface): Superficie donde se dibuja la matriz.
+        filas (int): Numero de filas de la matriz.
+        columnas (int): Numero de columnas de la matriz.
+
+    Devuelve:
+        Tuple[int, int, int]: (x_inicial, y_inicial, tamaño_casilla).
+    """
+    if not usa_camara(superficie, filas, columnas):
+        return calcular_geometria_ajustada(superficie, filas, columnas)
+    
+    vista = obtener_diseño(superficie)['vista_tablero']
+    camara = obtener_camara(superficie, filas, columnas)
+    
+    return (vista.x - camara['x'], vista.y - camara['y'], camara['tamaño'])
+
+
+def obtener_vista_tablero(superficie: pygame.Surface, filas: int, columnas: int) -> pygame.Rect:
+    """
+    Devuelve la zona de la ventana donde se ve el tablero.
+
+    Recibe:
+        superficie (pygame.Surface): Superficie donde se dibuja la matriz.
+        filas (int): Numero de filas de la matriz.
+        columnas (int): Numero de columnas de la matriz.
+
+    Devuelve:
+        pygame.Rect: El tablero entero si entra en la ventana, o la parte que
+                     muestra la camara si no.
+    """
+    x_inicial, y_inicial, tamaño_casilla = calcular_geometria_matriz(superficie, filas, columnas)
+    area = pygame.Rect(x_inicial, y_inicial, columnas * tamaño_casilla, filas * tamaño_casilla)
+    
+    if usa_camara(superficie, filas, columnas):
+        area = area.clip(obtener_diseño(superficie)['vista_tablero'])
+    
+    return area
+
+
+def calcular_rango_visible(superficie: pygame.Surface, filas: int, columnas: int) -> tuple[int, int, int, int]:
+    """
+    Calcula que filas y columnas del tablero se ven, aunque sea en parte.
+
+    Recibe:
+        superficie (pygame.Surface): Superficie donde se dibuja la matriz.
+        filas (int): Numero de filas de la matriz.
+        columnas (int): Numero de columnas de la matriz.
+
+    Devuelve:
+        Tuple[int, int, int, int]: (fila_desde, fila_hasta, columna_desde, columna_hasta),
+                                   con los limites superiores excluidos.
+    """
+    x_inicial, y_inicial, tamaño_casilla = calcular_geometria_matriz(superficie, filas, columnas)
+    area = obtener_vista_tablero(superficie, filas, columnas)
+    
+    fila_desde = (area.top - y_inicial) // tamaño_casilla
+    fila_hasta = min(filas, (area.bottom - y_inicial + tamaño_casilla - 1) // tamaño_casilla)
+    columna_desde = (area.left - x_inicial) // tamaño_casilla
+    columna_hasta = min(columnas, (area.right - x_inicial + tamaño_casilla - 1) // tamaño_casilla)
+    
+    return (fila_desde, fila_hasta, columna_desde, columna_hasta)
+
+
+def mover_camara(superficie: pygame.Surface, filas: int, columnas: int, dx: int, dy: int) -> bool:
+    """
+    Desplaza la camara del tablero.
+
+    Recibe:
+        superficie (pygame.Surface): Superficie donde se dibuja la matriz.
+        filas (int): Numero de filas de la matriz.
+        columnas (int): Numero de columnas de la matriz.
+        dx (int): Pixeles a mover hacia la derecha (negativo para la izquierda).
+        dy (int): Pixeles a mover hacia abajo (negativo para arriba).
+
+    Devuelve:
+        bool: True si la vista cambio. False si el tablero entra en la ventana
+              o la camara ya estaba en el borde.
+    """
+    if not usa_camara(superficie, filas, columnas):
+        return False
+    
+    camara = obtener_camara(superficie, filas, columnas)
+    anterior = (camara['x'], camara['y'])
+    
+    camara['x'] += dx
+    camara['y'] += dy
+    limitar_camara(obtener_diseño(superficie)['vista_tablero'], filas, columnas)
+    
+    return (camara['x'], camara['y']) != anterior
+
+
+def hacer_zoom_camara(superficie: pygame.Surface, filas: int, columnas: int,
+                      posicion: tuple[int, int], pasos: int) -> bool:
+    """
+    Acerca o aleja la camara manteniendo quieto el punto del tablero que esta
+    debajo de posicion.
+
+    Recibe:
+        superficie (pygame.Surface): Superficie donde se dibuja la matriz.
+        filas (int): Numero de filas de la matriz.
+        columnas (int): Numero de columnas de la matriz.
+        posicion (Tuple[int, int]): Punto de la ventana que queda fijo (el mouse).
+        pasos (int): Pasos de zoom; positivo acerca y negativo aleja.
+
+    Devuelve:
+        bool: True si la vista cambio.
+    """
+    if not usa_camara(superficie, filas, columnas) or pasos == 0:
+        return False
+    
+    camara = obtener_camara(superficie, filas, columnas)
+    vista = obtener_diseño(superficie)['vista_tablero']
+    tamaño_anterior = camara['tamaño']
+    tamaño_nuevo = tamaño_anterior
+    
+    for _ in range(abs(pasos)):
+        if pasos > 0:
+            tamaño_nuevo = tamaño_nuevo * 5 // 4 + 1
+        else:
+            tamaño_nuevo = tamaño_nuevo * 4 // 5
+    tamaño_nuevo = min(max(tamaño_nuevo, ZOOM_MINIMO), ZOOM_MAXIMO)
+    
+    if tamaño_nuevo == tamaño_anterior:
+        return False
+    
+    if not vista.collidepoint(posicion):
+        posicion = vista.center
+    x_vista = posicion[0] - vista.x
+    y_vista = posicion[1] - vista.y
+    
+    camara['x'] = (camara['x'] + x_vista) * tamaño_nuevo // tamaño_anterior - x_vista
+    camara['y'] = (camara['y'] + y_vista) * tamaño_nuevo // tamaño_anterior - y_vista
+    camara['tamaño'] = tamaño_nuevo
+    limitar_camara(vista, filas, columnas)
+    
+    return True
+
+
+# Casillas ya dibujadas para el ultimo tamaño de casilla usado. Se vuelven
+# a construir solo cuando cambia el tamaño (por ejemplo al redimensionar).
+casillas_dibujadas = {}
+
+
+def construir_casillas(tamaño_casilla: int, fuente: pygame.font.Font, imagen_bomba: pygame.Surface,
+                       imagen_bandera: pygame.Surface) -> dict:
+    """
+    Dibuja una vez todas las variantes posibles de una casilla para un tamaño dado.
+
+    Recibe:
+        tamaño_casilla (int): Lado de la casilla en pixeles.
+        fuente (pygame.font.Font): Fuente para los numeros cuando la casilla mide 40 pixeles.
+        imagen_bomba (pygame.Surface): Imagen para mostrar las minas.
+        imagen_bandera (pygame.Surface): Imagen para mostrar las banderas.
+
+    Devuelve:
+        dict: Un diccionario que contiene las siguientes claves:
+            - oculta (pygame.Surface): Casilla oculta.
+            - descubierta (pygame.Surface): Casilla descubierta sin minas alrededor.
+            - numeros (list): Casillas descubiertas con los numeros 0 al 8 (indice = numero).
+            - bomba (pygame.Surface): Mina mostrada al terminar la partida.
+            - bandera (pygame.Surface): Casilla oculta con bandera.
+            - explotada (pygame.Surface): Mina que descubrio el jugador.
+    """
+    tamaño_casilla_preferido = 40
+    rect = pygame.Rect(0, 0, tamaño_casilla, tamaño_casilla)
+    lado_imagen = max(tamaño_casilla - 4, 1)
+    
+    if tamaño_casilla != tamaño_casilla_preferido:
+        bomba = obtener_variante(imagen_bomba, (lado_imagen, lado_imagen))
+        bandera = obtener_variante(imagen_bandera, (lado_imagen, lado_imagen))
+        posicion_imagen = (2, 2)
+        fuente_numeros = pygame.font.Font(None, tamaño_casilla // 2)
     else:
-        matriz_estado[fila][columna] = True
+        bomba = obtener_variante(imagen_bomba, (tamaño_casilla, tamaño_casilla))
+        bandera = obtener_variante(imagen_bandera, (tamaño_casilla, tamaño_casilla))
+        posicion_imagen = (0, 0)
+        fuente_numeros = fuente
+    
+    def casilla_base(color: tuple) -> pygame.Surface:
+        casilla = pygame.Surface((tamaño_casilla, tamaño_casilla))
+        if pygame.display.get_surface() is not None:
+            casilla = casilla.convert()
+        casilla.fill(color)
+        pygame.draw.rect(casilla, COLOR_CASILLA_BORDE, rect, 1)
+        return casilla
+    
+    descubierta = casilla_base(COLOR_CASILLA_DESCUBIERTA)
+    numeros = [descubierta]
+    
+    for valor in range(1, 9):
+        casilla = casilla_base(COLOR_CASILLA_DESCUBIERTA)
+        texto = fuente_numeros.render(str(valor), True, (0, 0, 0))
+        casilla.blit(texto, texto.get_rect(center=rect.center))
+        numeros.append(casilla)
+    
+    casilla_bomba = casilla_base(COLOR_CASILLA_DESCUBIERTA)
+    casilla_bomba.blit(bomba, posicion_imagen)
+    
+    casilla_explotada = casilla_base(COLOR_CASILLA_EXPLOTADA)
+    casilla_explotada.blit(bomba, posicion_imagen)
+    
+    casilla_bandera = casilla_base(COLOR_CASILLA_OCULTA)
+    casilla_bandera.blit(bandera, posicion_imagen)
+    
+    return {
+        'oculta': casilla_base(COLOR_CASILLA_OCULTA),
+        'descubierta': descubierta,
+        'numeros': numeros,
+        'bomba': casilla_bomba,
+        'bandera': casilla_bandera,
+        'explotada': casilla_explotada
+    }
 
-        if matriz_numeros[fila][columna] == 0:
-            vecinos = [
-                (fila - 1, columna - 1), (fila - 1, columna), (fila - 1, columna + 1),
-                (fila, columna - 1),                            (fila, columna + 1),
-                (fila + 1, columna - 1), (fila + 1, columna), (fila + 1, columna + 1)
-            ]
-            for ni, nj in vecinos:
-                if ni < 0 or ni >= len(matriz_estado):
-                    continue
-                if nj < 0 or nj >= len(matriz_estado[0]):
-                    continue
-                descubrir_celda(matriz_estado, matriz_numeros, ni, nj)
 
+def obtener_casillas(tamaño_casilla: int, fuente: pygame.font.Font, imagen_bomba: pygame.Surface,
+                     imagen_bandera: pygame.Surface) -> dict:
+    """
+    Devuelve las casillas dibujadas para el tamaño pedido, construyendolas
+    solo si cambio el tamaño, la fuente o alguna imagen desde la ultima vez.
 
-def verificar_victoria(matriz_estado: list[list[bool]], matriz_minas: list[list[str]]) -> bool:
+    Recibe:
+        tamaño_casilla (int): Lado de la casilla en pixeles.
+        fuente (pygame.font.Font): Fuente para los numeros.
+        imagen_bomba (pygame.Surface): Imagen para mostrar las minas.
+        imagen_bandera (pygame.Surface): Imagen para mostrar las banderas.
+
+    Devuelve:
+        dict: Casillas con el formato de construir_casillas.
+    """
+    clave = (tamaño_casilla, id(fuente), id(imagen_bomba), id(imagen_bandera))
+    
+    if casillas_dibujadas.get('clave') != clave:
+        casillas_dibujadas['clave'] = clave
+        casillas_dibujadas['casillas'] = construir_casillas(tamaño_casilla, fuente, imagen_bomba, imagen_bandera)
+    
+    return casillas_dibujadas['casillas']
+
+
+def dibujar_matriz_buscaminas(superficie: pygame.Surface, tablero: dict,
+                            fuente: pygame.font.Font, imagen_bomba: pygame.Surface, 
+                            imagen_bandera: pygame.Surface, mostrar_todas_bombas: bool = False) -> None:
     """
-    Verifica si el jugador ha ganado el juego.
+    Dibuja la matriz del buscaminas en la pantalla con todos sus elementos visuales.
+    
+    Solo recorre las casillas visibles (ver calcular_rango_visible), asi que con
+    la camara el costo depende del tamaño de la ventana y no del tablero.
     
     Recibe:
-        matriz_estado (List[List[bool]]): Matriz que indica que celdas estan descubiertas.
-        matriz_minas (List[List[str]]): Matriz original con minas.
+        superficie (pygame.Surface): Superficie donde dibujar la matriz.
+        tablero (dict): Tablero con minas, numeros, casillas descubiertas y banderas.
+        fuente (pygame.font.Font): Fuente para dibujar los numeros.
+        imagen_bomba (pygame.Surface): Imagen para mostrar las minas.
+        imagen_bandera (pygame.Surface): Imagen para mostrar las banderas.
+        mostrar_todas_bombas (bool, optional): Si True, muestra todas las minas. 
+                                             Por defecto False.
+                                             
+    Devuelve:
+        None
         
+    """
+    filas = tablero['filas']
+    columnas = tablero['columnas']
+    celdas = tablero['celdas']
+    
+    x_inicial, y_inicial, tamaño_casilla = calcular_geometria_matriz(superficie, filas, columnas)
+    fila_desde, fila_hasta, columna_desde, columna_hasta = calcular_rango_visible(superficie, filas, columnas)
+    casillas = obtener_casillas(tamaño_casilla, fuente, imagen_bomba, imagen_bandera)
+    
+    recorte_anterior = superficie.get_clip()
+    superficie.set_clip(obtener_vista_tablero(superficie, filas, columnas).clip(recorte_anterior))
+    
+    for i in range(fila_desde, fila_hasta):
+        base = i * columnas
+        y = y_inicial + (i * tamaño_casilla)
+        for j in range(columna_desde, columna_hasta):
+            x = x_inicial + (j * tamaño_casilla)
+            dibujar_celda(superficie, celdas[base + j], (x, y), casillas, mostrar_todas_bombas)
+    
+    superficie.set_clip(recorte_anterior)
+
+
+def dibujar_celda(superficie: pygame.Surface, celda: int, posicion: tuple[int, int], casillas: dict,
+                  mostrar_todas_bombas: bool = False) -> None:
+    """
+    Dibuja una sola casilla del tablero copiando la casilla ya dibujada que le corresponde.
+    
+    Recibe:
+        superficie (pygame.Surface): Superficie donde dibujar la casilla.
+        celda (int): Byte de la casilla tomado de tablero['celdas'].
+        posicion (Tuple[int, int]): Esquina superior izquierda de la casilla en la superficie.
+        casillas (dict): Casillas devueltas por obtener_casillas.
+        mostrar_todas_bombas (bool, optional): Si True, muestra la mina aunque
+                                             la casilla este oculta.
+    
     Devuelve:
-        bool: True si el jugador gano (todas las celdas sin minas estan descubiertas),
-              False en caso contrario.
-              
+        None
     """
-    victoria = True
-   
-    for i in range(len(matriz_estado)):
-        for j in range(len(matriz_estado[0])):
-            if not matriz_estado[i][j] and matriz_minas[i][j] != 'X':    
-                victoria = False
-   
-    return victoria
+    if celda & BIT_DESCUBIERTA:
+        if celda & BIT_MINA:
+            casilla = casillas['explotada']
+        else:
+            casilla = casillas['numeros'][celda & MASCARA_NUMERO]
+    elif mostrar_todas_bombas and celda & BIT_MINA:
+        casilla = casillas['bomba']
+    elif celda & BIT_BANDERA:
+        casilla = casillas['bandera']
+    else:
+        casilla = casillas['oculta']
+    
+    superficie.blit(casilla, posicion)
 
 
 def pedir_nombre(ventana: pygame.Surface, victoria: bool) -> str:
@@ -748,14 +1149,14 @@ def pedir_nombre(ventana: pygame.Surface, victoria: bool) -> str:
                       El nombre esta limitado a 15 caracteres.
                       
     """
-    font = pygame.font.SysFont(None, 40)
+    font = obtener_fuente(None, 40)
     nombre = ""
     activo = True
     color = (0, 0 ,0)
 
 
     while activo:
-        for event in pygame.event.get():
+        for event in esperar_eventos(ESPERA_INACTIVA_MS):
             if event.type == pygame.QUIT:
                 return None
             elif event.type == pygame.KEYDOWN:
@@ -785,12 +1186,12 @@ def pedir_nombre(ventana: pygame.Surface, victoria: bool) -> str:
             ventana.fill(fondo_color)
 
             mensaje = "GANASTE - Ingrese su nombre y presione Enter:"
-            texto = font.render(mensaje, True, (0, 0, 0))
+            texto = renderizar_texto(font, mensaje, (0, 0, 0))
             texto_rect = texto.get_rect(center=(ancho // 2, input_rect.y - 25))
             ventana.blit(texto, texto_rect)
 
             pygame.draw.rect(ventana, color, input_rect, 2)
-            texto_nombre = font.render(nombre, True, (0, 0, 0))
+            texto_nombre = renderizar_texto(font, nombre, (0, 0, 0))
             ventana.blit(texto_nombre, (input_rect.x + 5, input_rect.y + 5))
 
             pygame.display.flip()
@@ -800,12 +1201,12 @@ def pedir_nombre(ventana: pygame.Surface, victoria: bool) -> str:
             ventana.fill(fondo_color)
 
             mensaje = "PERDISTE - Ingrese su nombre y presione Enter:"
-            texto = font.render(mensaje, True, (0, 0, 0))
+            texto = renderizar_texto(font, mensaje, (0, 0, 0))
             texto_rect = texto.get_rect(center=(ancho // 2, input_rect.y - 25))
             ventana.blit(texto, texto_rect)
 
             pygame.draw.rect(ventana, color, input_rect, 2)
-            texto_nombre = font.render(nombre, True, (0, 0, 0))
+            texto_nombre = renderizar_texto(font, nombre, (0, 0, 0))
             ventana.blit(texto_nombre, (input_rect.x + 5, input_rect.y + 5))
             
             pygame.display.flip()
@@ -813,128 +1214,249 @@ def pedir_nombre(ventana: pygame.Surface, victoria: bool) -> str:
             
     return nombre
 
-def mover_bomba(matriz_minas: list[list[str]], fila_bomba: int, col_bomba: int) -> tuple[list[list[str]], list[list[any]]]:
+# ===============================================================================
+# EVENTOS Y RITMO DE CUADROS
+# ===============================================================================
+
+def calcular_espera_eventos(pantalla_actual: str, estado_juego: MotorTablero) -> int:
     """
-    Mueve una mina de su posicion actual a una nueva posicion aleatoria.
-    
+    Calcula cuanto puede esperar el loop principal por un evento sin que la
+    pantalla quede desactualizada.
+
+    Lo unico que cambia sin que haya eventos es el cronometro de la partida,
+    que avanza una vez por segundo, y los puntajes que guarde otro proceso,
+    que se revisan al despertar (ver pantalla_puntajes_desactualizada).
+
     Recibe:
-        matriz_minas (List[List[str]]): Matriz con las minas.
-        fila_bomba (int): Fila donde esta la mina a mover.
-        col_bomba (int): Columna donde esta la mina a mover.
-        
+        pantalla_actual (str): Pantalla que se esta mostrando ("menu", "juego" o "puntajes").
+        estado_juego (MotorTablero): Partida en curso, o None si no hay partida.
+
     Devuelve:
-        Tuple[List[List[str]], List[List[Any]]]: Tupla con:
-            - Matriz de minas actualizada
-            - Matriz de numeros recalculada
-            
+        int: Milisegundos hasta el proximo cambio del cronometro, o ESPERA_INACTIVA_MS
+             si no hay nada que se actualice solo.
     """
-    filas = len(matriz_minas)
-    columnas = len(matriz_minas[0])
+    espera = ESPERA_INACTIVA_MS
     
-    matriz_minas[fila_bomba][col_bomba] = ''
+    if pantalla_actual == "juego" and estado_juego is not None and estado_juego.cronometro_activo():
+        transcurrido = int(estado_juego.tiempo_transcurrido() * 1000)
+        espera = 1000 - transcurrido % 1000
     
-    while True:
-        f = random.randint(0, filas - 1)
-        c = random.randint(0, columnas - 1)
-        if matriz_minas[f][c] != 'X' and (f != fila_bomba or c != col_bomba):  
-            matriz_minas[f][c] = 'X'
-            break
+    return espera
+
+
+def esperar_eventos(espera_ms: int) -> list:
+    """
+    Devuelve los eventos pendientes, esperando hasta espera_ms a que llegue alguno
+    si no hay ninguno. Mientras espera el proceso no usa CPU.
+
+    Si MODO_INACTIVO es False o espera_ms no es positivo no espera y se comporta
+    como pygame.event.get().
+
+    Recibe:
+        espera_ms (int): Tiempo maximo de espera en milisegundos.
+
+    Devuelve:
+        list: Lista de eventos de pygame, vacia si se cumplio la espera sin eventos.
+    """
+    if not MODO_INACTIVO or espera_ms <= 0:
+        return pygame.event.get()
     
-    matriz_numeros = generar_matriz_numeros(matriz_minas)
+    primero = pygame.event.wait(espera_ms)
     
-    return (matriz_minas, matriz_numeros)
+    if primero.type == pygame.NOEVENT:
+        return []
+    
+    return [primero] + pygame.event.get()
 
 
 # ===============================================================================
-# PUNTAJES
+# REDIBUJADO INCREMENTAL
 # ===============================================================================
 
-def calcular_puntaje(nivel: int, tiempo: int) -> int:
+def crear_estado_redibujado() -> dict:
     """
-    Calcula el puntaje basado en el nivel de dificultad y el tiempo transcurrido.
-    A mayor tiempo, menor puntaje.
-    
+    Crea el estado que recuerda que partes de la pantalla cambiaron desde el ultimo cuadro.
+
+    Devuelve:
+        dict: Un diccionario que contiene las siguientes claves:
+            - completo (bool): Si hay que volver a dibujar toda la pantalla.
+            - tamaño (tuple): Tamaño de la ventana en el ultimo repintado completo.
+            - celdas (set): Posiciones (fila, columna) del tablero a volver a dibujar.
+            - informacion (tuple): Ultimos textos de tiempo, banderas y minas dibujados.
+            - hover (int): Ultimo indice de boton resaltado dibujado.
+            - mostrar_todas_bombas (bool): Si el ultimo tablero dibujado mostraba las minas.
+    """
+    return {
+        'completo': True,
+        'tamaño': None,
+        'celdas': set(),
+        'informacion': None,
+        'hover': None,
+        'mostrar_todas_bombas': False
+    }
+
+
+def marcar_repintado_completo(estado_redibujado: dict) -> None:
+    """
+    Pide que el proximo cuadro vuelva a dibujar toda la pantalla
+    (cambio de pantalla, ventana redimensionada o expuesta, nueva partida).
+
     Recibe:
-        nivel (int): Nivel de dificultad:
-            - 0: Facil
-            - 1: Medio  
-            - 2: Dificil
-        tiempo (int): Tiempo transcurrido en segundos.
-        
+        estado_redibujado (dict): Estado creado con crear_estado_redibujado.
+
     Devuelve:
-        int: Puntaje calculado segun la dificultad y tiempo (mayor tiempo = menor puntaje).
-        
+        None
     """
-   
-    puntos_base = 0
-    
-    if nivel == 0:    
-        puntos_base = 1000
-    elif nivel == 1:   
-        puntos_base = 2000
-    elif nivel == 2:    
-        puntos_base = 3000
-    
-   
-    if tiempo <= 0:
-        tiempo = 1
-    
-    puntaje = puntos_base // tiempo
-    
-    if puntaje < 1:
-        puntaje = 1
-    
-    return puntaje
+    estado_redibujado['completo'] = True
 
-def guardar_puntaje(nombre: str, puntaje: int, tiempo: int) -> None:
+
+def marcar_celdas_sucias(estado_redibujado: dict, posiciones: list[tuple[int, int]]) -> None:
     """
-    Guarda un puntaje en el archivo CSV y mantiene solo los mejores 10.
-    
+    Agrega casillas del tablero a la lista de casillas a volver a dibujar.
+
     Recibe:
-        nombre (str): Nombre del jugador.
-        puntaje (int): Puntaje obtenido.
-        tiempo (int): Tiempo transcurrido en segundos.
-        
+        estado_redibujado (dict): Estado creado con crear_estado_redibujado.
+        posiciones (List[Tuple[int, int]]): Posiciones (fila, columna) que cambiaron,
+                                            por ejemplo las devueltas por descubrir_celda.
+
     Devuelve:
         None
-        
     """
-    puntajes = leer_puntajes()
-    puntajes.append((nombre, puntaje, tiempo))
-    puntajes.sort(key=lambda x: x[1], reverse=True)
-    puntajes = puntajes[:10]
-   
-    with open(ARCHIVO_PUNTAJES, 'w') as archivo:
-        archivo.write("Nombre,Puntaje\n")
-        for nombre, puntaje, tiempo in puntajes:
-            archivo.write(f"{nombre},{puntaje},{tiempo}\n")
+    estado_redibujado['celdas'].update(posiciones)
 
 
+def requiere_repintado_completo(estado_redibujado: dict, ventana: pygame.Surface) -> bool:
+    """
+    Indica si este cuadro debe dibujar toda la pantalla y, en ese caso,
+    da el pedido por atendido.
+
+    Recibe:
+        estado_redibujado (dict): Estado creado con crear_estado_redibujado.
+        ventana (pygame.Surface): Ventana del juego.
 
-def leer_puntajes() -> list[tuple[str, int, int]]:
+    Devuelve:
+        bool: True si se pidio un repintado completo o cambio el tamaño de la ventana.
     """
-    Lee los puntajes desde el archivo CSV.
+    tamaño = ventana.get_size()
+    requiere = estado_redibujado['completo'] or estado_redibujado['tamaño'] != tamaño
     
-    Devuelve:
-        List[Tuple[str, int, int]]: Lista de tuplas con (nombre, puntaje).
-                                   Retorna lista vacia si el archivo no existe.
+    if requiere:
+        estado_redibujado['completo'] = False
+        estado_redibujado['tamaño'] = tamaño
+        estado_redibujado['celdas'].clear()
+    
+    return requiere
+
+
+def actualizar_pantalla_juego(estado_redibujado: dict, dificultad_actual: int, estado_juego: MotorTablero,
+                              fuente_texto_boton: pygame.font.Font,
+                              imagen_bomba: pygame.Surface, imagen_bandera: pygame.Surface,
+                              mostrar_todas_bombas: bool, indice_hover_actual: int,
+                              ventana_juego: pygame.Surface) -> list[pygame.Rect]:
     """
-    puntajes = [] 
+    Dibuja solo lo que cambio de la pantalla de juego desde el cuadro anterior.
 
-    if os.path.exists(ARCHIVO_PUNTAJES):
-        with open(ARCHIVO_PUNTAJES, 'r') as archivo:
-            lineas = archivo.readlines()
-            for linea in lineas[1:]:  
-                partes = linea.strip().split(',')
-                if len(partes) == 3 and partes[1].isdigit():
-                    nombre, puntaje, tiempo = partes
-                    puntajes.append((nombre, int(puntaje), int(tiempo)))
+    Vuelve a dibujar las casillas marcadas como sucias, la informacion si cambio
+    algun texto y los botones si cambio el resaltado o quedaron debajo de algo
+    redibujado. Si se pidio un repintado completo dibuja toda la pantalla con
+    mostrar_pantalla_juego. Las casillas sucias que la camara no muestra se descartan.
+
+    Recibe:
+        estado_redibujado (dict): Estado creado con crear_estado_redibujado.
+        Los demas parametros son los mismos que los de mostrar_pantalla_juego.
 
-    return puntajes  
+    Devuelve:
+        List[pygame.Rect]: Zonas de la ventana que cambiaron, para pasar a
+                           pygame.display.update. Lista vacia si no cambio nada.
+    """
+    if estado_redibujado['mostrar_todas_bombas'] != mostrar_todas_bombas:
+        estado_redibujado['mostrar_todas_bombas'] = mostrar_todas_bombas
+        estado_redibujado['completo'] = True
+    
+    if requiere_repintado_completo(estado_redibujado, ventana_juego):
+        mostrar_pantalla_juego(dificultad_actual, estado_juego, fuente_texto_boton,
+                               imagen_bomba, imagen_bandera, mostrar_todas_bombas, indice_hover_actual,
+                               ventana_juego)
+        estado_redibujado['informacion'] = calcular_textos_informacion(estado_juego)
+        estado_redibujado['hover'] = indice_hover_actual
+        return [ventana_juego.get_rect()]
+    
+    rectangulos = []
+    tablero = estado_juego.tablero
+    filas = tablero['filas']
+    columnas = tablero['columnas']
+    celdas = tablero['celdas']
+    sucias = estado_redibujado['celdas']
+    x_inicial, y_inicial, tamaño_casilla = calcular_geometria_matriz(ventana_juego, filas, columnas)
+    fila_desde, fila_hasta, columna_desde, columna_hasta = calcular_rango_visible(ventana_juego, filas, columnas)
+    area_tablero = obtener_vista_tablero(ventana_juego, filas, columnas)
+    
+    textos_informacion = calcular_textos_informacion(estado_juego)
+    
+    if textos_informacion != estado_redibujado['informacion']:
+        zona = dibujar_informacion_juego(ventana_juego, textos_informacion, fuente_texto_boton)
+        estado_redibujado['informacion'] = textos_informacion
+        rectangulos.append(zona)
+        
+        # El tablero se dibuja encima de la informacion, asi que las casillas
+        # que la tapan se vuelven a dibujar.
+        superpuesta = zona.clip(area_tablero)
+        if superpuesta.width > 0 and superpuesta.height > 0:
+            for fila in range((superpuesta.top - y_inicial) // tamaño_casilla,
+                              (superpuesta.bottom - 1 - y_inicial) // tamaño_casilla + 1):
+                for columna in range((superpuesta.left - x_inicial) // tamaño_casilla,
+                                     (superpuesta.right - 1 - x_inicial) // tamaño_casilla + 1):
+                    sucias.add((fila, columna))
+    
+    if sucias and len(sucias) >= (fila_hasta - fila_desde) * (columna_hasta - columna_desde):
+        # Cambiaron al menos tantas casillas como las que se ven: es mas barato
+        # dibujar solo las visibles que recorrer todas las cambiadas.
+        dibujar_matriz_buscaminas(ventana_juego, tablero, fuente_texto_boton, imagen_bomba, imagen_bandera,
+                                  mostrar_todas_bombas)
+        sucias.clear()
+        rectangulos.append(area_tablero)
+    
+    elif sucias:
+        rectangulos_celdas = []
+        casillas = obtener_casillas(tamaño_casilla, fuente_texto_boton, imagen_bomba, imagen_bandera)
+        recorte_anterior = ventana_juego.get_clip()
+        ventana_juego.set_clip(area_tablero)
+        
+        for fila, columna in sucias:
+            if not (fila_desde <= fila < fila_hasta and columna_desde <= columna < columna_hasta):
+                continue
+            rect = pygame.Rect(x_inicial + columna * tamaño_casilla, y_inicial + fila * tamaño_casilla,
+                               tamaño_casilla, tamaño_casilla)
+            dibujar_celda(ventana_juego, celdas[fila * columnas + columna], rect.topleft, casillas,
+                          mostrar_todas_bombas)
+            rectangulos_celdas.append(rect.clip(area_tablero))
+        
+        ventana_juego.set_clip(recorte_anterior)
+        sucias.clear()
+        
+        if len(rectangulos_celdas) > MAXIMO_RECTANGULOS_SUCIOS:
+            rectangulos_celdas = [rectangulos_celdas[0].unionall(rectangulos_celdas)]
+        rectangulos.extend(rectangulos_celdas)
+    
+    boton_reiniciar = crear_boton('reiniciar', ventana_juego)
+    boton_volver = crear_boton('volver', ventana_juego)
+    tapados = boton_reiniciar.collidelist(rectangulos) != -1 or boton_volver.collidelist(rectangulos) != -1
+    
+    if tapados or estado_redibujado['hover'] != indice_hover_actual:
+        dibujar_boton_en_pantalla(boton_reiniciar, "Reiniciar", indice_hover_actual == 1)
+        dibujar_boton_en_pantalla(boton_volver, "Volver", indice_hover_actual == 0)
+        estado_redibujado['hover'] = indice_hover_actual
+        rectangulos.append(boton_reiniciar)
+        rectangulos.append(boton_volver)
+    
+    return rectangulos
 
 
+# ===============================================================================
+# PUNTAJES
+# ===============================================================================
 
-def mostrar_lista_puntajes(ventana: pygame.Surface, fuente: pygame.font.Font) -> None:
+def mostrar_lista_puntajes(ventana: pygame.Surface, fuente: pygame.font.Font, puntajes: list[tuple] = None) -> None:
     """
     Muestra la lista de los mejores puntajes en pantalla de forma responsive.
     
@@ -944,11 +1466,13 @@ def mostrar_lista_puntajes(ventana: pygame.Surface, fuente: pygame.font.Font) ->
     Recibe:
         ventana (pygame.Surface): Superficie donde mostrar los puntajes.
         fuente (pygame.font.Font): Fuente para el texto de los puntajes.
+        puntajes (List[tuple], opcional): Puntajes a mostrar. Si no se pasan se leen con leer_puntajes.
     
     Devuelve:
         None
     """
-    puntajes = leer_puntajes()
+    if puntajes is None:
+        puntajes = leer_puntajes()
     
     ancho_ventana = ventana.get_width()
     alto_ventana = ventana.get_height()
@@ -967,9 +1491,9 @@ def mostrar_lista_puntajes(ventana: pygame.Surface, fuente: pygame.font.Font) ->
     ventana.blit(cuadro, (cuadro_x, cuadro_y))
     
     tamaño_fuente_titulo = int(ancho_ventana * 0.03) 
-    fuente_titulo = pygame.font.SysFont("Verdana", tamaño_fuente_titulo, bold=True)
+    fuente_titulo = obtener_fuente("Verdana", tamaño_fuente_titulo, negrita=True)
     titulo = "Top 10 Puntajes"
-    texto_titulo = fuente_titulo.render(titulo, True, (0, 0, 0))
+    texto_titulo = renderizar_texto(fuente_titulo, titulo, (0, 0, 0))
     x_titulo = cuadro_x + (ancho_cuadro - texto_titulo.get_width()) // 2
     y_titulo = cuadro_y + int(alto_ventana * 0.02)  
     ventana.blit(texto_titulo, (x_titulo, y_titulo))
@@ -977,7 +1501,7 @@ def mostrar_lista_puntajes(ventana: pygame.Surface, fuente: pygame.font.Font) ->
     mensaje = None
     
     if not puntajes:
-        mensaje = fuente.render("No hay puntajes", True, (100, 100, 100))
+        mensaje = renderizar_texto(fuente, "No hay puntajes", (100, 100, 100))
     else:
         colores_podio = [(255, 215, 0), (192, 192, 192), (205, 127, 50)]
         
@@ -1007,7 +1531,7 @@ def mostrar_lista_puntajes(ventana: pygame.Surface, fuente: pygame.font.Font) ->
                 color_texto_linea = (0, 0, 0)
             
             linea = f"{posicion}. {nombre[:12]} - Pts: {puntaje}"
-            texto = fuente.render(linea, True, color_texto_linea)
+            texto = renderizar_texto(fuente, linea, color_texto_linea)
             
             x_texto = cuadro_x + margen_lateral + int(ancho_cuadro * 0.04)
             y_texto = y + (alto_entrada - texto.get_height()) // 2
@@ -1036,46 +1560,45 @@ def inicializar_musica() -> None:
         None
         
     Nota:
-        - Carga la musica desde 'Musica/Musica.mp3'
+        - Carga la musica desde MUSICA_FONDO
         - La reproduce en bucle infinito (-1)
-        - Establece el volumen al 20% (0.2)
+        - Establece el volumen a VOLUMEN_MUSICA
+        - Si no hay dispositivo de audio o falta el archivo, el juego sigue sin musica
         
     """
-    pygame.mixer.init()
-    pygame.mixer.music.load('Musica/Musica.mp3')
-    pygame.mixer.music.play(-1)
-    pygame.mixer.music.set_volume(0.2)
+    if iniciar_mezclador():
+        reproducir_musica(MUSICA_FONDO, VOLUMEN_MUSICA)
 
 
 def cargar_sonidos() -> dict[str, pygame.mixer.Sound]:
     """
-    Carga todos los efectos de sonido del juego.
+    Empieza a cargar todos los efectos de sonido del juego en segundo plano.
     
     Devuelve:
-        Dict[str, pygame.mixer.Sound]: Diccionario con los sonidos cargados:
+        Dict[str, pygame.mixer.Sound]: Diccionario que se va llenando con los sonidos
+        a medida que se decodifican (ver SONIDOS):
             - "click": Sonido de click en botones
             - "victoria": Sonido de victoria
             - "derrota": Sonido de derrota
             
     Nota:
-        Todos los sonidos se configuran con volumen al 30% (0.3).
+        Todos los sonidos se configuran con volumen VOLUMEN_SONIDOS. Los que faltan
+        o no se pueden leer no se agregan, y reproducirlos no hace nada.
         
     """
-    sonidos = {
-        "click": pygame.mixer.Sound('Musica/click.mp3'),
-        "victoria": pygame.mixer.Sound('Musica/victoria.mp3'),
-        "derrota": pygame.mixer.Sound('Musica/derrota.mp3'),
-    }
-   
-    for s in sonidos.values():
-        s.set_volume(0.3)
-    return sonidos
+    if iniciar_mezclador():
+        cargar_sonidos_en_segundo_plano(SONIDOS, VOLUMEN_SONIDOS)
+
+    return sonidos_cargados
 
 
 def reproducir_sonido(sonidos: dict[str, pygame.mixer.Sound], tipo: str) -> None:
     """
     Reproduce un sonido especifico si existe en el diccionario.
     
+    Los sonidos de SONIDOS_INTERFAZ usan los canales reservados, asi no esperan
+    a que termine otro sonido.
+    
     Recibe:
         sonidos (dict[str, pygame.mixer.Sound]): Diccionario con los sonidos cargados.
         tipo (str): Tipo de sonido a reproducir ("click", "victoria", "derrota").
@@ -1084,21 +1607,39 @@ def reproducir_sonido(sonidos: dict[str, pygame.mixer.Sound], tipo: str) -> None
         None
         
     """
-    if tipo in sonidos:
-        sonidos[tipo].play()
+    sonido = sonidos.get(tipo)
+    
+    if sonido is None:
+        return
+    
+    if tipo in SONIDOS_INTERFAZ and CANALES_RESERVADOS_INTERFAZ > 0:
+        canales = [pygame.mixer.Channel(i) for i in range(CANALES_RESERVADOS_INTERFAZ)]
+        libres = [canal for canal in canales if not canal.get_busy()]
+        (libres or canales)[0].play(sonido)
+    else:
+        sonido.play()
 
 
-def cambiar_musica_de_fondo(archivo_mp3: str = 'Musica/Musica.mp3') -> None:
+def cambiar_musica_de_fondo(archivo_mp3: str = MUSICA_FONDO) -> None:
     """
     Cambia la musica de fondo del juego.
     
     Recibe:
-        archivo_mp3 (str, optional): Ruta del archivo MP3 a reproducir. 
-                                   Por defecto 'Musica/Musica.mp3'.
+        archivo_mp3 (str, optional): Ruta del archivo MP3 a reproducir, relativa
+                                   a la carpeta del juego. Por defecto MUSICA_FONDO.
                                    
     Devuelve:
         None
     """
-    pygame.mixer.music.stop()
-    pygame.mixer.music.load(archivo_mp3)
-    pygame.mixer.music.play(-1)
\ No newline at end of file
+    reproducir_musica(archivo_mp3)
+
+
+def detener_musica() -> None:
+    """
+    Detiene la musica de fondo, si hay audio disponible.
+    
+    Devuelve:
+        None
+    """
+    if pygame.mixer.get_init():
+        pygame.mixer.music.stop()
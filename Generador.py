@@ -0,0 +1,338 @@
+import multiprocessing
+import os
+import queue
+import random
+import signal
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from Constantes import *
+from Tablero import *
+from Solucionador import *
+
+
+# Procesos que prueban tableros candidatos. Se crean una sola vez, con
+# iniciar_ejecutor, y se reusan en las partidas siguientes, porque crearlos tarda.
+# Se crean con fork: con spawn cada proceso volveria a ejecutar Main.py, que
+# abre la ventana al importarse. Por eso iniciar_ejecutor se llama al arrancar,
+# antes de iniciar pygame o cualquier hilo: un fork con otros hilos en marcha
+# puede dejar al proceso hijo trabado en un candado que tenia otro hilo. Si no
+# se iniciaron, o donde no hay fork, se prueba todo aca. Mientras 'cancelar'
+# esta puesto las busquedas terminan sin resultado. 'pids' son los procesos,
+# que anota cada uno al empezar, para poder cortarlos al cerrar.
+procesos_generador = {'ejecutor': None, 'cantidad': 0, 'pids': [], 'cancelar': threading.Event()}
+
+
+# ===============================================================================
+# TABLEROS SIN ADIVINAR
+# ===============================================================================
+
+def armar_tablero_candidato(filas: int, columnas: int, minas: int, semilla: int,
+                            fila: int, columna: int) -> dict:
+    """
+    Arma un tablero con la casilla de inicio y sus vecinas sin minas.
+
+    Con la misma semilla siempre sale el mismo tablero, asi los procesos solo
+    devuelven la semilla y el tablero elegido se vuelve a armar aca.
+
+    Recibe:
+        filas (int): Numero de filas del tablero.
+        columnas (int): Numero de columnas del tablero.
+        minas (int): Numero de minas.
+        semilla (int): Semilla del candidato.
+        fila (int): Fila de la casilla de inicio.
+        columna (int): Columna de la casilla de inicio.
+
+    Devuelve:
+        dict: Tablero compacto con las minas y los numeros, sin descubrir.
+    """
+    tablero = inicializar_matriz(filas, columnas, minas, semilla)
+    generar_matriz_numeros(tablero)
+    asegurar_primer_click(tablero, fila, columna, True, semilla)
+
+    return tablero
+
+
+def probar_candidato(filas: int, columnas: int, minas: int, semilla: int,
+                     fila: int, columna: int) -> bool:
+    """
+    Arma un candidato y lo resuelve desde la casilla de inicio. Es lo que corre
+    en cada proceso, por eso recibe y devuelve solo valores simples.
+
+    Recibe:
+        (los mismos datos que armar_tablero_candidato)
+
+    Devuelve:
+        bool: True si el tablero se gana sin adivinar.
+    """
+    tablero = armar_tablero_candidato(filas, columnas, minas, semilla, fila, columna)
+
+    return es_resoluble(tablero, fila, columna)
+
+
+def anotar_proceso(cola) -> None:
+    """
+    Inicializador de cada proceso: manda su PID para poder cortarlo al cerrar.
+
+    Recibe:
+        cola (multiprocessing.Queue): Cola donde se anotan los PID.
+
+    Devuelve:
+        None
+    """
+    cola.put(os.getpid())
+
+
+def iniciar_ejecutor(procesos: int = PROCESOS_SIN_ADIVINAR) -> ProcessPoolExecutor:
+    """
+    Crea los procesos que prueban candidatos. Se tiene que llamar desde el hilo
+    principal antes de iniciar otros hilos (ver procesos_generador).
+
+    Recibe:
+        procesos (int, opcional): Cantidad de procesos. None para usar todos los nucleos.
+
+    Devuelve:
+        ProcessPoolExecutor: Procesos listos, o None si no se pueden crear
+                             (en ese caso los candidatos se prueban aca).
+    """
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return None
+
+    cerrar_ejecutor()
+    cantidad = procesos or os.cpu_count() or 1
+
+    contexto = multiprocessing.get_context('fork')
+    cola = contexto.Queue()
+
+    try:
+        ejecutor = ProcessPoolExecutor(max_workers=cantidad, mp_context=contexto,
+                                       initializer=anotar_proceso, initargs=(cola,))
+        # Con fork los procesos se crean todos con el primer pedido, asi que se
+        # hace uno ahora, mientras no hay otros hilos.
+        ejecutor.submit(int).result()
+        pids = [cola.get(timeout=SEGUNDOS_INICIO_SIN_ADIVINAR) for _ in range(cantidad)]
+    except (OSError, NotImplementedError, BrokenProcessPool, queue.Empty):
+        return None
+
+    procesos_generador['ejecutor'] = ejecutor
+    procesos_generador['cantidad'] = cantidad
+    procesos_generador['pids'] = pids
+
+    return ejecutor
+
+
+def obtener_ejecutor() -> ProcessPoolExecutor:
+    """
+    Devuelve los procesos que prueban candidatos, si se crearon con iniciar_ejecutor.
+
+    Devuelve:
+        ProcessPoolExecutor: Procesos listos, o None si no hay (en ese caso los
+                             candidatos se prueban aca).
+    """
+    return procesos_generador['ejecutor']
+
+
+def cerrar_ejecutor() -> None:
+    """
+    Termina los procesos que prueban candidatos, si se crearon, sin esperar
+    a los candidatos que estan probando.
+
+    Devuelve:
+        None
+    """
+    ejecutor = procesos_generador['ejecutor']
+
+    if ejecutor is not None:
+        ejecutor.shutdown(wait=False, cancel_futures=True)
+
+    # Los candidatos que ya empezaron no se pueden cancelar: se cortan los
+    # procesos para no esperarlos al salir.
+    for pid in procesos_generador['pids']:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    procesos_generador['ejecutor'] = None
+    procesos_generador['cantidad'] = 0
+    procesos_generador['pids'] = []
+
+
+def cancelar_busquedas(cancelar: bool = True) -> None:
+    """
+    Corta las busquedas de tableros sin adivinar en curso y las que empiecen
+    despues, por ejemplo para cerrar el juego sin esperarlas.
+
+    Recibe:
+        cancelar (bool, opcional): False para volver a permitir las busquedas.
+
+    Devuelve:
+        None
+    """
+    if cancelar:
+        procesos_generador['cancelar'].set()
+    else:
+        procesos_generador['cancelar'].clear()
+
+
+def debe_parar(limite: float) -> bool:
+    """
+    Indica si una busqueda tiene que terminar, porque se cancelo o se le acabo el tiempo.
+
+    Recibe:
+        limite (float): Momento, segun time.monotonic, en que termina la busqueda.
+
+    Devuelve:
+        bool: True si hay que dejar de probar candidatos.
+    """
+    return procesos_generador['cancelar'].is_set() or time.monotonic() > limite
+
+
+def buscar_semilla_sin_adivinar(filas: int, columnas: int, minas: int, fila: int, columna: int,
+                                semilla: int = None,
+                                maximo_intentos: int = MAXIMO_INTENTOS_SIN_ADIVINAR,
+                                tiempo_maximo: float = SEGUNDOS_MAXIMOS_SIN_ADIVINAR) -> int:
+    """
+    Busca un tablero que se pueda ganar sin adivinar desde una casilla,
+    probando candidatos en paralelo (ver probar_en_paralelo).
+
+    Los resultados se revisan en el orden en que se pidieron, asi la misma
+    semilla elige siempre el mismo tablero si se encuentra a tiempo. Si los procesos
+    no se iniciaron o se caen, los candidatos se prueban aca uno por uno.
+
+    Recibe:
+        filas (int): Numero de filas del tablero.
+        columnas (int): Numero de columnas del tablero.
+        minas (int): Numero de minas.
+        fila (int): Fila de la casilla de inicio.
+        columna (int): Columna de la casilla de inicio.
+        semilla (int, opcional): Semilla de la que salen las de los candidatos.
+        maximo_intentos (int, opcional): Candidatos que se prueban como maximo.
+        tiempo_maximo (float, opcional): Segundos que se buscan como maximo.
+
+    Devuelve:
+        int: Semilla del tablero encontrado (ver armar_tablero_candidato), o None
+             si ningun candidato sirvio a tiempo o la busqueda se cancelo.
+    """
+    limite = time.monotonic() + tiempo_maximo
+    generador = random.Random(semilla)
+    candidatos = [generador.getrandbits(32) for _ in range(maximo_intentos)]
+    ejecutor = obtener_ejecutor()
+
+    if ejecutor is not None:
+        try:
+            return probar_en_paralelo(ejecutor, candidatos, filas, columnas, minas, fila, columna, limite)
+        except BrokenProcessPool:
+            cerrar_ejecutor()
+
+    for candidato in candidatos:
+        if debe_parar(limite):
+            break
+        if probar_candidato(filas, columnas, minas, candidato, fila, columna):
+            return candidato
+
+    return None
+
+
+def probar_en_paralelo(ejecutor: ProcessPoolExecutor, candidatos: list[int], filas: int, columnas: int,
+                       minas: int, fila: int, columna: int, limite: float) -> int:
+    """
+    Prueba candidatos en los procesos, con dos por proceso en marcha a la vez.
+    Cuando uno sirve se cancelan los que todavia no empezaron.
+
+    Recibe:
+        ejecutor (ProcessPoolExecutor): Procesos de iniciar_ejecutor.
+        candidatos (List[int]): Semillas de los candidatos, en orden.
+        (y los datos del tablero, como en probar_candidato)
+        limite (float): Momento, segun time.monotonic, en que termina la busqueda.
+
+    Devuelve:
+        int: Semilla del primer candidato que sirve, o None.
+    """
+    en_marcha = deque()
+    maximo_en_marcha = 2 * procesos_generador['cantidad']
+
+    try:
+        for candidato in candidatos:
+            en_marcha.append((candidato, ejecutor.submit(probar_candidato, filas, columnas, minas,
+                                                         candidato, fila, columna)))
+
+            while len(en_marcha) >= maximo_en_marcha and not debe_parar(limite):
+                encontrado = revisar_primer_candidato(en_marcha, limite)
+                if encontrado is not None:
+                    return encontrado
+
+            if debe_parar(limite):
+                return None
+
+        while en_marcha and not debe_parar(limite):
+            encontrado = revisar_primer_candidato(en_marcha, limite)
+            if encontrado is not None:
+                return encontrado
+    finally:
+        for _, futuro in en_marcha:
+            futuro.cancel()
+
+    return None
+
+
+def revisar_primer_candidato(en_marcha: deque, limite: float) -> int:
+    """
+    Espera el resultado del candidato mas antiguo y lo saca de la lista.
+    Espera de a INTERVALO_REVISION_SIN_ADIVINAR segundos, y si mientras tanto
+    la busqueda se cancela o se le acaba el tiempo deja el candidato en la lista.
+
+    Recibe:
+        en_marcha (deque): (semilla, futuro) de los candidatos pedidos, en orden.
+        limite (float): Momento, segun time.monotonic, en que termina la busqueda.
+
+    Devuelve:
+        int: La semilla si el candidato sirve, o None si no o si hay que parar.
+    """
+    candidato, futuro = en_marcha[0]
+
+    while not futuro.done():
+        if debe_parar(limite):
+            return None
+        espera = min(INTERVALO_REVISION_SIN_ADIVINAR, max(limite - time.monotonic(), 0))
+        wait([futuro], timeout=espera, return_when=FIRST_COMPLETED)
+
+    en_marcha.popleft()
+
+    if futuro.result():
+        return candidato
+
+    return None
+
+
+def generar_tablero_sin_adivinar(filas: int, columnas: int, minas: int, fila: int, columna: int,
+                                 semilla: int = None) -> dict:
+    """
+    Genera un tablero que se gana sin adivinar empezando por una casilla.
+
+    Si no se encuentra ninguno en MAXIMO_INTENTOS_SIN_ADIVINAR intentos ni en
+    SEGUNDOS_MAXIMOS_SIN_ADIVINAR segundos, o si la busqueda se cancela, devuelve
+    un tablero comun, con la casilla de inicio y sus vecinas sin minas.
+
+    Recibe:
+        filas (int): Numero de filas del tablero.
+        columnas (int): Numero de columnas del tablero.
+        minas (int): Numero de minas.
+        fila (int): Fila de la casilla de inicio.
+        columna (int): Columna de la casilla de inicio.
+        semilla (int, opcional): Semilla para reproducir el tablero.
+
+    Devuelve:
+        dict: Tablero compacto con las minas y los numeros, sin descubrir.
+    """
+    if semilla is None:
+        semilla = random.getrandbits(32)
+
+    encontrada = buscar_semilla_sin_adivinar(filas, columnas, minas, fila, columna, semilla)
+
+    if encontrada is None:
+        encontrada = semilla
+
+    return armar_tablero_candidato(filas, columnas, minas, encontrada, fila, columna)
@@ -1,34 +1,60 @@
+import argparse
 import pygame
 from Funciones import *
 from Constantes import *
 
+############################## Argumentos ####################################
+
+parser = argparse.ArgumentParser(description="Buscaminas.")
+parser.add_argument('--personalizado', nargs=3, type=int, metavar=('FILAS', 'COLUMNAS', 'MINAS'),
+                    help="medidas del tablero personalizado")
+argumentos = parser.parse_args()
+
+if argumentos.personalizado:
+    try:
+        configurar_tablero_personalizado(*argumentos.personalizado)
+    except ValueError as error:
+        parser.error(str(error))
+
+######################## Procesos del generador ##############################
+
+# Antes que pygame y que cualquier hilo (ver iniciar_ejecutor).
+if TABLEROS_SIN_ADIVINAR:
+    iniciar_ejecutor()
+
 ############################ Inicializar Pygame ################################
 
+configurar_audio()
 pygame.init()
-inicializar_musica()
-sonidos = cargar_sonidos()
 
 ############################ Configurar ventana ################################
 
 pygame.display.set_caption("Buscaminas")
 ventana_juego = pygame.display.set_mode((DIMENSIONES_VENTANA), pygame.RESIZABLE)
+convertir_imagenes_cargadas()
+pygame.key.set_repeat(200, 30)
+
+############################ Musica y sonidos ################################
+
+inicializar_musica()
+sonidos = cargar_sonidos()
 
 ############################ Imagenes y recursos ###############################
 
-imagen_fondo = pygame.image.load('Imagenes/Fondo.jpg')
-imagen_fondo_puntajes = pygame.image.load('Imagenes/Puntajes.jpg')
-icono = pygame.image.load('Imagenes/bomb.png')
-pygame.display.set_icon(icono)
-imagen_bomba = pygame.image.load('Imagenes/bomb.png')
-imagen_bomba = pygame.transform.scale(imagen_bomba, (40, 40))
-imagen_bandera = pygame.image.load('Imagenes/bandera.png')
-imagen_bandera = pygame.transform.scale(imagen_bandera, (40, 40))
+imagen_bomba = cargar_imagen(IMAGEN_BOMBA)
+imagen_bandera = cargar_imagen(IMAGEN_BANDERA)
+pygame.display.set_icon(imagen_bomba)
+
+############################ Partidas preparadas ################################
+
+if PREPARAR_PARTIDAS:
+    iniciar_preparacion_partidas()
 
 ############################## Fuentes ################################
 
-fuente_titulo_grande = pygame.font.SysFont("Impact", 72)
-fuente_texto_boton = pygame.font.SysFont("Verdana", 25)
-fuente_subtitulo_pantalla = pygame.font.SysFont("Verdana", 48)
+fuente_titulo_grande = obtener_fuente("Impact", 72)
+fuente_texto_boton = obtener_fuente("Verdana", 25)
+fuente_subtitulo_pantalla = obtener_fuente("Verdana", 48)
 
 ############################## Contadores y Banderas ################################ 
 
@@ -36,43 +62,89 @@ pantalla_actual = "menu"
 dificultad_actual = 0
 indice_hover_actual = -2
 puntaje = 0
-tiempo_transcurrido = 0
-banderas_colocadas = 0
 juego_terminado = False
 juego_ejecutandose = True                              
 mostrar_todas_bombas = False
-primer_click = True
+arrastrando_camara = False
+pantalla_dibujada = None
+estado_redibujado = crear_estado_redibujado()
+estado_juego = None
+reloj = pygame.time.Clock()
 
 ########################### Loop principal ##############################
 
 while juego_ejecutandose:
-    for evento in pygame.event.get():
+    if estado_redibujado['completo'] or pantalla_actual != pantalla_dibujada:
+        espera = 0
+    else:
+        espera = calcular_espera_eventos(pantalla_actual, estado_juego)
+
+    for evento in esperar_eventos(espera):
         if evento.type == pygame.QUIT:
             juego_ejecutandose = False
 
+        elif evento.type in (pygame.VIDEORESIZE, pygame.WINDOWEXPOSED):
+            obtener_diseño(ventana_juego)
+            marcar_repintado_completo(estado_redibujado)
+
         elif evento.type == pygame.MOUSEMOTION:
+            indice_hover_anterior = indice_hover_actual
+
             if pantalla_actual == "menu":
                 indice_hover_actual = detectar_hover_en_menu_nuevo(evento.pos, ventana_juego)
             else:
                 indice_hover_actual = detectar_hover_en_otras_pantallas(evento.pos, ventana_juego)
 
+            if pantalla_actual != "juego" and indice_hover_actual != indice_hover_anterior:
+                marcar_repintado_completo(estado_redibujado)
+
+            if arrastrando_camara and pantalla_actual == "juego":
+                if mover_camara(ventana_juego, estado_juego.filas, estado_juego.columnas, -evento.rel[0], -evento.rel[1]):
+                    marcar_repintado_completo(estado_redibujado)
+
+        elif evento.type == pygame.MOUSEWHEEL and pantalla_actual == "juego":
+            if hacer_zoom_camara(ventana_juego, estado_juego.filas, estado_juego.columnas, pygame.mouse.get_pos(), evento.y):
+                marcar_repintado_completo(estado_redibujado)
+
+        elif evento.type == pygame.KEYDOWN and pantalla_actual == "juego":
+            dx, dy = 0, 0
+            if evento.key in (pygame.K_LEFT, pygame.K_a):
+                dx = -DESPLAZAMIENTO_TECLAS
+            elif evento.key in (pygame.K_RIGHT, pygame.K_d):
+                dx = DESPLAZAMIENTO_TECLAS
+            elif evento.key in (pygame.K_UP, pygame.K_w):
+                dy = -DESPLAZAMIENTO_TECLAS
+            elif evento.key in (pygame.K_DOWN, pygame.K_s):
+                dy = DESPLAZAMIENTO_TECLAS
+
+            if mover_camara(ventana_juego, estado_juego.filas, estado_juego.columnas, dx, dy):
+                marcar_repintado_completo(estado_redibujado)
+
+        elif evento.type == pygame.MOUSEBUTTONUP and evento.button == 2:
+            arrastrando_camara = False
+
         elif evento.type == pygame.MOUSEBUTTONDOWN:
-            if evento.button == 1: 
+            if evento.button == 2:
+                arrastrando_camara = True
+
+            elif evento.button == 1: 
                 reproducir_sonido(sonidos, "click")
 
                 if pantalla_actual == "menu":
                     i = procesar_click_en_menu_nuevo(evento.pos, ventana_juego)
 
                     if i == 0:  
-                        estado_juego = inicializar_tablero(dificultad_actual)
-                        banderas_colocadas = 0
+                        estado_juego = obtener_partida(dificultad_actual)
+                        reiniciar_camara()
+                        marcar_repintado_completo(estado_redibujado)
                         mostrar_todas_bombas = False
                         pantalla_actual = "juego"
                         juego_terminado = False
-                        primer_click = True
 
                     elif i == 1:  
-                        dificultad_actual = (dificultad_actual + 1) % 3
+                        dificultad_actual = (dificultad_actual + 1) % len(NOMBRES_DIFICULTAD)
+                        priorizar_dificultad(dificultad_actual)
+                        marcar_repintado_completo(estado_redibujado)
                     elif i == 2:  
                         pantalla_actual = "puntajes"
                     elif i == 3:  
@@ -83,68 +155,35 @@ while juego_ejecutandose:
 
                     if click_volver:
                         pantalla_actual = "menu"
-                        primer_click = True
 
                     elif click_reiniciar:
-                        estado_juego = inicializar_tablero(dificultad_actual)
-                        banderas_colocadas = 0
+                        estado_juego = obtener_partida(dificultad_actual)
+                        reiniciar_camara()
+                        marcar_repintado_completo(estado_redibujado)
                         mostrar_todas_bombas = False
                         juego_terminado = False
-                        primer_click = True
-                        estado_juego['tiempo_inicio'] = 0
-                        estado_juego['timer_activo'] = False
                     else:
-                        fila, col = calcular_posicion_matriz(evento.pos, ventana_juego, estado_juego['filas'], estado_juego['columnas'])                        
-                       
-                        fuera_de_filas = fila < 0 or fila >= len(estado_juego['matriz_minas'])
-                        fuera_de_columnas = col < 0 or col >= len(estado_juego['matriz_minas'][0])
-
-                        if fuera_de_filas or fuera_de_columnas:
-                            continue
-
-                        if not estado_juego['matriz_estado'][fila][col] and not estado_juego['matriz_banderas'][fila][col]:
-
-                            if primer_click:
-                                
-                                if estado_juego['matriz_numeros'][fila][col] == 'X':
-                                    estado_juego['matriz_minas'], estado_juego['matriz_numeros'] = mover_bomba(estado_juego['matriz_minas'], fila, col)
-                                   
-                                    for i in range(len(estado_juego['matriz_estado'])):
-                                        for j in range(len(estado_juego['matriz_estado'][0])):
-                                            estado_juego['matriz_estado'][i][j] = False
-                                
-                                    for i in range(len(estado_juego['matriz_banderas'])):
-                                        for j in range(len(estado_juego['matriz_banderas'][0])):
-                                            estado_juego['matriz_banderas'][i][j] = False
-                                            
-                                primer_click = False
-
-                            if not estado_juego['timer_activo'] and estado_juego['matriz_numeros'][fila][col] != 'X':
-                                estado_juego['tiempo_inicio'] = pygame.time.get_ticks()
-                                estado_juego['timer_activo'] = True
-
-                            descubrir_celda(estado_juego['matriz_estado'], estado_juego['matriz_numeros'], fila, col)
-
-                            if estado_juego['matriz_numeros'][fila][col] == 'X':  
-                                reproducir_sonido(sonidos, "derrota")
-                                mostrar_todas_bombas = True
-                                juego_terminado = True
-                                tiempo_transcurrido = (pygame.time.get_ticks() - estado_juego['tiempo_inicio']) // 1000
-                                mostrar_pantalla_juego(dificultad_actual, estado_juego, banderas_colocadas, fuente_texto_boton, imagen_bomba, imagen_bandera,  
-                                                        mostrar_todas_bombas, indice_hover_actual, ventana_juego)
-                                pygame.display.flip()
-                                pygame.time.wait(2000)
-                                nombre = pedir_nombre(ventana_juego, False)
-                                
-                                if nombre:
-                                    puntaje = calcular_puntaje(dificultad_actual, tiempo_transcurrido)
-                                    guardar_puntaje(nombre, puntaje, tiempo_transcurrido)
-                                pantalla_actual = "menu"
-                                
-                            elif verificar_victoria(estado_juego['matriz_estado'], estado_juego['matriz_minas']):
-                                reproducir_sonido(sonidos, "victoria")
-                                juego_terminado = True
-                                tiempo_transcurrido = (pygame.time.get_ticks() - estado_juego['tiempo_inicio']) // 1000
+                        fila, col = calcular_posicion_matriz(evento.pos, ventana_juego, estado_juego.filas, estado_juego.columnas)
+                        marcar_celdas_sucias(estado_redibujado, estado_juego.descubrir(fila, col))
+
+                        if estado_juego.perdio() and not juego_terminado:
+                            reproducir_sonido(sonidos, "derrota")
+                            mostrar_todas_bombas = True
+                            juego_terminado = True
+                            mostrar_pantalla_juego(dificultad_actual, estado_juego, fuente_texto_boton, imagen_bomba, imagen_bandera,  
+                                                    mostrar_todas_bombas, indice_hover_actual, ventana_juego)
+                            pygame.display.flip()
+                            pygame.time.wait(2000)
+                            nombre = pedir_nombre(ventana_juego, False)
+                            
+                            if nombre:
+                                puntaje = estado_juego.puntaje()
+                                guardar_puntaje(nombre, puntaje, int(estado_juego.tiempo_transcurrido()), dificultad_actual)
+                            pantalla_actual = "menu"
+                            
+                        elif estado_juego.gano() and not juego_terminado:
+                            reproducir_sonido(sonidos, "victoria")
+                            juego_terminado = True
 
                 elif pantalla_actual == "puntajes":
                     click_reiniciar, click_volver = procesar_click_en_otras_pantallas(evento.pos, ventana_juego)
@@ -152,53 +191,56 @@ while juego_ejecutandose:
                         pantalla_actual = "menu"
 
             elif evento.button == 3 and pantalla_actual == "juego":  
-                fila, col = calcular_posicion_matriz(evento.pos,ventana_juego,estado_juego['filas'],estado_juego['columnas'])               
-                              
-                fuera_de_filas = fila < 0 or fila >= len(estado_juego['matriz_banderas'])
-                fuera_de_columnas = col < 0 or col >= len(estado_juego['matriz_banderas'][0])
-                casilla_ya_descubierta = estado_juego['matriz_estado'][fila][col]
-
-                if fuera_de_filas or fuera_de_columnas or casilla_ya_descubierta:
-                    continue
-
-                estado_juego['matriz_banderas'][fila][col] = not estado_juego['matriz_banderas'][fila][col]
-               
-                if estado_juego['matriz_banderas'][fila][col]:
-                    banderas_colocadas += 1
-                else:
-                    banderas_colocadas -= 1
+                fila, col = calcular_posicion_matriz(evento.pos, ventana_juego, estado_juego.filas, estado_juego.columnas)
+                cambiadas = estado_juego.alternar_bandera(fila, col)
 
-                reproducir_sonido(sonidos, "bandera")
+                if cambiadas:
+                    marcar_celdas_sucias(estado_redibujado, cambiadas)
+                    reproducir_sonido(sonidos, "bandera")
 
     if juego_terminado and pantalla_actual == "juego":
-        if estado_juego['timer_activo']:
-            tiempo_transcurrido = (pygame.time.get_ticks() - estado_juego['tiempo_inicio']) // 1000
-        
-        es_victoria = verificar_victoria(estado_juego['matriz_estado'], estado_juego['matriz_minas'])
-        mostrar_pantalla_juego(dificultad_actual, estado_juego, banderas_colocadas, fuente_texto_boton, imagen_bomba, imagen_bandera,  
+        mostrar_pantalla_juego(dificultad_actual, estado_juego, fuente_texto_boton, imagen_bomba, imagen_bandera,  
                                mostrar_todas_bombas, indice_hover_actual, ventana_juego)
-        nombre = pedir_nombre(ventana_juego, es_victoria)
+        nombre = pedir_nombre(ventana_juego, estado_juego.gano())
 
         if nombre:
-            puntaje = calcular_puntaje(dificultad_actual, tiempo_transcurrido)
-            guardar_puntaje(nombre, puntaje, tiempo_transcurrido)     
-        cambiar_musica_de_fondo('Musica/Musica.mp3')
+            puntaje = estado_juego.puntaje()
+            guardar_puntaje(nombre, puntaje, int(estado_juego.tiempo_transcurrido()), dificultad_actual)     
+        cambiar_musica_de_fondo(MUSICA_FONDO)
         mostrar_todas_bombas = False
         juego_terminado = False
-        estado_juego['timer_activo'] = False  
-        primer_click = True
         pantalla_actual = "menu"
         continue  
 
-    if pantalla_actual == "menu":
-        mostrar_pantalla_menu_principal(indice_hover_actual, ventana_juego, imagen_fondo, dificultad_actual)
-    elif pantalla_actual == "puntajes":
-        mostrar_pantalla_puntajes(ventana_juego, imagen_fondo_puntajes, fuente_texto_boton, indice_hover_actual)
-    elif pantalla_actual == "juego":
-        mostrar_pantalla_juego(dificultad_actual, estado_juego, banderas_colocadas, fuente_texto_boton, imagen_bomba, imagen_bandera,  
-                               mostrar_todas_bombas, indice_hover_actual, ventana_juego)
-
-    pygame.display.flip()
-
-pygame.mixer.music.stop()
+    if pantalla_actual != pantalla_dibujada:
+        marcar_repintado_completo(estado_redibujado)
+        pantalla_dibujada = pantalla_actual
+    elif pantalla_actual == "puntajes" and pantalla_puntajes_desactualizada():
+        marcar_repintado_completo(estado_redibujado)
+
+    rectangulos_cambiados = []
+
+    if pantalla_actual == "juego":
+        rectangulos_cambiados = actualizar_pantalla_juego(estado_redibujado, dificultad_actual, estado_juego,
+                                                          fuente_texto_boton, imagen_bomba, imagen_bandera,
+                                                          mostrar_todas_bombas, indice_hover_actual, ventana_juego)
+    elif requiere_repintado_completo(estado_redibujado, ventana_juego):
+        if pantalla_actual == "menu":
+            mostrar_pantalla_menu_principal(indice_hover_actual, ventana_juego, cargar_imagen(IMAGEN_FONDO), dificultad_actual)
+        elif pantalla_actual == "puntajes":
+            mostrar_pantalla_puntajes(ventana_juego, cargar_imagen(IMAGEN_FONDO_PUNTAJES), fuente_texto_boton, indice_hover_actual)
+        rectangulos_cambiados = [ventana_juego.get_rect()]
+
+    if rectangulos_cambiados:
+        pygame.display.update(rectangulos_cambiados)
+
+    reloj.tick(FPS_MAXIMO)
+
+if MOSTRAR_TIEMPOS_CARGA:
+    for recurso, segundos in obtener_tiempos_carga().items():
+        print(f"{recurso}: {segundos * 1000:.1f} ms")
+
+detener_musica()
+detener_preparacion_partidas()
+cerrar_ejecutor()
 pygame.quit()
\ No newline at end of file
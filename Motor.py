@@ -0,0 +1,757 @@
+import random
+import threading
+import time
+from collections import deque
+from Constantes import *
+from Tablero import *
+from TableroInfinito import *
+from Generador import *
+
+
+# ===============================================================================
+# REGLAS
+# ===============================================================================
+
+# Medidas (filas, columnas, minas) del tablero personalizado. Empiezan como
+# TABLERO_PERSONALIZADO y se cambian con configurar_tablero_personalizado.
+tablero_personalizado = {'medidas': TABLERO_PERSONALIZADO}
+
+
+def configurar_tablero_personalizado(filas: int, columnas: int, minas: int) -> None:
+    """
+    Cambia las medidas del tablero personalizado, por ejemplo con los
+    argumentos de Main.py.
+
+    Recibe:
+        filas (int): Numero de filas, hasta MAXIMO_LADO_PERSONALIZADO.
+        columnas (int): Numero de columnas, hasta MAXIMO_LADO_PERSONALIZADO.
+        minas (int): Numero de minas. Tienen que quedar libres la casilla del
+                     primer click y sus vecinas.
+
+    Devuelve:
+        None
+
+    Lanza:
+        ValueError: Si las medidas no forman un tablero jugable.
+    """
+    if not (1 <= filas <= MAXIMO_LADO_PERSONALIZADO and 1 <= columnas <= MAXIMO_LADO_PERSONALIZADO):
+        raise ValueError(f"El tablero tiene que tener entre 1 y {MAXIMO_LADO_PERSONALIZADO} filas y columnas")
+
+    if not 0 <= minas <= max(filas * columnas - 9, 0):
+        raise ValueError(f"No se pueden colocar {minas} minas en un tablero de {filas}x{columnas}")
+
+    tablero_personalizado['medidas'] = (filas, columnas, minas)
+
+
+def configurar_dificultad(dificultad: int) -> tuple:
+    """
+    Configura la dificultad del juego de Buscaminas.
+
+    Recibe:
+        dificultad (int): Un entero que representa el nivel de dificultad.
+                        0 para facil, 1 para medio, 2 para dificil,
+                        DIFICULTAD_PERSONALIZADA para el tablero personalizado
+                        (ver configurar_tablero_personalizado).
+
+    Devuelve:
+        tuple: Una tupla que contiene tres enteros:
+            - filas (int): Numero de filas del tablero.
+            - columnas (int): Numero de columnas del tablero.
+            - minas (int): Numero de minas en el tablero.
+            
+    """
+    filas = 0
+    columnas = 0
+    minas = 0
+
+    if dificultad == 0:
+        filas, columnas, minas = (8, 8, 10)       
+    elif dificultad == 1:
+        filas, columnas, minas = (16, 16, 50)  
+    elif dificultad == DIFICULTAD_PERSONALIZADA:
+        filas, columnas, minas = tablero_personalizado['medidas']
+    else:
+        filas, columnas, minas = (24, 24, 120)  
+
+    return (filas, columnas, minas)
+
+
+def calcular_puntaje(nivel: int, tiempo: int, filas: int = None, columnas: int = None,
+                     minas: int = None) -> int:
+    """
+    Calcula el puntaje basado en el nivel de dificultad y el tiempo transcurrido.
+    A mayor tiempo, menor puntaje.
+
+    El tablero personalizado queda en la misma escala que los otros: vale lo que
+    valdria el dificil jugado al mismo ritmo (casillas por segundo), con una
+    base entre la del facil y la del dificil segun la densidad de minas. Nunca
+    supera esa base, como los otros nunca superan la suya.
+    
+    Recibe:
+        nivel (int): Nivel de dificultad:
+            - 0: Facil
+            - 1: Medio  
+            - 2: Dificil
+            - DIFICULTAD_PERSONALIZADA: Tablero a medida
+        tiempo (int): Tiempo transcurrido en segundos.
+        filas (int, opcional): Filas del tablero personalizado. Por defecto las configuradas.
+        columnas (int, opcional): Columnas del tablero personalizado. Por defecto las configuradas.
+        minas (int, opcional): Minas del tablero personalizado. Por defecto las configuradas.
+        
+    Devuelve:
+        int: Puntaje calculado segun la dificultad y tiempo (mayor tiempo = menor puntaje).
+        
+    """
+   
+    puntos_base = 0
+    
+    if nivel == 0:    
+        puntos_base = 1000
+    elif nivel == 1:   
+        puntos_base = 2000
+    elif nivel == 2:    
+        puntos_base = 3000
+    elif nivel == DIFICULTAD_PERSONALIZADA:
+        if filas is None:
+            filas = tablero_personalizado['medidas'][0]
+        if columnas is None:
+            columnas = tablero_personalizado['medidas'][1]
+        if minas is None:
+            minas = tablero_personalizado['medidas'][2]
+        # El dificil tiene 120 minas en 24 x 24 casillas.
+        casillas = max(filas * columnas, 1)
+        puntos_base = min(max(3000 * minas * 24 * 24 // (120 * casillas), 1000), 3000)
+    
+   
+    if tiempo <= 0:
+        tiempo = 1
+    
+    if nivel == DIFICULTAD_PERSONALIZADA:
+        puntaje = min(puntos_base * casillas // (24 * 24 * tiempo), puntos_base)
+    else:
+        puntaje = puntos_base // tiempo
+    
+    if puntaje < 1:
+        puntaje = 1
+    
+    return puntaje
+
+
+# ===============================================================================
+# MOTOR DEL JUEGO
+# ===============================================================================
+
+class MotorTablero:
+    """
+    Partida de Buscaminas sin interfaz: guarda el tablero y aplica las reglas.
+
+    No usa pygame, asi que sirve tanto para el juego como para simular o medir
+    partidas sin ventana. La interfaz solo traduce clicks a descubrir y
+    alternar_bandera y dibuja las casillas que estos devuelven.
+
+    Atributos:
+        tablero (dict): Tablero compacto (ver crear_tablero).
+        filas (int): Cantidad de filas del tablero.
+        columnas (int): Cantidad de columnas del tablero.
+        minas_totales (int): Cantidad de minas del tablero.
+        dificultad (int): Dificultad de la partida, o None si el tamaño es a medida.
+        semilla (int): Semilla con la que se generaron las minas.
+        zona_libre (bool): Si el primer click debe dejar libres tambien sus vecinas.
+        sin_adivinar (bool): Si el tablero se gana sin adivinar desde la casilla
+                             central, que empieza descubierta.
+        banderas_colocadas (int): Cantidad de banderas puestas.
+        primer_click (bool): True hasta que se descubre la primera casilla.
+        mina_explotada (tuple): (fila, columna) de la mina descubierta, o None.
+        inicio (float): Momento del primer click segun reloj, o None.
+        fin (float): Momento en que termino la partida segun reloj, o None.
+    """
+
+    def __init__(self, filas: int, columnas: int, minas: int, semilla: int = None,
+                 zona_libre: bool = PRIMER_CLICK_ZONA_LIBRE, dificultad: int = None,
+                 reloj=time.monotonic, sin_adivinar: bool = TABLEROS_SIN_ADIVINAR) -> None:
+        """
+        Crea una partida nueva con las minas ya colocadas.
+
+        Recibe:
+            filas (int): Numero de filas del tablero.
+            columnas (int): Numero de columnas del tablero.
+            minas (int): Numero de minas a colocar.
+            semilla (int, opcional): Semilla para reproducir un tablero. Si no se
+                                     indica se elige una al azar.
+            zona_libre (bool, opcional): Si el primer click debe dejar libres sus vecinas.
+            dificultad (int, opcional): Dificultad de la partida, para calcular el puntaje.
+            reloj (callable, opcional): Funcion que devuelve los segundos actuales.
+                                        Por defecto time.monotonic.
+            sin_adivinar (bool, opcional): Si el tablero se debe poder ganar sin adivinar
+                                           (ver generar_tablero_sin_adivinar).
+        """
+        if semilla is None:
+            semilla = random.getrandbits(32)
+
+        if sin_adivinar:
+            self.tablero = generar_tablero_sin_adivinar(filas, columnas, minas, filas // 2, columnas // 2, semilla)
+        else:
+            self.tablero = inicializar_matriz(filas, columnas, minas, semilla)
+            generar_matriz_numeros(self.tablero)
+
+        self.filas = filas
+        self.columnas = columnas
+        self.minas_totales = minas
+        self.dificultad = dificultad
+        self.semilla = semilla
+        self.zona_libre = zona_libre
+        self.sin_adivinar = sin_adivinar
+        self.reloj = reloj
+        self.banderas_colocadas = 0
+        self.primer_click = True
+        self.mina_explotada = None
+        self.inicio = None
+        self.fin = None
+
+        # El tablero sin adivinar ya tiene libre la casilla central: se descubre
+        # sin mover minas, y el cronometro arranca con el primer click del jugador.
+        if sin_adivinar:
+            descubrir_celda(self.tablero, filas // 2, columnas // 2)
+            self.primer_click = False
+
+    @classmethod
+    def desde_dificultad(cls, dificultad: int, semilla: int = None,
+                         sin_adivinar: bool = TABLEROS_SIN_ADIVINAR) -> 'MotorTablero':
+        """
+        Crea una partida con el tamaño y las minas de una dificultad.
+
+        Recibe:
+            dificultad (int): 0 para facil, 1 para medio, 2 para dificil.
+            semilla (int, opcional): Semilla para reproducir un tablero.
+            sin_adivinar (bool, opcional): Si el tablero se debe poder ganar sin adivinar.
+
+        Devuelve:
+            MotorTablero: Partida nueva.
+        """
+        filas, columnas, minas = configurar_dificultad(dificultad)
+
+        return cls(filas, columnas, minas, semilla, dificultad=dificultad, sin_adivinar=sin_adivinar)
+
+    def en_tablero(self, fila: int, columna: int) -> bool:
+        """
+        Indica si una posicion esta dentro del tablero.
+
+        Recibe:
+            fila (int): Fila de la casilla.
+            columna (int): Columna de la casilla.
+
+        Devuelve:
+            bool: True si la casilla existe.
+        """
+        return 0 <= fila < self.filas and 0 <= columna < self.columnas
+
+    def descubrir(self, fila: int, columna: int) -> list[tuple[int, int]]:
+        """
+        Descubre una casilla como si el jugador hiciera click en ella.
+
+        El primer click nunca es una mina (ver asegurar_primer_click) y pone en
+        marcha el cronometro. No hace nada si la partida termino, la casilla esta
+        fuera del tablero, ya esta descubierta o tiene bandera.
+
+        Recibe:
+            fila (int): Fila de la casilla.
+            columna (int): Columna de la casilla.
+
+        Devuelve:
+            List[tuple[int, int]]: Casillas que cambiaron, para redibujarlas.
+        """
+        if self.terminado() or not self.en_tablero(fila, columna):
+            return []
+
+        if esta_descubierta(self.tablero, fila, columna) or tiene_bandera(self.tablero, fila, columna):
+            return []
+
+        if self.primer_click:
+            asegurar_primer_click(self.tablero, fila, columna, self.zona_libre, self.semilla)
+            self.primer_click = False
+
+        if self.inicio is None:
+            self.inicio = self.reloj()
+
+        reveladas = descubrir_celda(self.tablero, fila, columna)
+
+        if es_mina(self.tablero, fila, columna):
+            self.mina_explotada = (fila, columna)
+            self.fin = self.reloj()
+        elif verificar_victoria(self.tablero):
+            self.fin = self.reloj()
+
+        return reveladas
+
+    def alternar_bandera(self, fila: int, columna: int) -> list[tuple[int, int]]:
+        """
+        Pone o saca la bandera de una casilla oculta.
+
+        Recibe:
+            fila (int): Fila de la casilla.
+            columna (int): Columna de la casilla.
+
+        Devuelve:
+            List[tuple[int, int]]: La casilla si cambio, o lista vacia si la partida
+                                   termino o la casilla esta fuera o descubierta.
+        """
+        if self.terminado() or not self.en_tablero(fila, columna):
+            return []
+
+        if esta_descubierta(self.tablero, fila, columna):
+            return []
+
+        if alternar_bandera(self.tablero, fila, columna):
+            self.banderas_colocadas += 1
+        else:
+            self.banderas_colocadas -= 1
+
+        return [(fila, columna)]
+
+    def gano(self) -> bool:
+        """
+        Devuelve:
+            bool: True si se descubrieron todas las casillas sin mina.
+        """
+        return self.mina_explotada is None and verificar_victoria(self.tablero)
+
+    def perdio(self) -> bool:
+        """
+        Devuelve:
+            bool: True si se descubrio una mina.
+        """
+        return self.mina_explotada is not None
+
+    def terminado(self) -> bool:
+        """
+        Devuelve:
+            bool: True si la partida se gano o se perdio.
+        """
+        return self.fin is not None
+
+    def cronometro_activo(self) -> bool:
+        """
+        Devuelve:
+            bool: True si la partida empezo y todavia no termino.
+        """
+        return self.inicio is not None and self.fin is None
+
+    def tiempo_transcurrido(self) -> float:
+        """
+        Devuelve:
+            float: Segundos desde el primer click hasta ahora, o hasta el final
+                   si la partida termino. 0 si todavia no empezo.
+        """
+        if self.inicio is None:
+            return 0.0
+
+        if self.fin is None:
+            return self.reloj() - self.inicio
+
+        return self.fin - self.inicio
+
+    def minas_restantes(self) -> int:
+        """
+        Devuelve:
+            int: Minas totales menos banderas colocadas.
+        """
+        return self.minas_totales - self.banderas_colocadas
+
+    def puntaje(self) -> int:
+        """
+        Devuelve:
+            int: Puntaje de la partida segun su dificultad y sus segundos completos
+                 (ver calcular_puntaje).
+        """
+        return calcular_puntaje(self.dificultad, int(self.tiempo_transcurrido()),
+                                self.filas, self.columnas, self.minas_totales)
+
+
+class MotorInfinito(MotorTablero):
+    """
+    Partida en el tablero infinito (ver crear_tablero_infinito).
+
+    Se usa igual que MotorTablero: las posiciones son las de un tablero de
+    LADO_TABLERO_INFINITO x LADO_TABLERO_INFINITO con el origen en el centro, y
+    tablero['celdas'] lee las casillas de los bloques, asi la interfaz la dibuja
+    sin cambios. La partida empieza con el origen descubierto y solo se pierde.
+
+    Atributos:
+        infinito (dict): Tablero infinito con los bloques.
+        centro (int): Fila y columna del origen en el tablero que ve la interfaz.
+        (y los de MotorTablero; minas_totales es None)
+    """
+
+    def __init__(self, semilla: int = None, densidad: float = DENSIDAD_MINAS_INFINITO,
+                 dificultad: int = DIFICULTAD_INFINITA, reloj=time.monotonic) -> None:
+        """
+        Crea una partida nueva en un tablero infinito.
+
+        Recibe:
+            semilla (int, opcional): Semilla para reproducir un tablero.
+            densidad (float, opcional): Fraccion de casillas con mina.
+            dificultad (int, opcional): Dificultad con la que se guarda el puntaje.
+            reloj (callable, opcional): Funcion que devuelve los segundos actuales.
+        """
+        self.infinito = crear_tablero_infinito(semilla, densidad)
+        self.centro = LADO_TABLERO_INFINITO // 2
+
+        self.tablero = {
+            'filas': LADO_TABLERO_INFINITO,
+            'columnas': LADO_TABLERO_INFINITO,
+            'celdas': CeldasInfinitas(self.infinito)
+        }
+
+        self.filas = LADO_TABLERO_INFINITO
+        self.columnas = LADO_TABLERO_INFINITO
+        self.minas_totales = None
+        self.dificultad = dificultad
+        self.semilla = self.infinito['semilla']
+        self.zona_libre = True
+        self.sin_adivinar = False
+        self.reloj = reloj
+        self.banderas_colocadas = 0
+        self.primer_click = True
+        self.mina_explotada = None
+        self.inicio = None
+        self.fin = None
+
+        descubrir_celda_infinita(self.infinito, 0, 0)
+
+    def descubrir(self, fila: int, columna: int) -> list[tuple[int, int]]:
+        """
+        Descubre una casilla como si el jugador hiciera click en ella. El primer
+        click pone en marcha el cronometro. Si una jugada anterior llego al
+        limite de casillas, cualquier click sigue descubriendo lo que falto,
+        aunque sea en una casilla ya descubierta.
+
+        Recibe:
+            fila (int): Fila de la casilla.
+            columna (int): Columna de la casilla.
+
+        Devuelve:
+            List[tuple[int, int]]: Casillas que cambiaron, para redibujarlas.
+        """
+        if self.terminado() or not self.en_tablero(fila, columna):
+            return []
+
+        valor = obtener_celda_infinita(self.infinito, fila - self.centro, columna - self.centro)
+        ocupada = valor & (BIT_DESCUBIERTA | BIT_BANDERA)
+        if ocupada and not self.infinito['pendientes']:
+            return []
+
+        if self.primer_click:
+            self.primer_click = False
+            self.inicio = self.reloj()
+
+        reveladas = descubrir_celda_infinita(self.infinito, fila - self.centro, columna - self.centro)
+
+        if not ocupada and valor & BIT_MINA:
+            self.mina_explotada = (fila, columna)
+            self.fin = self.reloj()
+
+        return [(f + self.centro, c + self.centro) for f, c in reveladas]
+
+    def alternar_bandera(self, fila: int, columna: int) -> list[tuple[int, int]]:
+        """
+        Pone o saca la bandera de una casilla oculta.
+
+        Recibe:
+            fila (int): Fila de la casilla.
+            columna (int): Columna de la casilla.
+
+        Devuelve:
+            List[tuple[int, int]]: La casilla si cambio, o lista vacia si no.
+        """
+        if self.terminado() or not self.en_tablero(fila, columna):
+            return []
+
+        if obtener_celda_infinita(self.infinito, fila - self.centro, columna - self.centro) & BIT_DESCUBIERTA:
+            return []
+
+        if alternar_bandera_infinita(self.infinito, fila - self.centro, columna - self.centro):
+            self.banderas_colocadas += 1
+        else:
+            self.banderas_colocadas -= 1
+
+        return [(fila, columna)]
+
+    def gano(self) -> bool:
+        """
+        Devuelve:
+            bool: Siempre False: el tablero infinito no se termina de descubrir.
+        """
+        return False
+
+    def minas_restantes(self) -> int:
+        """
+        Devuelve:
+            None: El tablero infinito no tiene una cantidad fija de minas.
+        """
+        return None
+
+    def puntaje(self) -> int:
+        """
+        Devuelve:
+            int: Casillas sin mina descubiertas en la partida.
+        """
+        return self.infinito['descubiertas']
+
+
+def crear_motor(dificultad: int, semilla: int = None) -> MotorTablero:
+    """
+    Crea una partida de una dificultad, infinita si es DIFICULTAD_INFINITA.
+
+    Recibe:
+        dificultad (int): Dificultad de la partida.
+        semilla (int, opcional): Semilla para reproducir un tablero.
+
+    Devuelve:
+        MotorTablero: Partida nueva.
+    """
+    if dificultad == DIFICULTAD_INFINITA:
+        return MotorInfinito(semilla)
+
+    return MotorTablero.desde_dificultad(dificultad, semilla)
+
+
+# ===============================================================================
+# PARTIDAS PREPARADAS
+# ===============================================================================
+
+# Partidas listas para empezar, por dificultad, que llena un hilo en segundo
+# plano. 'fijas' son las dificultades que siempre se preparan; la de
+# 'prioridad' (la elegida) se prepara tambien aunque no sea fija. Todo se lee
+# y se modifica con la condicion tomada.
+partidas_preparadas = {
+    'condicion': threading.Condition(),
+    'colas': {},
+    'fijas': [],
+    'estadisticas': {},
+    'prioridad': 0,
+    'hilo': None,
+    'activo': False
+}
+
+
+def estadisticas_dificultad(dificultad: int) -> dict:
+    """
+    Devuelve los contadores de partidas preparadas de una dificultad, creandolos
+    si hace falta. Se debe llamar con la condicion tomada.
+
+    Recibe:
+        dificultad (int): Dificultad.
+
+    Devuelve:
+        dict: Contadores (ver obtener_estadisticas_partidas).
+    """
+    return partidas_preparadas['estadisticas'].setdefault(
+        dificultad, {'aciertos': 0, 'fallos': 0, 'generadas': 0, 'segundos_fallos': 0.0,
+                     'errores': 0, 'ultimo_error': None})
+
+
+def elegir_dificultad_a_preparar(tamaño: int) -> int:
+    """
+    Elige que dificultad necesita una partida preparada: la de prioridad si le
+    falta alguna, y si no la fija que tiene menos. Se debe llamar con la condicion tomada.
+
+    Recibe:
+        tamaño (int): Partidas por dificultad que se quieren tener listas.
+
+    Devuelve:
+        int: Dificultad, o None si todas las colas estan llenas.
+    """
+    colas = partidas_preparadas['colas']
+    prioridad = partidas_preparadas['prioridad']
+
+    if len(colas[prioridad]) < tamaño:
+        return prioridad
+
+    dificultad = min(partidas_preparadas['fijas'], key=lambda d: len(colas[d]))
+
+    if len(colas[dificultad]) < tamaño:
+        return dificultad
+
+    return None
+
+
+def preparar_partidas(tamaño: int) -> None:
+    """
+    Trabajo del hilo de partidas preparadas: genera partidas mientras alguna
+    cola tenga lugar y espera cuando estan todas llenas. Si una partida falla al
+    generarse lo anota en las estadisticas y sigue despues de ESPERA_TRAS_ERROR_PARTIDAS.
+
+    Recibe:
+        tamaño (int): Partidas por dificultad que se quieren tener listas.
+
+    Devuelve:
+        None
+    """
+    condicion = partidas_preparadas['condicion']
+
+    while True:
+        with condicion:
+            dificultad = None
+            while partidas_preparadas['activo']:
+                dificultad = elegir_dificultad_a_preparar(tamaño)
+                if dificultad is not None:
+                    break
+                condicion.wait()
+
+            if not partidas_preparadas['activo']:
+                return
+
+        try:
+            partida = crear_motor(dificultad)
+        except Exception as error:
+            with condicion:
+                contadores = estadisticas_dificultad(dificultad)
+                contadores['errores'] += 1
+                contadores['ultimo_error'] = repr(error)
+                condicion.wait_for(lambda: not partidas_preparadas['activo'], ESPERA_TRAS_ERROR_PARTIDAS)
+            continue
+
+        with condicion:
+            # Si se detuvo mientras generaba, la busqueda pudo cortarse antes de
+            # tiempo y la partida no se guarda.
+            if not partidas_preparadas['activo']:
+                return
+
+            partidas_preparadas['colas'][dificultad].append(partida)
+            estadisticas_dificultad(dificultad)['generadas'] += 1
+
+
+def iniciar_preparacion_partidas(dificultades: list[int] = None, tamaño: int = TAMAÑO_COLA_PARTIDAS) -> None:
+    """
+    Empieza a generar partidas en segundo plano para que obtener_partida las
+    devuelva enseguida.
+
+    El tablero personalizado puede ser enorme y el infinito se arma enseguida,
+    asi que por defecto no se preparan: solo mientras estan elegidos (ver
+    priorizar_dificultad).
+
+    Recibe:
+        dificultades (List[int], opcional): Dificultades que se preparan siempre.
+                                            Por defecto las de NOMBRES_DIFICULTAD
+                                            menos la personalizada y la infinita.
+        tamaño (int, opcional): Partidas listas por dificultad.
+
+    Devuelve:
+        None
+    """
+    if dificultades is None:
+        dificultades = [dificultad for dificultad in NOMBRES_DIFICULTAD
+                        if dificultad not in (DIFICULTAD_PERSONALIZADA, DIFICULTAD_INFINITA)]
+
+    with partidas_preparadas['condicion']:
+        if partidas_preparadas['activo']:
+            return
+
+        for dificultad in dificultades:
+            partidas_preparadas['colas'].setdefault(dificultad, deque())
+            estadisticas_dificultad(dificultad)
+
+        partidas_preparadas['fijas'] = list(dificultades)
+        partidas_preparadas['prioridad'] = dificultades[0]
+        partidas_preparadas['activo'] = True
+
+    hilo = threading.Thread(target=preparar_partidas, args=(tamaño,), name="preparar_partidas", daemon=True)
+    partidas_preparadas['hilo'] = hilo
+    hilo.start()
+
+
+def detener_preparacion_partidas() -> None:
+    """
+    Detiene el hilo de partidas preparadas. Si esta buscando un tablero sin
+    adivinar corta la busqueda, asi no hay que esperarla.
+
+    Devuelve:
+        None
+    """
+    condicion = partidas_preparadas['condicion']
+
+    with condicion:
+        partidas_preparadas['activo'] = False
+        condicion.notify_all()
+
+    hilo = partidas_preparadas['hilo']
+    if hilo is not None:
+        cancelar_busquedas()
+        hilo.join()
+        cancelar_busquedas(False)
+
+    partidas_preparadas['hilo'] = None
+
+
+def priorizar_dificultad(dificultad: int) -> None:
+    """
+    Hace que la proxima partida que se prepare sea de esta dificultad, por
+    ejemplo al elegirla en el menu. Si no es de las fijas se empieza a preparar
+    ahora y deja de prepararse cuando se elige otra.
+
+    Recibe:
+        dificultad (int): Dificultad elegida.
+
+    Devuelve:
+        None
+    """
+    with partidas_preparadas['condicion']:
+        if partidas_preparadas['activo'] and dificultad in NOMBRES_DIFICULTAD:
+            partidas_preparadas['colas'].setdefault(dificultad, deque())
+            estadisticas_dificultad(dificultad)
+            partidas_preparadas['prioridad'] = dificultad
+            partidas_preparadas['condicion'].notify_all()
+
+
+def obtener_partida(dificultad: int) -> MotorTablero:
+    """
+    Devuelve una partida nueva de una dificultad, sacandola de las preparadas
+    si hay alguna lista y generandola en el momento si no.
+
+    Recibe:
+        dificultad (int): Dificultad de la partida.
+
+    Devuelve:
+        MotorTablero: Partida sin empezar.
+    """
+    condicion = partidas_preparadas['condicion']
+
+    with condicion:
+        cola = partidas_preparadas['colas'].get(dificultad)
+        preparada = cola.popleft() if cola else None
+        priorizar_dificultad(dificultad)
+
+        if preparada is not None:
+            estadisticas_dificultad(dificultad)['aciertos'] += 1
+            return preparada
+
+    inicio = time.perf_counter()
+    partida = crear_motor(dificultad)
+    duracion = time.perf_counter() - inicio
+
+    with condicion:
+        contadores = estadisticas_dificultad(dificultad)
+        contadores['fallos'] += 1
+        contadores['segundos_fallos'] += duracion
+
+    return partida
+
+
+def obtener_estadisticas_partidas() -> dict:
+    """
+    Devuelve cuantas veces habia una partida preparada al pedirla, para elegir
+    el tamaño de las colas.
+
+    Devuelve:
+        dict: Por dificultad, un dict con:
+            - aciertos (int): Partidas que ya estaban listas.
+            - fallos (int): Partidas que se generaron en el momento.
+            - generadas (int): Partidas generadas en segundo plano.
+            - segundos_fallos (float): Tiempo total esperando las que se generaron en el momento.
+            - errores (int): Partidas que fallaron al generarse en segundo plano.
+            - ultimo_error (str): El ultimo de esos errores, o None.
+            - en_cola (int): Partidas listas ahora.
+    """
+    with partidas_preparadas['condicion']:
+        return {dificultad: dict(contadores, en_cola=len(partidas_preparadas['colas'].get(dificultad, ())))
+                for dificultad, contadores in partidas_preparadas['estadisticas'].items()}
@@ -0,0 +1,649 @@
+import os
+import sqlite3
+import time
+from Constantes import *
+
+
+# Mejores puntajes (instantanea + registro), junto con la firma (fecha de
+# modificacion y tamaño) que tenian los archivos al leerlos, el momento de la
+# ultima revision, cuantas lineas tiene el registro sin compactar y su generacion.
+cache_puntajes = {
+    'firma': None,
+    'revisado': None,
+    'puntajes': [],
+    'registros': 0,
+    'registro_completo': True,
+    'generacion': 0
+}
+
+# Conexion abierta a la base SQLite de puntajes (si USAR_SQLITE es True).
+conexion_puntajes = {'conexion': None}
+
+
+# ===============================================================================
+# ARCHIVOS DE PUNTAJES
+# ===============================================================================
+
+def obtener_firma_archivo(ruta: str) -> tuple:
+    """
+    Devuelve la fecha de modificacion y el tamaño de un archivo.
+
+    Recibe:
+        ruta (str): Ruta del archivo.
+
+    Devuelve:
+        tuple: (fecha de modificacion en nanosegundos, tamaño en bytes),
+               o None si el archivo no existe.
+    """
+    try:
+        estado = os.stat(ruta)
+    except FileNotFoundError:
+        return None
+
+    return (estado.st_mtime_ns, estado.st_size)
+
+
+def convertir_linea_puntaje(linea: str) -> tuple:
+    """
+    Convierte una linea del CSV de puntajes en un registro.
+
+    Acepta el formato actual (nombre, puntaje, tiempo, dificultad, fecha) y el
+    formato anterior de tres campos (nombre, puntaje, tiempo).
+
+    Recibe:
+        linea (str): Linea del archivo.
+
+    Devuelve:
+        tuple: (nombre, puntaje, tiempo, dificultad, fecha), con dificultad None
+               si no se conoce y fecha 0 en el formato anterior. None si la linea
+               no es un puntaje valido (encabezado, linea vacia o cortada).
+    """
+    partes = linea.strip().split(',')
+
+    if len(partes) == 3 and partes[1].isdigit() and partes[2].isdigit():
+        return (partes[0], int(partes[1]), int(partes[2]), None, 0)
+
+    if (len(partes) == 5 and partes[1].isdigit() and partes[2].isdigit()
+            and (partes[3] == '' or partes[3].isdigit()) and partes[4].isdigit()):
+        dificultad = int(partes[3]) if partes[3] else None
+        return (partes[0], int(partes[1]), int(partes[2]), dificultad, int(partes[4]))
+
+    return None
+
+
+def formatear_puntaje(registro: tuple) -> str:
+    """
+    Convierte un registro de puntaje en una linea del CSV.
+
+    Recibe:
+        registro (tuple): (nombre, puntaje, tiempo, dificultad, fecha).
+
+    Devuelve:
+        str: Linea terminada en salto de linea.
+    """
+    nombre, puntaje, tiempo, dificultad, fecha = registro
+    texto_dificultad = '' if dificultad is None else str(dificultad)
+
+    return f"{nombre},{puntaje},{tiempo},{texto_dificultad},{fecha}\n"
+
+
+def leer_archivo_puntajes(ruta: str) -> list[tuple]:
+    """
+    Lee y valida los puntajes de un archivo CSV, ignorando las lineas invalidas.
+
+    Recibe:
+        ruta (str): Ruta del archivo CSV.
+
+    Devuelve:
+        List[tuple]: Registros (nombre, puntaje, tiempo, dificultad, fecha) en el
+                     orden del archivo. Retorna lista vacia si el archivo no existe.
+    """
+    puntajes = []
+
+    if os.path.exists(ruta):
+        with open(ruta, 'r') as archivo:
+            for linea in archivo:
+                registro = convertir_linea_puntaje(linea)
+                if registro is not None:
+                    puntajes.append(registro)
+
+    return puntajes
+
+
+def leer_generacion_puntajes(ruta: str) -> int:
+    """
+    Lee la marca de generacion (MARCA_GENERACION_PUNTAJES) de un archivo de
+    puntajes. Esta en la primera linea del registro o en la segunda de la instantanea.
+
+    Recibe:
+        ruta (str): Ruta del archivo.
+
+    Devuelve:
+        int: Numero de la marca, o None si el archivo no existe o no la tiene.
+    """
+    if not os.path.exists(ruta):
+        return None
+
+    with open(ruta, 'r') as archivo:
+        for _ in range(2):
+            partes = archivo.readline().strip().split(',')
+            if len(partes) == 2 and partes[0] == MARCA_GENERACION_PUNTAJES and partes[1].isdigit():
+                return int(partes[1])
+
+    return None
+
+
+def leer_archivos_puntajes() -> tuple:
+    """
+    Lee la instantanea y el registro, sin sumar el registro si la instantanea
+    ya lo incluye.
+
+    Eso pasa si el juego se cerro durante una compactacion, despues de escribir
+    la instantanea y antes de vaciar el registro. La instantanea anota la
+    generacion del registro que incluyo; un registro sin marca es de la
+    generacion 0 y una instantanea sin marca no incluye ninguno.
+
+    Devuelve:
+        tuple: (registros de la instantanea, registros del registro, generacion
+               del registro, True si la instantanea ya lo incluye).
+    """
+    instantanea = leer_archivo_puntajes(ARCHIVO_PUNTAJES)
+    incluida = leer_generacion_puntajes(ARCHIVO_PUNTAJES)
+    generacion = leer_generacion_puntajes(ARCHIVO_REGISTRO_PUNTAJES) or 0
+
+    if incluida is not None and generacion <= incluida:
+        return instantanea, [], generacion, True
+
+    return instantanea, leer_archivo_puntajes(ARCHIVO_REGISTRO_PUNTAJES), generacion, False
+
+
+def es_puntaje_infinito(registro: tuple) -> bool:
+    """
+    Indica si un registro es de una partida infinita. Su puntaje son las
+    casillas descubiertas, asi que no se compara con los que dependen del tiempo.
+
+    Recibe:
+        registro (tuple): (nombre, puntaje, tiempo, dificultad, fecha).
+
+    Devuelve:
+        bool: True si la dificultad es DIFICULTAD_INFINITA.
+    """
+    return registro[3] == DIFICULTAD_INFINITA
+
+
+def ordenar_puntajes(puntajes: list[tuple]) -> list[tuple]:
+    """
+    Deja los MAXIMO_PUNTAJES mejores registros de las partidas comunes y, por
+    separado, los MAXIMO_PUNTAJES mejores de las infinitas.
+
+    Recibe:
+        puntajes (List[tuple]): Registros en orden de llegada.
+
+    Devuelve:
+        List[tuple]: Mejores registros comunes y despues los infinitos, cada
+                     grupo ordenado por puntaje. Ante un empate queda primero
+                     el mas antiguo.
+    """
+    ordenados = sorted(puntajes, key=lambda x: x[1], reverse=True)
+    comunes = [registro for registro in ordenados if not es_puntaje_infinito(registro)]
+    infinitos = [registro for registro in ordenados if es_puntaje_infinito(registro)]
+
+    return comunes[:MAXIMO_PUNTAJES] + infinitos[:MAXIMO_PUNTAJES]
+
+
+def sincronizar_directorio(ruta: str) -> None:
+    """
+    Fuerza a disco la entrada de directorio de un archivo recien renombrado.
+
+    En sistemas donde no se puede abrir un directorio (Windows) no hace nada.
+
+    Recibe:
+        ruta (str): Ruta del archivo.
+
+    Devuelve:
+        None
+    """
+    directorio = os.path.dirname(os.path.abspath(ruta))
+
+    try:
+        descriptor = os.open(directorio, os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+def escribir_archivo_atomico(ruta: str, contenido: str) -> None:
+    """
+    Reemplaza un archivo de forma que, si el juego se corta a mitad de camino,
+    queda el archivo anterior completo o el nuevo completo, nunca uno a medias.
+
+    Escribe en un archivo temporal, lo fuerza a disco y lo renombra sobre el original.
+
+    Recibe:
+        ruta (str): Ruta del archivo a reemplazar.
+        contenido (str): Contenido completo del archivo nuevo.
+
+    Devuelve:
+        None
+    """
+    ruta_temporal = ruta + '.tmp'
+
+    with open(ruta_temporal, 'w') as archivo:
+        archivo.write(contenido)
+        archivo.flush()
+        os.fsync(archivo.fileno())
+
+    os.replace(ruta_temporal, ruta)
+    sincronizar_directorio(ruta)
+
+
+def agregar_a_registro(registro: tuple) -> None:
+    """
+    Agrega un puntaje al final del registro y lo fuerza a disco.
+
+    Si la ultima linea del registro quedo cortada por un corte anterior,
+    primero agrega un salto de linea para no mezclarla con el puntaje nuevo.
+
+    Recibe:
+        registro (tuple): (nombre, puntaje, tiempo, dificultad, fecha).
+
+    Devuelve:
+        None
+    """
+    linea = formatear_puntaje(registro)
+
+    if not cache_puntajes['registro_completo']:
+        linea = '\n' + linea
+
+    with open(ARCHIVO_REGISTRO_PUNTAJES, 'a') as archivo:
+        archivo.write(linea)
+        archivo.flush()
+        os.fsync(archivo.fileno())
+
+    cache_puntajes['registro_completo'] = True
+    cache_puntajes['registros'] += 1
+
+
+def vaciar_registro(generacion: int) -> None:
+    """
+    Deja el registro vacio, con solo la marca de su nueva generacion.
+
+    Recibe:
+        generacion (int): Generacion del registro nuevo.
+
+    Devuelve:
+        None
+    """
+    with open(ARCHIVO_REGISTRO_PUNTAJES, 'w') as archivo:
+        archivo.write(f"{MARCA_GENERACION_PUNTAJES},{generacion}\n")
+        archivo.flush()
+        os.fsync(archivo.fileno())
+
+    cache_puntajes['registros'] = 0
+    cache_puntajes['registro_completo'] = True
+    cache_puntajes['generacion'] = generacion
+
+
+def compactar_puntajes() -> None:
+    """
+    Pasa los mejores puntajes a la instantanea (ARCHIVO_PUNTAJES) y vacia el registro.
+
+    La instantanea se escribe de forma atomica y anota la generacion del
+    registro que incluye; si el juego se corta antes de vaciar el registro, al
+    leer se ve que ya esta incluido (ver leer_archivos_puntajes).
+
+    Devuelve:
+        None
+    """
+    actualizar_cache_puntajes(forzar=True)
+
+    generacion = cache_puntajes['generacion']
+    contenido = "Nombre,Puntaje,Tiempo,Dificultad,Fecha\n"
+    contenido += f"{MARCA_GENERACION_PUNTAJES},{generacion}\n"
+    for registro in cache_puntajes['puntajes']:
+        contenido += formatear_puntaje(registro)
+
+    escribir_archivo_atomico(ARCHIVO_PUNTAJES, contenido)
+    vaciar_registro(generacion + 1)
+
+    cache_puntajes['firma'] = (obtener_firma_archivo(ARCHIVO_PUNTAJES),
+                               obtener_firma_archivo(ARCHIVO_REGISTRO_PUNTAJES))
+
+
+def actualizar_cache_puntajes(forzar: bool = False) -> None:
+    """
+    Vuelve a leer los archivos de puntajes (o la base SQLite, si USAR_SQLITE es True)
+    solo si otro proceso los modifico.
+
+    Para no tocar el disco en cada cuadro, las firmas de los archivos se revisan
+    como mucho una vez cada INTERVALO_REVISION_PUNTAJES segundos, salvo que se fuerce.
+
+    Recibe:
+        forzar (bool, opcional): Si es True revisa las firmas aunque no haya pasado el intervalo.
+
+    Devuelve:
+        None
+    """
+    ahora = time.monotonic()
+    revisado = cache_puntajes['revisado']
+
+    if not forzar and revisado is not None and ahora - revisado < INTERVALO_REVISION_PUNTAJES:
+        return
+
+    cache_puntajes['revisado'] = ahora
+
+    if USAR_SQLITE:
+        conexion = obtener_conexion_puntajes()
+        firma = conexion.execute("PRAGMA data_version").fetchone()[0]
+        if revisado is None or firma != cache_puntajes['firma']:
+            cache_puntajes['puntajes'] = (consultar_mejores_puntajes(conexion)
+                                          + consultar_mejores_puntajes(conexion, DIFICULTAD_INFINITA))
+            cache_puntajes['firma'] = firma
+        return
+
+    firma = (obtener_firma_archivo(ARCHIVO_PUNTAJES), obtener_firma_archivo(ARCHIVO_REGISTRO_PUNTAJES))
+
+    if revisado is None or firma != cache_puntajes['firma']:
+        instantanea, registro, generacion, incluido = leer_archivos_puntajes()
+
+        if incluido:
+            # Termina la compactacion cortada, asi los puntajes nuevos no se
+            # agregan a un registro que se ignora.
+            vaciar_registro(generacion + 1)
+            firma = (firma[0], obtener_firma_archivo(ARCHIVO_REGISTRO_PUNTAJES))
+            generacion += 1
+
+        registro_completo = True
+        if firma[1] is not None and firma[1][1] > 0:
+            with open(ARCHIVO_REGISTRO_PUNTAJES, 'rb') as archivo:
+                archivo.seek(-1, os.SEEK_END)
+                registro_completo = archivo.read(1) == b'\n'
+
+        cache_puntajes['puntajes'] = ordenar_puntajes(instantanea + registro)
+        cache_puntajes['registros'] = len(registro)
+        cache_puntajes['registro_completo'] = registro_completo
+        cache_puntajes['generacion'] = generacion
+        cache_puntajes['firma'] = firma
+
+
+# ===============================================================================
+# BASE DE DATOS SQLITE
+# ===============================================================================
+
+def abrir_base_puntajes(ruta: str = None) -> sqlite3.Connection:
+    """
+    Abre (y si no existe crea) la base SQLite que guarda todas las partidas terminadas.
+
+    Los indices por (dificultad, puntaje) y por (nombre, dificultad, puntaje)
+    permiten consultar los mejores puntajes de una dificultad, el mejor puntaje
+    de un jugador y su posicion sin ordenar toda la tabla. Si la base es nueva
+    se importan los puntajes de los archivos CSV.
+
+    Recibe:
+        ruta (str, opcional): Ruta de la base. Por defecto ARCHIVO_BASE_PUNTAJES.
+
+    Devuelve:
+        sqlite3.Connection: Conexion a la base.
+    """
+    if ruta is None:
+        ruta = ARCHIVO_BASE_PUNTAJES
+
+    conexion = sqlite3.connect(ruta)
+    conexion.execute("PRAGMA journal_mode=WAL")
+    conexion.execute("PRAGMA synchronous=NORMAL")
+
+    nueva = conexion.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'partidas'"
+    ).fetchone()[0] == 0
+
+    with conexion:
+        conexion.execute("""
+            CREATE TABLE IF NOT EXISTS partidas (
+                id INTEGER PRIMARY KEY,
+                nombre TEXT NOT NULL,
+                puntaje INTEGER NOT NULL,
+                tiempo INTEGER NOT NULL,
+                dificultad INTEGER,
+                fecha INTEGER NOT NULL
+            )
+        """)
+        conexion.execute("CREATE INDEX IF NOT EXISTS partidas_dificultad_puntaje "
+                         "ON partidas (dificultad, puntaje DESC)")
+        conexion.execute("CREATE INDEX IF NOT EXISTS partidas_nombre_dificultad "
+                         "ON partidas (nombre, dificultad, puntaje DESC)")
+        conexion.execute("CREATE INDEX IF NOT EXISTS partidas_puntaje "
+                         "ON partidas (puntaje DESC)")
+
+    if nueva:
+        instantanea, registro, _, _ = leer_archivos_puntajes()
+        with conexion:
+            conexion.executemany("INSERT INTO partidas (nombre, puntaje, tiempo, dificultad, fecha) "
+                                 "VALUES (?, ?, ?, ?, ?)", instantanea + registro)
+
+    return conexion
+
+
+def obtener_conexion_puntajes() -> sqlite3.Connection:
+    """
+    Devuelve la conexion a la base de puntajes, abriendola la primera vez.
+
+    Devuelve:
+        sqlite3.Connection: Conexion a ARCHIVO_BASE_PUNTAJES.
+    """
+    if conexion_puntajes['conexion'] is None:
+        conexion_puntajes['conexion'] = abrir_base_puntajes()
+
+    return conexion_puntajes['conexion']
+
+
+def registrar_partida(conexion: sqlite3.Connection, registro: tuple) -> None:
+    """
+    Guarda una partida terminada en la base.
+
+    Recibe:
+        conexion (sqlite3.Connection): Conexion a la base de puntajes.
+        registro (tuple): (nombre, puntaje, tiempo, dificultad, fecha).
+
+    Devuelve:
+        None
+    """
+    with conexion:
+        conexion.execute("INSERT INTO partidas (nombre, puntaje, tiempo, dificultad, fecha) "
+                         "VALUES (?, ?, ?, ?, ?)", registro)
+
+
+def consultar_mejores_puntajes(conexion: sqlite3.Connection, dificultad: int = None,
+                               cantidad: int = MAXIMO_PUNTAJES) -> list[tuple]:
+    """
+    Devuelve los mejores puntajes, de todas las dificultades o de una sola.
+
+    Recibe:
+        conexion (sqlite3.Connection): Conexion a la base de puntajes.
+        dificultad (int, opcional): Dificultad a consultar. None para todas menos
+                                    la infinita (ver es_puntaje_infinito).
+        cantidad (int, opcional): Cantidad maxima de puntajes. Por defecto MAXIMO_PUNTAJES.
+
+    Devuelve:
+        List[tuple]: Registros (nombre, puntaje, tiempo, dificultad, fecha) de mayor
+                     a menor puntaje; ante un empate primero el mas antiguo.
+    """
+    if dificultad is None:
+        cursor = conexion.execute("SELECT nombre, puntaje, tiempo, dificultad, fecha FROM partidas "
+                                  "WHERE dificultad IS NOT ? ORDER BY puntaje DESC, id LIMIT ?",
+                                  (DIFICULTAD_INFINITA, cantidad))
+    else:
+        cursor = conexion.execute("SELECT nombre, puntaje, tiempo, dificultad, fecha FROM partidas "
+                                  "WHERE dificultad = ? ORDER BY puntaje DESC, id LIMIT ?",
+                                  (dificultad, cantidad))
+
+    return cursor.fetchall()
+
+
+def consultar_mejor_puntaje_jugador(conexion: sqlite3.Connection, nombre: str, dificultad: int) -> tuple:
+    """
+    Devuelve la mejor partida de un jugador en una dificultad.
+
+    Recibe:
+        conexion (sqlite3.Connection): Conexion a la base de puntajes.
+        nombre (str): Nombre del jugador.
+        dificultad (int): Dificultad a consultar.
+
+    Devuelve:
+        tuple: (nombre, puntaje, tiempo, dificultad, fecha), o None si el jugador
+               no tiene partidas en esa dificultad.
+    """
+    return conexion.execute("SELECT nombre, puntaje, tiempo, dificultad, fecha FROM partidas "
+                            "WHERE nombre = ? AND dificultad = ? ORDER BY puntaje DESC LIMIT 1",
+                            (nombre, dificultad)).fetchone()
+
+
+def consultar_posicion_jugador(conexion: sqlite3.Connection, nombre: str, dificultad: int) -> int:
+    """
+    Devuelve en que posicion de la tabla de una dificultad esta el mejor puntaje de un jugador.
+
+    La posicion es 1 mas la cantidad de partidas de esa dificultad con un puntaje
+    mayor, contadas recorriendo el indice (dificultad, puntaje).
+
+    Recibe:
+        conexion (sqlite3.Connection): Conexion a la base de puntajes.
+        nombre (str): Nombre del jugador.
+        dificultad (int): Dificultad a consultar.
+
+    Devuelve:
+        int: Posicion empezando en 1, o None si el jugador no tiene partidas en esa dificultad.
+    """
+    mejor = consultar_mejor_puntaje_jugador(conexion, nombre, dificultad)
+
+    if mejor is None:
+        return None
+
+    mayores = conexion.execute("SELECT COUNT(*) FROM partidas WHERE dificultad = ? AND puntaje > ?",
+                               (dificultad, mejor[1])).fetchone()[0]
+
+    return mayores + 1
+
+
+def importar_csv_a_sqlite(conexion: sqlite3.Connection, ruta_csv: str) -> int:
+    """
+    Importa a la base los puntajes de un CSV (instantanea o registro, de cualquier formato).
+
+    Las partidas que ya estan en la base no se vuelven a agregar.
+
+    Recibe:
+        conexion (sqlite3.Connection): Conexion a la base de puntajes.
+        ruta_csv (str): Ruta del archivo CSV.
+
+    Devuelve:
+        int: Cantidad de partidas agregadas.
+    """
+    agregadas = 0
+
+    with conexion:
+        for registro in leer_archivo_puntajes(ruta_csv):
+            existe = conexion.execute("SELECT 1 FROM partidas WHERE nombre = ? AND dificultad IS ? "
+                                      "AND puntaje = ? AND tiempo = ? AND fecha = ? LIMIT 1",
+                                      (registro[0], registro[3], registro[1], registro[2],
+                                       registro[4])).fetchone()
+            if existe is None:
+                conexion.execute("INSERT INTO partidas (nombre, puntaje, tiempo, dificultad, fecha) "
+                                 "VALUES (?, ?, ?, ?, ?)", registro)
+                agregadas += 1
+
+    return agregadas
+
+
+def exportar_sqlite_a_csv(conexion: sqlite3.Connection, ruta_csv: str, dificultad: int = None) -> int:
+    """
+    Exporta las partidas de la base a un CSV con el formato de ARCHIVO_PUNTAJES,
+    de mayor a menor puntaje.
+
+    Recibe:
+        conexion (sqlite3.Connection): Conexion a la base de puntajes.
+        ruta_csv (str): Ruta del archivo a escribir (se reemplaza de forma atomica).
+        dificultad (int, opcional): Exportar solo esa dificultad. None para todas.
+
+    Devuelve:
+        int: Cantidad de partidas exportadas.
+    """
+    if dificultad is None:
+        cursor = conexion.execute("SELECT nombre, puntaje, tiempo, dificultad, fecha FROM partidas "
+                                  "ORDER BY puntaje DESC, id")
+    else:
+        cursor = conexion.execute("SELECT nombre, puntaje, tiempo, dificultad, fecha FROM partidas "
+                                  "WHERE dificultad = ? ORDER BY puntaje DESC, id", (dificultad,))
+
+    lineas = ["Nombre,Puntaje,Tiempo,Dificultad,Fecha\n"]
+    for registro in cursor:
+        lineas.append(formatear_puntaje(registro))
+
+    escribir_archivo_atomico(ruta_csv, ''.join(lineas))
+
+    return len(lineas) - 1
+
+
+# ===============================================================================
+# PUNTAJES
+# ===============================================================================
+
+def guardar_puntaje(nombre: str, puntaje: int, tiempo: int, dificultad: int = None) -> None:
+    """
+    Guarda un puntaje agregando una linea al registro de puntajes.
+
+    Guardar cuesta siempre una sola escritura pequeña. Cada
+    MAXIMO_REGISTROS_SIN_COMPACTAR puntajes el registro se compacta en la
+    instantanea ordenada (ver compactar_puntajes). Si USAR_SQLITE es True la
+    partida se guarda en la base SQLite, que conserva todo el historial.
+
+    Recibe:
+        nombre (str): Nombre del jugador. Las comas se reemplazan por espacios.
+        puntaje (int): Puntaje obtenido.
+        tiempo (int): Tiempo transcurrido en segundos.
+        dificultad (int, opcional): Nivel de dificultad de la partida.
+
+    Devuelve:
+        None
+    """
+    actualizar_cache_puntajes(forzar=True)
+
+    registro = (nombre.replace(',', ' '), puntaje, tiempo, dificultad, int(time.time()))
+
+    if USAR_SQLITE:
+        registrar_partida(obtener_conexion_puntajes(), registro)
+        cache_puntajes['puntajes'] = ordenar_puntajes(cache_puntajes['puntajes'] + [registro])
+        cache_puntajes['revisado'] = time.monotonic()
+        return
+
+    agregar_a_registro(registro)
+
+    cache_puntajes['puntajes'] = ordenar_puntajes(cache_puntajes['puntajes'] + [registro])
+    cache_puntajes['firma'] = (cache_puntajes['firma'][0], obtener_firma_archivo(ARCHIVO_REGISTRO_PUNTAJES))
+    cache_puntajes['revisado'] = time.monotonic()
+
+    if cache_puntajes['registros'] >= MAXIMO_REGISTROS_SIN_COMPACTAR:
+        compactar_puntajes()
+
+
+def leer_puntajes(infinitos: bool = False) -> list[tuple]:
+    """
+    Devuelve los mejores puntajes guardados.
+
+    Los puntajes se leen de los archivos la primera vez y despues solo si
+    cambiaron desde afuera del juego.
+
+    Recibe:
+        infinitos (bool, opcional): True para los de las partidas infinitas, que
+                                    se ordenan aparte (ver es_puntaje_infinito).
+
+    Devuelve:
+        List[tuple]: Registros (nombre, puntaje, tiempo, dificultad, fecha) de mayor
+                     a menor puntaje. Retorna lista vacia si no hay puntajes.
+    """
+    actualizar_cache_puntajes()
+
+    return [registro for registro in cache_puntajes['puntajes'] if es_puntaje_infinito(registro) == infinitos]
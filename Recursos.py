@@ -0,0 +1,306 @@
+import os
+import threading
+import time
+import pygame
+from collections import OrderedDict
+from Constantes import *
+
+
+# Carpeta del juego. Las rutas de los recursos se resuelven desde aca y no
+# desde la carpeta de trabajo, para poder lanzar el juego desde cualquier lado.
+DIRECTORIO_JUEGO = os.path.dirname(os.path.abspath(__file__))
+
+# Imagenes ya cargadas, por ruta relativa, y rutas de las que se cargaron
+# antes de crear la ventana y todavia no estan en el formato de la pantalla.
+imagenes_cargadas = {}
+imagenes_sin_convertir = set()
+
+# Variantes ya creadas (escaladas y/o teñidas), por (imagen, tamaño, tinte).
+# Se descartan las que hace mas tiempo que no se usan.
+variantes_imagenes = OrderedDict()
+
+# Segundos que tardo en cargarse (y convertirse) cada recurso, por ruta relativa.
+tiempos_carga = {}
+
+# Sonidos ya decodificados, por nombre. Los llena un hilo en segundo plano;
+# mientras un sonido no esta, reproducirlo no hace nada.
+sonidos_cargados = {}
+
+
+def ruta_recurso(ruta_relativa: str) -> str:
+    """
+    Convierte la ruta de un recurso relativa a la carpeta del juego en una ruta absoluta.
+
+    Recibe:
+        ruta_relativa (str): Ruta como 'Imagenes/bomb.png'.
+
+    Devuelve:
+        str: Ruta absoluta del recurso.
+    """
+    return os.path.join(DIRECTORIO_JUEGO, ruta_relativa)
+
+
+def convertir_imagen(imagen: pygame.Surface) -> pygame.Surface:
+    """
+    Convierte una imagen al formato de la pantalla, conservando la transparencia si la tiene.
+
+    Recibe:
+        imagen (pygame.Surface): Imagen recien cargada.
+
+    Devuelve:
+        pygame.Surface: Imagen que se copia a la ventana sin conversiones.
+    """
+    if imagen.get_flags() & pygame.SRCALPHA:
+        return imagen.convert_alpha()
+
+    return imagen.convert()
+
+
+def cargar_imagen(ruta_relativa: str) -> pygame.Surface:
+    """
+    Devuelve una imagen, cargandola del disco solo la primera vez que se pide.
+
+    Si la ventana ya existe la imagen se convierte al formato de la pantalla;
+    si no, queda pendiente hasta llamar a convertir_imagenes_cargadas.
+
+    Recibe:
+        ruta_relativa (str): Ruta de la imagen relativa a la carpeta del juego.
+
+    Devuelve:
+        pygame.Surface: Imagen cargada. No se debe modificar, porque se comparte.
+    """
+    imagen = imagenes_cargadas.get(ruta_relativa)
+
+    if imagen is None:
+        inicio = time.perf_counter()
+        imagen = pygame.image.load(ruta_recurso(ruta_relativa))
+
+        if pygame.display.get_surface() is not None:
+            imagen = convertir_imagen(imagen)
+        else:
+            imagenes_sin_convertir.add(ruta_relativa)
+
+        imagenes_cargadas[ruta_relativa] = imagen
+        tiempos_carga[ruta_relativa] = time.perf_counter() - inicio
+
+    return imagen
+
+
+def convertir_imagenes_cargadas() -> None:
+    """
+    Convierte al formato de la pantalla las imagenes cargadas antes de crear la ventana.
+
+    Devuelve:
+        None
+    """
+    for ruta_relativa in imagenes_sin_convertir:
+        imagenes_cargadas[ruta_relativa] = convertir_imagen(imagenes_cargadas[ruta_relativa])
+
+    imagenes_sin_convertir.clear()
+    variantes_imagenes.clear()
+
+
+def obtener_variante(imagen: pygame.Surface, tamaño: tuple = None, tinte: tuple = None) -> pygame.Surface:
+    """
+    Devuelve una copia escalada y/o teñida de una imagen, creandola solo la primera vez.
+
+    Guarda como maximo MAXIMO_VARIANTES_EN_CACHE variantes; al llenarse descarta
+    la que hace mas tiempo que no se usa.
+
+    Recibe:
+        imagen (pygame.Surface): Imagen original (por ejemplo de cargar_imagen).
+        tamaño (tuple, opcional): (ancho, alto) de la variante. None para no escalar.
+        tinte (tuple, opcional): Color (r, g, b) por el que se multiplica cada pixel. None para no teñir.
+
+    Devuelve:
+        pygame.Surface: Variante de la imagen. No se debe modificar, porque se comparte.
+    """
+    if tamaño is not None:
+        tamaño = tuple(tamaño)
+    if tinte is not None:
+        tinte = tuple(tinte)
+
+    clave = (imagen, tamaño, tinte)
+    variante = variantes_imagenes.get(clave)
+
+    if variante is not None:
+        variantes_imagenes.move_to_end(clave)
+        return variante
+
+    variante = imagen
+    if tamaño is not None and tamaño != imagen.get_size():
+        variante = pygame.transform.scale(variante, tamaño)
+    if tinte is not None:
+        variante = variante.copy()
+        variante.fill(tinte, special_flags=pygame.BLEND_RGB_MULT)
+
+    variantes_imagenes[clave] = variante
+
+    if len(variantes_imagenes) > MAXIMO_VARIANTES_EN_CACHE:
+        variantes_imagenes.popitem(last=False)
+
+    return variante
+
+
+def obtener_tiempos_carga() -> dict:
+    """
+    Devuelve cuanto tardo en cargarse cada recurso, para medir el tiempo de inicio.
+
+    Devuelve:
+        dict: Segundos por ruta relativa, mas la clave 'total' con la suma.
+    """
+    tiempos = dict(tiempos_carga)
+    tiempos['total'] = sum(tiempos_carga.values())
+
+    return tiempos
+
+
+def configurar_audio() -> None:
+    """
+    Configura el mezclador con un buffer chico, para que los sonidos suenen
+    enseguida. Se debe llamar antes de pygame.init().
+
+    Devuelve:
+        None
+    """
+    pygame.mixer.pre_init(FRECUENCIA_AUDIO, -16, 2, TAMAÑO_BUFFER_AUDIO)
+
+
+def iniciar_mezclador() -> bool:
+    """
+    Inicia el mezclador si todavia no lo esta y reserva los canales de la interfaz.
+
+    Devuelve:
+        bool: True si hay audio disponible, False si no hay dispositivo de sonido.
+    """
+    if not pygame.mixer.get_init():
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            return False
+
+    pygame.mixer.set_num_channels(CANALES_AUDIO)
+    pygame.mixer.set_reserved(CANALES_RESERVADOS_INTERFAZ)
+
+    return True
+
+
+def ruta_cache_sonido(ruta_relativa: str) -> str:
+    """
+    Devuelve donde se guarda el sonido decodificado de un archivo.
+
+    El nombre incluye la fecha y el tamaño del archivo original y el formato del
+    mezclador, asi un archivo modificado o un mezclador distinto no usan datos viejos.
+
+    Recibe:
+        ruta_relativa (str): Ruta del sonido relativa a la carpeta del juego.
+
+    Devuelve:
+        str: Ruta absoluta del archivo de cache, o None si el sonido no existe.
+    """
+    try:
+        estado = os.stat(ruta_recurso(ruta_relativa))
+    except OSError:
+        return None
+
+    frecuencia, formato, canales = pygame.mixer.get_init()
+    nombre = os.path.basename(ruta_relativa)
+    nombre_cache = f"{nombre}-{estado.st_mtime_ns}-{estado.st_size}-{frecuencia}-{formato}-{canales}.pcm"
+
+    return os.path.join(DIRECTORIO_JUEGO, DIRECTORIO_CACHE_SONIDOS, nombre_cache)
+
+
+def decodificar_sonido(ruta_relativa: str) -> pygame.mixer.Sound:
+    """
+    Carga un sonido, usando la version ya decodificada del disco si existe y
+    guardandola si no.
+
+    Recibe:
+        ruta_relativa (str): Ruta del sonido relativa a la carpeta del juego.
+
+    Devuelve:
+        pygame.mixer.Sound: Sonido listo para reproducir, o None si el archivo
+                            falta o no se pudo leer.
+    """
+    ruta_cache = ruta_cache_sonido(ruta_relativa)
+
+    if ruta_cache is None:
+        return None
+
+    try:
+        with open(ruta_cache, 'rb') as archivo:
+            return pygame.mixer.Sound(buffer=archivo.read())
+    except (OSError, pygame.error):
+        pass
+
+    try:
+        sonido = pygame.mixer.Sound(ruta_recurso(ruta_relativa))
+    except (OSError, pygame.error):
+        return None
+
+    try:
+        os.makedirs(os.path.dirname(ruta_cache), exist_ok=True)
+        with open(ruta_cache + '.tmp', 'wb') as archivo:
+            archivo.write(sonido.get_raw())
+        os.replace(ruta_cache + '.tmp', ruta_cache)
+    except OSError:
+        pass
+
+    return sonido
+
+
+def cargar_sonidos_en_segundo_plano(sonidos: dict, volumen: float) -> threading.Thread:
+    """
+    Decodifica sonidos en un hilo aparte y los va agregando a sonidos_cargados.
+
+    Recibe:
+        sonidos (dict): Ruta relativa de cada sonido, por nombre.
+        volumen (float): Volumen de todos los sonidos, entre 0 y 1.
+
+    Devuelve:
+        threading.Thread: Hilo que hace la carga (ya iniciado).
+    """
+    def cargar() -> None:
+        for nombre, ruta_relativa in sonidos.items():
+            inicio = time.perf_counter()
+            sonido = decodificar_sonido(ruta_relativa)
+            tiempos_carga[ruta_relativa] = time.perf_counter() - inicio
+
+            if sonido is not None:
+                sonido.set_volume(volumen)
+                sonidos_cargados[nombre] = sonido
+
+    hilo = threading.Thread(target=cargar, name="carga_sonidos", daemon=True)
+    hilo.start()
+
+    return hilo
+
+
+def reproducir_musica(ruta_relativa: str, volumen: float = None) -> bool:
+    """
+    Reproduce una musica en bucle. Si el archivo falta o no hay audio, no suena nada.
+
+    La musica no se decodifica entera: el mezclador la va leyendo mientras suena.
+
+    Recibe:
+        ruta_relativa (str): Ruta de la musica relativa a la carpeta del juego.
+        volumen (float, opcional): Volumen entre 0 y 1. None para dejar el actual.
+
+    Devuelve:
+        bool: True si la musica empezo a sonar.
+    """
+    if not pygame.mixer.get_init():
+        return False
+
+    try:
+        pygame.mixer.music.stop()
+        pygame.mixer.music.load(ruta_recurso(ruta_relativa))
+    except (OSError, pygame.error):
+        return False
+
+    pygame.mixer.music.play(-1)
+
+    if volumen is not None:
+        pygame.mixer.music.set_volume(volumen)
+
+    return True
@@ -0,0 +1,590 @@
+import time
+from Constantes import *
+from Tablero import *
+
+
+# Tecnicas del solucionador, de la mas barata a la mas cara. Solo se pasa a
+# la siguiente cuando las anteriores no deducen nada.
+ETAPAS_SOLUCIONADOR = ('simple', 'subconjuntos', 'enumeracion')
+
+
+# ===============================================================================
+# ESTADO DEL SOLUCIONADOR
+# ===============================================================================
+
+def crear_estadisticas_solucionador() -> dict:
+    """
+    Crea los contadores de tiempo de cada tecnica del solucionador.
+
+    Se pueden compartir entre varios solucionadores para sumar muchas partidas.
+
+    Devuelve:
+        dict: Por cada nombre de ETAPAS_SOLUCIONADOR, un dict con:
+            - llamadas (int): Veces que se uso la tecnica.
+            - segundos (float): Tiempo total usado.
+            - deducciones (int): Casillas seguras o minas encontradas.
+          Mas la clave 'omitidos' (int): grupos que eran demasiado grandes para enumerar.
+    """
+    estadisticas = {etapa: {'llamadas': 0, 'segundos': 0.0, 'deducciones': 0} for etapa in ETAPAS_SOLUCIONADOR}
+    estadisticas['omitidos'] = 0
+
+    return estadisticas
+
+
+def crear_solucionador(tablero: dict, estadisticas: dict = None) -> dict:
+    """
+    Crea el estado de un solucionador para un tablero compacto.
+
+    El solucionador solo mira lo que ve el jugador: los numeros de las casillas
+    descubiertas. Las banderas no se usan, porque pueden estar mal puestas.
+
+    Recibe:
+        tablero (dict): Tablero compacto (ver crear_tablero).
+        estadisticas (dict, opcional): Contadores donde sumar los tiempos
+                                       (ver crear_estadisticas_solucionador).
+
+    Devuelve:
+        dict: Un diccionario que contiene las siguientes claves:
+            - tablero (dict): El tablero.
+            - minas (set): Indices de las minas deducidas.
+            - seguras (set): Indices deducidos sin mina que todavia no se descubrieron.
+            - frontera (set): Casillas descubiertas con numero que tienen vecinas sin resolver.
+            - pendientes (set): Casillas de la frontera que hay que volver a revisar.
+            - estadisticas (dict): Contadores de tiempo por tecnica.
+    """
+    return {
+        'tablero': tablero,
+        'minas': set(),
+        'seguras': set(),
+        'frontera': set(),
+        'pendientes': set(),
+        'estadisticas': estadisticas if estadisticas is not None else crear_estadisticas_solucionador()
+    }
+
+
+def vecinos_casilla(tablero: dict, indice: int) -> list[int]:
+    """
+    Devuelve los indices de las casillas vecinas de una casilla.
+
+    Recibe:
+        tablero (dict): Tablero compacto.
+        indice (int): Indice de la casilla.
+
+    Devuelve:
+        List[int]: Indices de hasta 8 vecinas.
+    """
+    filas, columnas = tablero['filas'], tablero['columnas']
+    fila, columna = divmod(indice, columnas)
+
+    if 0 < fila < filas - 1 and 0 < columna < columnas - 1:
+        return [indice - columnas - 1, indice - columnas, indice - columnas + 1, indice - 1,
+                indice + 1, indice + columnas - 1, indice + columnas, indice + columnas + 1]
+
+    col_inicio = max(columna - 1, 0)
+    col_fin = min(columna + 2, columnas)
+
+    vecinos = []
+    for ni in range(max(fila - 1, 0), min(fila + 2, filas)):
+        base = ni * columnas
+        vecinos.extend(vecino for vecino in range(base + col_inicio, base + col_fin) if vecino != indice)
+
+    return vecinos
+
+
+def agregar_descubiertas(solucionador: dict, posiciones: list[tuple[int, int]]) -> None:
+    """
+    Avisa al solucionador que se descubrieron casillas.
+
+    Las casillas con numero pasan a la frontera, y las de la frontera vecinas
+    a las nuevas se vuelven a revisar porque les queda una incognita menos.
+
+    Recibe:
+        solucionador (dict): Solucionador (ver crear_solucionador).
+        posiciones (List[Tuple[int, int]]): Casillas descubiertas, como las
+                                            devuelve descubrir_celda.
+
+    Devuelve:
+        None
+    """
+    tablero = solucionador['tablero']
+    columnas = tablero['columnas']
+    celdas = tablero['celdas']
+    frontera = solucionador['frontera']
+    pendientes = solucionador['pendientes']
+    seguras = solucionador['seguras']
+
+    for fila, columna in posiciones:
+        indice = fila * columnas + columna
+        seguras.discard(indice)
+
+        if celdas[indice] & MASCARA_NUMERO:
+            frontera.add(indice)
+            pendientes.add(indice)
+
+        for vecino in vecinos_casilla(tablero, indice):
+            if vecino in frontera:
+                pendientes.add(vecino)
+
+
+def leer_restriccion(solucionador: dict, indice: int) -> tuple[list[int], int]:
+    """
+    Devuelve lo que dice el numero de una casilla descubierta sobre sus vecinas sin resolver.
+
+    Recibe:
+        solucionador (dict): Solucionador.
+        indice (int): Indice de una casilla de la frontera.
+
+    Devuelve:
+        Tuple[List[int], int]: (incognitas, minas_faltantes): las vecinas ocultas
+                               que no se sabe si tienen mina y cuantas minas hay entre ellas.
+    """
+    tablero = solucionador['tablero']
+    celdas = tablero['celdas']
+    minas = solucionador['minas']
+    seguras = solucionador['seguras']
+
+    incognitas = []
+    faltantes = celdas[indice] & MASCARA_NUMERO
+
+    for vecino in vecinos_casilla(tablero, indice):
+        if vecino in minas:
+            faltantes -= 1
+        elif not celdas[vecino] & BIT_DESCUBIERTA and vecino not in seguras:
+            incognitas.append(vecino)
+
+    return incognitas, faltantes
+
+
+def anotar_deducciones(solucionador: dict, seguras: set, minas: set) -> int:
+    """
+    Guarda casillas deducidas y marca para revisar las restricciones que las tocan.
+
+    Recibe:
+        solucionador (dict): Solucionador.
+        seguras (set): Indices deducidos sin mina.
+        minas (set): Indices deducidos con mina.
+
+    Devuelve:
+        int: Cantidad de casillas que no se conocian.
+    """
+    nuevas_seguras = seguras - solucionador['seguras']
+    nuevas_minas = minas - solucionador['minas']
+
+    solucionador['seguras'] |= nuevas_seguras
+    solucionador['minas'] |= nuevas_minas
+
+    frontera = solucionador['frontera']
+    pendientes = solucionador['pendientes']
+
+    for indice in nuevas_seguras | nuevas_minas:
+        for vecino in vecinos_casilla(solucionador['tablero'], indice):
+            if vecino in frontera:
+                pendientes.add(vecino)
+
+    return len(nuevas_seguras) + len(nuevas_minas)
+
+
+# ===============================================================================
+# TECNICAS
+# ===============================================================================
+
+def aplicar_reglas_simples(solucionador: dict) -> int:
+    """
+    Revisa cada restriccion pendiente por separado: si ya tiene todas sus minas
+    las demas vecinas son seguras, y si le faltan tantas minas como incognitas
+    todas son minas. Sigue hasta que no quedan restricciones pendientes.
+
+    Recibe:
+        solucionador (dict): Solucionador.
+
+    Devuelve:
+        int: Casillas deducidas.
+    """
+    frontera = solucionador['frontera']
+    pendientes = solucionador['pendientes']
+    deducidas = 0
+
+    while pendientes:
+        indice = pendientes.pop()
+        if indice not in frontera:
+            continue
+
+        incognitas, faltantes = leer_restriccion(solucionador, indice)
+
+        if not incognitas:
+            frontera.discard(indice)
+        elif faltantes == 0:
+            deducidas += anotar_deducciones(solucionador, set(incognitas), set())
+        elif faltantes == len(incognitas):
+            deducidas += anotar_deducciones(solucionador, set(), set(incognitas))
+
+    return deducidas
+
+
+def armar_restricciones(solucionador: dict) -> dict:
+    """
+    Lee todas las restricciones de la frontera que todavia tienen incognitas.
+
+    Recibe:
+        solucionador (dict): Solucionador.
+
+    Devuelve:
+        dict: (incognitas, minas_faltantes) por indice de casilla, con las
+              incognitas como frozenset.
+    """
+    restricciones = {}
+
+    for indice in list(solucionador['frontera']):
+        incognitas, faltantes = leer_restriccion(solucionador, indice)
+
+        if incognitas:
+            restricciones[indice] = (frozenset(incognitas), faltantes)
+        else:
+            solucionador['frontera'].discard(indice)
+
+    return restricciones
+
+
+def aplicar_subconjuntos(solucionador: dict, restricciones: dict) -> int:
+    """
+    Compara pares de restricciones vecinas: si las incognitas de una estan
+    todas en la otra, las incognitas que sobran tienen exactamente la
+    diferencia de minas, y a veces eso alcanza para resolverlas.
+
+    Recibe:
+        solucionador (dict): Solucionador.
+        restricciones (dict): Restricciones de armar_restricciones.
+
+    Devuelve:
+        int: Casillas deducidas.
+    """
+    por_incognita = {}
+    for indice, (incognitas, _) in restricciones.items():
+        for incognita in incognitas:
+            por_incognita.setdefault(incognita, []).append(indice)
+
+    seguras = set()
+    minas = set()
+
+    for indice, (incognitas, faltantes) in restricciones.items():
+        candidatas = set()
+        for incognita in incognitas:
+            candidatas.update(por_incognita[incognita])
+        candidatas.discard(indice)
+
+        for otra in candidatas:
+            otras_incognitas, otras_faltantes = restricciones[otra]
+
+            if len(otras_incognitas) <= len(incognitas) or not incognitas < otras_incognitas:
+                continue
+
+            sobrantes = otras_incognitas - incognitas
+            diferencia = otras_faltantes - faltantes
+
+            if diferencia == 0:
+                seguras |= sobrantes
+            elif diferencia == len(sobrantes):
+                minas |= sobrantes
+
+    return anotar_deducciones(solucionador, seguras, minas)
+
+
+def separar_componentes(restricciones: dict) -> list[list[int]]:
+    """
+    Agrupa las restricciones que comparten incognitas, directa o indirectamente.
+    Cada grupo se puede resolver sin mirar los demas.
+
+    Recibe:
+        restricciones (dict): Restricciones de armar_restricciones.
+
+    Devuelve:
+        List[List[int]]: Indices de las restricciones de cada grupo.
+    """
+    por_incognita = {}
+    for indice, (incognitas, _) in restricciones.items():
+        for incognita in incognitas:
+            por_incognita.setdefault(incognita, []).append(indice)
+
+    vistas = set()
+    componentes = []
+
+    for inicial in restricciones:
+        if inicial in vistas:
+            continue
+
+        vistas.add(inicial)
+        pila = [inicial]
+        componente = []
+
+        while pila:
+            indice = pila.pop()
+            componente.append(indice)
+
+            for incognita in restricciones[indice][0]:
+                for otra in por_incognita[incognita]:
+                    if otra not in vistas:
+                        vistas.add(otra)
+                        pila.append(otra)
+
+        componentes.append(componente)
+
+    return componentes
+
+
+def enumerar_componente(restricciones: dict, componente: list[int]) -> tuple:
+    """
+    Prueba todas las formas de poner minas en las incognitas de un grupo que
+    cumplen sus restricciones, con vuelta atras, y se queda con las incognitas
+    que son mina en todas o en ninguna.
+
+    No usa la cantidad total de minas del tablero, asi que solo deduce lo que
+    es cierto para cualquier cantidad de minas en el resto.
+
+    Recibe:
+        restricciones (dict): Restricciones de armar_restricciones.
+        componente (List[int]): Restricciones del grupo (ver separar_componentes).
+
+    Devuelve:
+        tuple: (seguras, minas) como sets de indices, o None si el grupo supera
+               MAXIMO_VARIABLES_ENUMERACION o MAXIMO_NODOS_ENUMERACION.
+    """
+    # Las incognitas se ordenan siguiendo las restricciones, asi cada restriccion
+    # se completa pronto y las asignaciones imposibles se descartan enseguida.
+    posiciones = {}
+    for indice in componente:
+        for incognita in sorted(restricciones[indice][0]):
+            posiciones.setdefault(incognita, len(posiciones))
+
+    cantidad = len(posiciones)
+    if cantidad > MAXIMO_VARIABLES_ENUMERACION:
+        return None
+
+    faltantes = [restricciones[indice][1] for indice in componente]
+    sin_asignar = [len(restricciones[indice][0]) for indice in componente]
+    puestas = [0] * len(componente)
+    restricciones_de = [[] for _ in range(cantidad)]
+
+    for k, indice in enumerate(componente):
+        for incognita in restricciones[indice][0]:
+            restricciones_de[posiciones[incognita]].append(k)
+
+    asignacion = [0] * cantidad
+    veces_mina = [0] * cantidad
+    soluciones = 0
+    nodos = 0
+
+    def probar(posicion: int) -> bool:
+        nonlocal soluciones, nodos
+
+        nodos += 1
+        if nodos > MAXIMO_NODOS_ENUMERACION:
+            return False
+
+        if posicion == cantidad:
+            soluciones += 1
+            for i in range(cantidad):
+                veces_mina[i] += asignacion[i]
+            return True
+
+        propias = restricciones_de[posicion]
+
+        for valor in (0, 1):
+            valida = True
+            for k in propias:
+                sin_asignar[k] -= 1
+                puestas[k] += valor
+                if puestas[k] > faltantes[k] or puestas[k] + sin_asignar[k] < faltantes[k]:
+                    valida = False
+
+            asignacion[posicion] = valor
+            completo = not valida or probar(posicion + 1)
+
+            for k in propias:
+                sin_asignar[k] += 1
+                puestas[k] -= valor
+
+            if not completo:
+                return False
+
+        asignacion[posicion] = 0
+        return True
+
+    if not probar(0) or soluciones == 0:
+        return None
+
+    seguras = {incognita for incognita, i in posiciones.items() if veces_mina[i] == 0}
+    minas = {incognita for incognita, i in posiciones.items() if veces_mina[i] == soluciones}
+
+    return seguras, minas
+
+
+def aplicar_enumeracion(solucionador: dict, restricciones: dict) -> int:
+    """
+    Resuelve de forma exacta cada grupo independiente de la frontera que no
+    sea demasiado grande (ver enumerar_componente).
+
+    Recibe:
+        solucionador (dict): Solucionador.
+        restricciones (dict): Restricciones de armar_restricciones.
+
+    Devuelve:
+        int: Casillas deducidas.
+    """
+    seguras = set()
+    minas = set()
+
+    for componente in separar_componentes(restricciones):
+        resultado = enumerar_componente(restricciones, componente)
+
+        if resultado is None:
+            solucionador['estadisticas']['omitidos'] += 1
+        else:
+            seguras |= resultado[0]
+            minas |= resultado[1]
+
+    return anotar_deducciones(solucionador, seguras, minas)
+
+
+# ===============================================================================
+# RESOLUCION
+# ===============================================================================
+
+def medir_etapa(solucionador: dict, etapa: str, funcion, *argumentos) -> int:
+    """
+    Ejecuta una tecnica y suma su tiempo y sus deducciones a las estadisticas.
+
+    Recibe:
+        solucionador (dict): Solucionador.
+        etapa (str): Nombre de la tecnica (ver ETAPAS_SOLUCIONADOR).
+        funcion (callable): Tecnica a ejecutar. Recibe el solucionador y los argumentos.
+
+    Devuelve:
+        int: Casillas deducidas.
+    """
+    contadores = solucionador['estadisticas'][etapa]
+
+    inicio = time.perf_counter()
+    deducidas = funcion(solucionador, *argumentos)
+    contadores['segundos'] += time.perf_counter() - inicio
+
+    contadores['llamadas'] += 1
+    contadores['deducciones'] += deducidas
+
+    return deducidas
+
+
+def deducir(solucionador: dict) -> tuple[set, set]:
+    """
+    Busca casillas seguras y minas usando las tecnicas en orden de costo: las
+    reglas simples, despues pares de restricciones y por ultimo la enumeracion
+    exacta. Vuelve a las reglas simples cada vez que una tecnica cara deduce algo.
+
+    Recibe:
+        solucionador (dict): Solucionador.
+
+    Devuelve:
+        Tuple[set, set]: (seguras, minas): indices de las casillas seguras sin
+                         descubrir y de todas las minas deducidas hasta ahora.
+                         seguras queda vacio si hace falta adivinar.
+    """
+    while True:
+        medir_etapa(solucionador, 'simple', aplicar_reglas_simples)
+        if solucionador['seguras']:
+            break
+
+        restricciones = armar_restricciones(solucionador)
+        if not restricciones:
+            break
+
+        if medir_etapa(solucionador, 'subconjuntos', aplicar_subconjuntos, restricciones):
+            continue
+
+        if not medir_etapa(solucionador, 'enumeracion', aplicar_enumeracion, restricciones):
+            break
+
+    return set(solucionador['seguras']), set(solucionador['minas'])
+
+
+def resolver_sin_adivinar(tablero: dict, descubrir, fila: int, columna: int,
+                          estadisticas: dict = None) -> bool:
+    """
+    Juega una partida entera descubriendo solo casillas que se sabe que son seguras.
+    Las casillas que ya estaban descubiertas tambien se tienen en cuenta.
+
+    Recibe:
+        tablero (dict): Tablero compacto de la partida.
+        descubrir (callable): Funcion (fila, columna) -> casillas descubiertas que
+                              hace la jugada, por ejemplo MotorTablero.descubrir.
+        fila (int): Fila del primer click.
+        columna (int): Columna del primer click.
+        estadisticas (dict, opcional): Contadores donde sumar los tiempos.
+
+    Devuelve:
+        bool: True si se descubrieron todas las casillas sin mina sin tener que
+              adivinar. False tambien si una casilla segura no se pudo descubrir.
+    """
+    solucionador = crear_solucionador(tablero, estadisticas)
+    columnas = tablero['columnas']
+
+    ya_descubiertas = [divmod(indice, columnas) for indice, valor in enumerate(tablero['celdas'])
+                       if valor & BIT_DESCUBIERTA]
+    agregar_descubiertas(solucionador, ya_descubiertas)
+    agregar_descubiertas(solucionador, descubrir(fila, columna))
+
+    while not verificar_victoria(tablero):
+        seguras, _ = deducir(solucionador)
+        if not seguras:
+            return False
+
+        for indice in seguras:
+            reveladas = descubrir(*divmod(indice, columnas))
+            if tablero['celdas'][indice] & BIT_MINA:
+                return False
+
+            # Si la casilla sigue oculta (tiene bandera o la partida termino) se
+            # volveria a deducir para siempre.
+            if not reveladas and not tablero['celdas'][indice] & BIT_DESCUBIERTA:
+                return False
+
+            solucionador['seguras'].discard(indice)
+            agregar_descubiertas(solucionador, reveladas)
+
+    return True
+
+
+def es_resoluble(tablero: dict, fila: int, columna: int, estadisticas: dict = None) -> bool:
+    """
+    Indica si un tablero se puede ganar sin adivinar empezando por una casilla.
+    El tablero no se modifica.
+
+    Recibe:
+        tablero (dict): Tablero compacto con las minas y los numeros, sin descubrir.
+        fila (int): Fila del primer click, que no debe ser mina.
+        columna (int): Columna del primer click.
+        estadisticas (dict, opcional): Contadores donde sumar los tiempos.
+
+    Devuelve:
+        bool: True si el tablero se resuelve sin adivinar.
+    """
+    copia = dict(tablero, celdas=bytearray(tablero['celdas']))
+
+    if es_mina(copia, fila, columna):
+        return False
+
+    return resolver_sin_adivinar(copia, lambda f, c: descubrir_celda(copia, f, c), fila, columna, estadisticas)
+
+
+def jugar_automaticamente(estado_juego, fila: int, columna: int, estadisticas: dict = None) -> bool:
+    """
+    Juega una partida de MotorTablero sin adivinar, empezando por una casilla.
+
+    Recibe:
+        estado_juego (MotorTablero): Partida sin empezar.
+        fila (int): Fila del primer click.
+        columna (int): Columna del primer click.
+        estadisticas (dict, opcional): Contadores donde sumar los tiempos.
+
+    Devuelve:
+        bool: True si la partida se gano. Si hizo falta adivinar queda sin terminar.
+    """
+    return resolver_sin_adivinar(estado_juego.tablero, estado_juego.descubrir, fila, columna, estadisticas)
@@ -0,0 +1,526 @@
+import random
+from Constantes import *
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Tablas para bytes.translate: dejan solo la marca de mina (o de mina y
+# descubierta) o borran el numero.
+TABLA_SOLO_MINA = bytes(valor & BIT_MINA for valor in range(256))
+TABLA_OCUPADA = bytes(valor & (BIT_MINA | BIT_DESCUBIERTA) for valor in range(256))
+TABLA_SIN_NUMERO = bytes(valor & ~MASCARA_NUMERO & 0xFF for valor in range(256))
+
+
+# ===============================================================================
+# TABLERO COMPACTO
+# ===============================================================================
+
+def crear_tablero(filas: int, columnas: int) -> dict:
+    """
+    Crea un tablero vacio con almacenamiento plano de un byte por casilla.
+
+    Cada byte guarda la cantidad de minas adyacentes en sus 4 bits bajos
+    (MASCARA_NUMERO) y las marcas BIT_MINA, BIT_DESCUBIERTA y BIT_BANDERA.
+    La casilla (fila, columna) esta en el indice fila * columnas + columna.
+
+    Recibe:
+        filas (int): Numero de filas del tablero.
+        columnas (int): Numero de columnas del tablero.
+
+    Devuelve:
+        dict: Un diccionario que contiene las siguientes claves:
+            - filas (int): Cantidad de filas del tablero.
+            - columnas (int): Cantidad de columnas del tablero.
+            - celdas (bytearray): Estado de todas las casillas, fila por fila.
+            - ocultas_seguras (int): Casillas sin mina que siguen ocultas. Se
+                actualiza en cada jugada, asi verificar_victoria no recorre el tablero.
+    """
+    return {
+        'filas': filas,
+        'columnas': columnas,
+        'celdas': bytearray(filas * columnas),
+        'ocultas_seguras': filas * columnas
+    }
+
+
+def es_mina(tablero: dict, fila: int, columna: int) -> bool:
+    """
+    Indica si la casilla contiene una mina.
+
+    Recibe:
+        tablero (dict): Tablero creado con crear_tablero.
+        fila (int): Fila de la casilla.
+        columna (int): Columna de la casilla.
+
+    Devuelve:
+        bool: True si hay una mina, False en caso contrario.
+    """
+    return bool(tablero['celdas'][fila * tablero['columnas'] + columna] & BIT_MINA)
+
+
+def esta_descubierta(tablero: dict, fila: int, columna: int) -> bool:
+    """
+    Indica si la casilla ya fue descubierta por el jugador.
+
+    Recibe:
+        tablero (dict): Tablero creado con crear_tablero.
+        fila (int): Fila de la casilla.
+        columna (int): Columna de la casilla.
+
+    Devuelve:
+        bool: True si la casilla esta descubierta, False si esta oculta.
+    """
+    return bool(tablero['celdas'][fila * tablero['columnas'] + columna] & BIT_DESCUBIERTA)
+
+
+def tiene_bandera(tablero: dict, fila: int, columna: int) -> bool:
+    """
+    Indica si el jugador coloco una bandera sobre la casilla.
+
+    Recibe:
+        tablero (dict): Tablero creado con crear_tablero.
+        fila (int): Fila de la casilla.
+        columna (int): Columna de la casilla.
+
+    Devuelve:
+        bool: True si hay una bandera, False en caso contrario.
+    """
+    return bool(tablero['celdas'][fila * tablero['columnas'] + columna] & BIT_BANDERA)
+
+
+def obtener_numero(tablero: dict, fila: int, columna: int) -> int:
+    """
+    Devuelve la cantidad de minas adyacentes a la casilla.
+
+    Recibe:
+        tablero (dict): Tablero creado con crear_tablero.
+        fila (int): Fila de la casilla.
+        columna (int): Columna de la casilla.
+
+    Devuelve:
+        int: Numero del 0 al 8.
+    """
+    return tablero['celdas'][fila * tablero['columnas'] + columna] & MASCARA_NUMERO
+
+
+def alternar_bandera(tablero: dict, fila: int, columna: int) -> bool:
+    """
+    Coloca o quita la bandera de una casilla.
+
+    Recibe:
+        tablero (dict): Tablero creado con crear_tablero.
+        fila (int): Fila de la casilla.
+        columna (int): Columna de la casilla.
+
+    Devuelve:
+        bool: True si la casilla quedo con bandera, False si se quito.
+    """
+    indice = fila * tablero['columnas'] + columna
+    tablero['celdas'][indice] ^= BIT_BANDERA
+
+    return bool(tablero['celdas'][indice] & BIT_BANDERA)
+
+
+def limpiar_marcas(tablero: dict) -> None:
+    """
+    Oculta todas las casillas y quita todas las banderas del tablero.
+
+    Las minas y los numeros no se modifican y el contador de casillas
+    seguras ocultas vuelve a su valor inicial.
+
+    Recibe:
+        tablero (dict): Tablero creado con crear_tablero.
+
+    Devuelve:
+        None
+    """
+    mascara = ~(BIT_DESCUBIERTA | BIT_BANDERA) & 0xFF
+    tabla = bytes(valor & mascara for valor in range(256))
+    celdas = tablero['celdas']
+    celdas[:] = celdas.translate(tabla)
+
+    tablero['ocultas_seguras'] = len(celdas) - celdas.translate(TABLA_SOLO_MINA).count(BIT_MINA)
+
+
+# ===============================================================================
+# MINAS Y NUMEROS
+# ===============================================================================
+
+def inicializar_matriz(filas: int, columnas: int, minas: int, semilla: int = None) -> dict:
+    """
+    Crea un tablero del buscaminas con minas distribuidas aleatoriamente.
+
+    Las posiciones se eligen con un muestreo sin reemplazo sobre los indices
+    de las casillas (o sobre las casillas libres si hay mas minas que casillas
+    libres), por lo que el tiempo no depende de la densidad de minas.
+
+    Recibe:
+        filas (int): Numero de filas del tablero.
+        columnas (int): Numero de columnas del tablero.
+        minas (int): Numero de minas a colocar en el tablero.
+        semilla (int, opcional): Semilla del generador. La misma semilla con las
+                                 mismas dimensiones produce siempre el mismo tablero.
+
+    Devuelve:
+        dict: Tablero con BIT_MINA marcado en las casillas que tienen mina.
+              Los numeros todavia no estan calculados.
+
+    Lanza:
+        ValueError: Si minas es negativo o mayor que la cantidad de casillas.
+    """
+    if minas < 0 or minas > filas * columnas:
+        raise ValueError(f"No se pueden colocar {minas} minas en un tablero de {filas}x{columnas}")
+
+    tablero = crear_tablero(filas, columnas)
+    celdas = tablero['celdas']
+    generador = random.Random(semilla)
+
+    total = filas * columnas
+
+    if minas <= total // 2:
+        for indice in generador.sample(range(total), minas):
+            celdas[indice] = BIT_MINA
+    else:
+        celdas[:] = bytes([BIT_MINA]) * total
+        for indice in generador.sample(range(total), total - minas):
+            celdas[indice] = 0
+
+    tablero['ocultas_seguras'] -= minas
+
+    return tablero
+
+
+def generar_matriz_numeros(tablero: dict) -> None:
+    """
+    Calcula cuantas minas hay alrededor de cada casilla y lo guarda en el tablero.
+
+    Los numeros anteriores se reemplazan; las marcas de mina, descubierta y
+    bandera se conservan. Usa NumPy si esta instalado y si no una version en
+    Python puro que da exactamente el mismo resultado.
+
+    Recibe:
+        tablero (dict): Tablero con las minas ya colocadas.
+
+    Devuelve:
+        None
+    """
+    if np is not None:
+        generar_numeros_numpy(tablero)
+    else:
+        generar_numeros_python(tablero)
+
+
+def generar_numeros_numpy(tablero: dict) -> None:
+    """
+    Calcula todos los numeros a la vez sumando las 8 vecindades desplazadas
+    de una copia del tablero con un borde de ceros.
+
+    Recibe:
+        tablero (dict): Tablero con las minas ya colocadas.
+
+    Devuelve:
+        None
+    """
+    filas, columnas = tablero['filas'], tablero['columnas']
+    vista = np.frombuffer(tablero['celdas'], dtype=np.uint8).reshape(filas, columnas)
+
+    minas = np.zeros((filas + 2, columnas + 2), dtype=np.uint8)
+    minas[1:-1, 1:-1] = (vista & BIT_MINA) != 0
+
+    cuenta = np.zeros((filas, columnas), dtype=np.uint8)
+    for di in range(3):
+        for dj in range(3):
+            if di != 1 or dj != 1:
+                cuenta += minas[di:di + filas, dj:dj + columnas]
+
+    vista &= ~MASCARA_NUMERO & 0xFF
+    vista |= cuenta
+
+
+def generar_numeros_python(tablero: dict) -> None:
+    """
+    Calcula los numeros sin NumPy: borra los numeros anteriores y suma uno
+    a los vecinos de cada mina, asi el costo depende de la cantidad de minas
+    y no de revisar 8 vecinos por casilla.
+
+    Recibe:
+        tablero (dict): Tablero con las minas ya colocadas.
+
+    Devuelve:
+        None
+    """
+    filas, columnas = tablero['filas'], tablero['columnas']
+    celdas = tablero['celdas']
+
+    celdas[:] = celdas.translate(TABLA_SIN_NUMERO)
+    minas = celdas.translate(TABLA_SOLO_MINA)
+
+    indice = minas.find(BIT_MINA)
+    while indice != -1:
+        fila, columna = divmod(indice, columnas)
+        col_inicio = max(columna - 1, 0)
+        col_fin = min(columna + 2, columnas)
+
+        for ni in range(max(fila - 1, 0), min(fila + 2, filas)):
+            base = ni * columnas
+            for vecino in range(base + col_inicio, base + col_fin):
+                if vecino != indice:
+                    celdas[vecino] += 1
+
+        indice = minas.find(BIT_MINA, indice + 1)
+
+
+def actualizar_vecinos(tablero: dict, indice: int, cambio: int) -> None:
+    """
+    Suma cambio al numero de las (hasta 8) casillas vecinas de una casilla.
+
+    Se usa al agregar (+1) o quitar (-1) una mina para no recalcular todo el tablero.
+
+    Recibe:
+        tablero (dict): Tablero del juego.
+        indice (int): Indice plano de la casilla que gano o perdio la mina.
+        cambio (int): +1 si se agrego una mina, -1 si se quito.
+
+    Devuelve:
+        None
+    """
+    filas = tablero['filas']
+    columnas = tablero['columnas']
+    celdas = tablero['celdas']
+    fila, columna = divmod(indice, columnas)
+
+    col_inicio = max(columna - 1, 0)
+    col_fin = min(columna + 2, columnas)
+
+    for ni in range(max(fila - 1, 0), min(fila + 2, filas)):
+        base = ni * columnas
+        for vecino in range(base + col_inicio, base + col_fin):
+            if vecino != indice:
+                celdas[vecino] += cambio
+
+
+def buscar_casilla_libre(tablero: dict, prohibidas: set, generador: random.Random) -> int:
+    """
+    Elige al azar una casilla oculta sin mina que no este en prohibidas.
+
+    Primero prueba posiciones al azar, que en tableros normales encuentra una en
+    pocos intentos sin importar el tamaño. Solo si el tablero esta casi lleno
+    busca en orden desde una posicion al azar.
+
+    Recibe:
+        tablero (dict): Tablero del juego.
+        prohibidas (set): Indices planos que no se pueden elegir.
+        generador (random.Random): Generador de numeros aleatorios a usar.
+
+    Devuelve:
+        int: Indice plano de la casilla elegida, o -1 si no hay ninguna disponible.
+    """
+    celdas = tablero['celdas']
+    total = len(celdas)
+
+    for _ in range(64):
+        indice = generador.randrange(total)
+        if not celdas[indice] & (BIT_MINA | BIT_DESCUBIERTA) and indice not in prohibidas:
+            return indice
+
+    ocupadas = celdas.translate(TABLA_OCUPADA)
+    inicio = generador.randrange(total)
+    indice = ocupadas.find(0, inicio)
+
+    while indice != -1 and indice in prohibidas:
+        indice = ocupadas.find(0, indice + 1)
+
+    if indice == -1:
+        indice = ocupadas.find(0, 0, inicio)
+        while indice != -1 and indice in prohibidas:
+            indice = ocupadas.find(0, indice + 1, inicio)
+
+    return indice
+
+
+def mover_bomba(tablero: dict, fila_bomba: int, col_bomba: int, prohibidas: set = None,
+                generador: random.Random = None) -> bool:
+    """
+    Mueve una mina de su posicion actual a una casilla libre elegida al azar.
+
+    Solo se actualizan los numeros de las vecindades de la casilla de origen
+    y de la de destino, sin recorrer el resto del tablero.
+
+    Recibe:
+        tablero (dict): Tablero con las minas.
+        fila_bomba (int): Fila donde esta la mina a mover.
+        col_bomba (int): Columna donde esta la mina a mover.
+        prohibidas (set, opcional): Indices planos donde no se puede poner la mina.
+                                    La casilla de origen siempre esta prohibida.
+        generador (random.Random, opcional): Generador a usar. Por defecto el
+                                             del modulo random.
+
+    Devuelve:
+        bool: True si la mina se movio, False si no habia ninguna casilla libre.
+    """
+    columnas = tablero['columnas']
+    celdas = tablero['celdas']
+    origen = fila_bomba * columnas + col_bomba
+
+    if prohibidas is None:
+        prohibidas = set()
+    if generador is None:
+        generador = random.Random()
+
+    destino = buscar_casilla_libre(tablero, prohibidas | {origen}, generador)
+
+    if destino == -1:
+        return False
+
+    celdas[origen] &= ~BIT_MINA
+    actualizar_vecinos(tablero, origen, -1)
+    if not celdas[origen] & BIT_DESCUBIERTA:
+        tablero['ocultas_seguras'] += 1
+
+    celdas[destino] |= BIT_MINA
+    actualizar_vecinos(tablero, destino, 1)
+    tablero['ocultas_seguras'] -= 1
+
+    return True
+
+
+def asegurar_primer_click(tablero: dict, fila: int, columna: int, zona_libre: bool = False,
+                          semilla: int = None) -> None:
+    """
+    Garantiza que la primera casilla descubierta no tenga mina.
+
+    Las minas que esten en la casilla (y, si zona_libre es True, en sus 8
+    vecinas) se mueven a otras casillas con mover_bomba. El costo depende
+    solo de la cantidad de minas movidas, no del tamaño del tablero.
+
+    Recibe:
+        tablero (dict): Tablero del juego, antes de descubrir ninguna casilla.
+        fila (int): Fila del primer click.
+        columna (int): Columna del primer click.
+        zona_libre (bool, opcional): Si es True tambien deja sin minas la zona 3x3
+                                     alrededor del click, si hay lugar en el tablero.
+        semilla (int, opcional): Semilla del tablero. Con la misma semilla y el mismo
+                                 primer click las minas terminan en el mismo lugar.
+
+    Devuelve:
+        None
+    """
+    filas = tablero['filas']
+    columnas = tablero['columnas']
+    celdas = tablero['celdas']
+
+    if semilla is None:
+        generador = random.Random()
+    else:
+        generador = random.Random(f"{semilla}:{fila}:{columna}")
+
+    if zona_libre:
+        zona = {ni * columnas + nj
+                for ni in range(max(fila - 1, 0), min(fila + 2, filas))
+                for nj in range(max(columna - 1, 0), min(columna + 2, columnas))}
+    else:
+        zona = {fila * columnas + columna}
+
+    if celdas[fila * columnas + columna] & BIT_MINA:
+        if not mover_bomba(tablero, fila, columna, zona, generador):
+            mover_bomba(tablero, fila, columna, None, generador)
+
+    for indice in sorted(zona):
+        if celdas[indice] & BIT_MINA:
+            f, c = divmod(indice, columnas)
+            mover_bomba(tablero, f, c, zona, generador)
+
+
+# ===============================================================================
+# JUGADAS
+# ===============================================================================
+
+def descubrir_celda(tablero: dict, fila: int, columna: int) -> list[tuple[int, int]]:
+    """
+    Descubre una celda y, si no tiene minas alrededor, todas las celdas vacias
+    conectadas y su borde numerado.
+
+    Usa una pila explicita en lugar de recursion, por lo que una zona vacia
+    de cualquier tamaño no alcanza el limite de recursion de Python.
+
+    Recibe:
+        tablero (dict): Tablero del juego.
+        fila (int): Fila de la celda a descubrir.
+        columna (int): Columna de la celda a descubrir.
+
+    Devuelve:
+        List[Tuple[int, int]]: Posiciones (fila, columna) descubiertas por esta jugada,
+                               en el orden en que se descubrieron. Lista vacia si la
+                               celda ya estaba descubierta. Si la celda es una mina
+                               solo se descubre esa celda (la mina explotada).
+    """
+    filas = tablero['filas']
+    columnas = tablero['columnas']
+    celdas = tablero['celdas']
+    reveladas = []
+
+    indice = fila * columnas + columna
+
+    if celdas[indice] & BIT_DESCUBIERTA:
+        return reveladas
+
+    if celdas[indice] & BIT_MINA:
+        celdas[indice] |= BIT_DESCUBIERTA
+        reveladas.append((fila, columna))
+        return reveladas
+
+    ocupada = BIT_DESCUBIERTA | BIT_MINA
+    desplazamientos = (-columnas - 1, -columnas, -columnas + 1, -1,
+                       1, columnas - 1, columnas, columnas + 1)
+
+    celdas[indice] |= BIT_DESCUBIERTA
+    pila = [indice]
+
+    while pila:
+        indice = pila.pop()
+        f, c = divmod(indice, columnas)
+        reveladas.append((f, c))
+
+        if celdas[indice] & MASCARA_NUMERO:
+            continue
+
+        if 0 < f < filas - 1 and 0 < c < columnas - 1:
+            for desplazamiento in desplazamientos:
+                vecino = indice + desplazamiento
+                if not celdas[vecino] & ocupada:
+                    celdas[vecino] |= BIT_DESCUBIERTA
+                    pila.append(vecino)
+        else:
+            col_inicio = max(c - 1, 0)
+            col_fin = min(c + 2, columnas)
+
+            for ni in range(max(f - 1, 0), min(f + 2, filas)):
+                base = ni * columnas
+                for vecino in range(base + col_inicio, base + col_fin):
+                    if not celdas[vecino] & ocupada:
+                        celdas[vecino] |= BIT_DESCUBIERTA
+                        pila.append(vecino)
+
+    tablero['ocultas_seguras'] -= len(reveladas)
+
+    return reveladas
+
+
+def verificar_victoria(tablero: dict) -> bool:
+    """
+    Verifica si el jugador ha ganado el juego.
+
+    Consulta el contador de casillas seguras ocultas del tablero, por lo que
+    no recorre las casillas.
+
+    Recibe:
+        tablero (dict): Tablero del juego.
+
+    Devuelve:
+        bool: True si el jugador gano (todas las celdas sin minas estan descubiertas),
+              False en caso contrario.
+    """
+    return tablero['ocultas_seguras'] == 0
@@ -0,0 +1,353 @@
+import random
+from collections import OrderedDict
+from Constantes import *
+from Tablero import *
+
+
+# Tabla para bytes.translate: convierte la mascara de minas de un bloque
+# (un 1 por mina) en celdas con BIT_MINA.
+TABLA_MASCARA_A_MINA = bytes([0, BIT_MINA]) + bytes(254)
+
+
+# ===============================================================================
+# TABLERO INFINITO
+# ===============================================================================
+
+def crear_tablero_infinito(semilla: int = None, densidad: float = DENSIDAD_MINAS_INFINITO,
+                           tamaño_bloque: int = TAMAÑO_BLOQUE) -> dict:
+    """
+    Crea un tablero sin bordes dividido en bloques cuadrados que se generan a pedido.
+
+    Las minas de cada bloque salen solo de la semilla y de la posicion del bloque,
+    asi que un bloque descartado se vuelve a generar igual. Las casillas usan el
+    mismo byte que el tablero compacto (ver crear_tablero). La casilla (0, 0) y
+    sus vecinas nunca tienen mina, para poder empezar la partida descubriendola.
+
+    Recibe:
+        semilla (int, opcional): Semilla del tablero. Si no se indica se elige una al azar.
+        densidad (float, opcional): Fraccion de casillas con mina.
+        tamaño_bloque (int, opcional): Lado de cada bloque, en casillas.
+
+    Devuelve:
+        dict: Un diccionario que contiene las siguientes claves:
+            - semilla (int): Semilla del tablero.
+            - densidad (float): Fraccion de casillas con mina.
+            - tamaño_bloque (int): Lado de cada bloque.
+            - bloques (OrderedDict): Bloques en memoria por (fila_bloque, columna_bloque),
+                del menos al mas usado. Cada uno es un dict con 'celdas' (bytearray)
+                y 'modificado' (bool, True si el jugador descubrio o marco algo en el).
+            - minas (OrderedDict): Mascaras de minas ya sorteadas, por bloque.
+            - descubiertas (int): Casillas sin mina descubiertas.
+            - generados (int): Bloques generados, contando los regenerados.
+            - descartados (int): Bloques descartados por falta de lugar.
+            - pendientes (List[Tuple[int, int]]): Casillas que quedaron por revisar
+                cuando una jugada llego al limite (ver descubrir_celda_infinita).
+    """
+    if semilla is None:
+        semilla = random.getrandbits(32)
+
+    return {
+        'semilla': semilla,
+        'densidad': densidad,
+        'tamaño_bloque': tamaño_bloque,
+        'bloques': OrderedDict(),
+        'minas': OrderedDict(),
+        'descubiertas': 0,
+        'generados': 0,
+        'descartados': 0,
+        'pendientes': []
+    }
+
+
+def en_zona_inicial(fila: int, columna: int) -> bool:
+    """
+    Indica si una casilla es el origen o una de sus vecinas, que nunca tienen mina.
+
+    Recibe:
+        fila (int): Fila de la casilla.
+        columna (int): Columna de la casilla.
+
+    Devuelve:
+        bool: True si la casilla esta a distancia 1 o menos de (0, 0).
+    """
+    return -1 <= fila <= 1 and -1 <= columna <= 1
+
+
+def sortear_minas_bloque(tablero: dict, fila_bloque: int, columna_bloque: int) -> bytes:
+    """
+    Devuelve que casillas de un bloque tienen mina, sorteandolas solo la primera vez.
+
+    El generador se inicia con la semilla del tablero y la posicion del bloque,
+    por lo que el resultado no depende del orden en que se recorre el tablero.
+    Se guardan como maximo 2 * MAXIMO_BLOQUES_EN_MEMORIA mascaras.
+
+    Recibe:
+        tablero (dict): Tablero infinito.
+        fila_bloque (int): Fila del bloque.
+        columna_bloque (int): Columna del bloque.
+
+    Devuelve:
+        bytes: Un byte por casilla del bloque, fila por fila: 1 si hay mina, 0 si no.
+    """
+    clave = (fila_bloque, columna_bloque)
+    cache = tablero['minas']
+    mascara = cache.get(clave)
+
+    if mascara is not None:
+        cache.move_to_end(clave)
+        return mascara
+
+    lado = tablero['tamaño_bloque']
+    generador = random.Random(f"{tablero['semilla']}:{fila_bloque}:{columna_bloque}")
+
+    candidatas = range(lado * lado)
+    if fila_bloque in (-1, 0) and columna_bloque in (-1, 0):
+        fila_base, columna_base = fila_bloque * lado, columna_bloque * lado
+        candidatas = [i for i in candidatas
+                      if not en_zona_inicial(fila_base + i // lado, columna_base + i % lado)]
+
+    nueva = bytearray(lado * lado)
+    for indice in generador.sample(candidatas, round(len(candidatas) * tablero['densidad'])):
+        nueva[indice] = 1
+
+    mascara = bytes(nueva)
+    cache[clave] = mascara
+
+    if len(cache) > 2 * MAXIMO_BLOQUES_EN_MEMORIA:
+        cache.popitem(last=False)
+
+    return mascara
+
+
+def generar_bloque(tablero: dict, fila_bloque: int, columna_bloque: int) -> bytearray:
+    """
+    Arma las celdas de un bloque recien creado: sus minas y sus numeros.
+
+    Los numeros de las casillas del borde dependen de las minas de los bloques
+    vecinos, asi que se cuentan sobre un tablero de (lado + 2) x (lado + 2) que
+    agrega alrededor la ultima fila o columna de cada vecino. Los vecinos no se
+    crean: solo se sortean sus minas, que son siempre las mismas.
+
+    Recibe:
+        tablero (dict): Tablero infinito.
+        fila_bloque (int): Fila del bloque.
+        columna_bloque (int): Columna del bloque.
+
+    Devuelve:
+        bytearray: Celdas del bloque, fila por fila, sin casillas descubiertas ni banderas.
+    """
+    lado = tablero['tamaño_bloque']
+    ancho = lado + 2
+    borde = crear_tablero(ancho, ancho)
+    celdas_borde = borde['celdas']
+
+    # Para cada vecino: filas (o columnas) que se copian y donde empiezan en el borde.
+    tramos = {-1: (lado - 1, lado, 0), 0: (0, lado, 1), 1: (0, 1, lado + 1)}
+
+    for df, (fila_desde, fila_hasta, fila_destino) in tramos.items():
+        for dc, (col_desde, col_hasta, col_destino) in tramos.items():
+            mascara = sortear_minas_bloque(tablero, fila_bloque + df, columna_bloque + dc)
+
+            for i, fila in enumerate(range(fila_desde, fila_hasta)):
+                destino = (fila_destino + i) * ancho + col_destino
+                tramo = mascara[fila * lado + col_desde:fila * lado + col_hasta]
+                celdas_borde[destino:destino + len(tramo)] = tramo.translate(TABLA_MASCARA_A_MINA)
+
+    generar_matriz_numeros(borde)
+
+    celdas = bytearray(lado * lado)
+    for fila in range(lado):
+        origen = (fila + 1) * ancho + 1
+        celdas[fila * lado:(fila + 1) * lado] = celdas_borde[origen:origen + lado]
+
+    return celdas
+
+
+def obtener_bloque(tablero: dict, fila_bloque: int, columna_bloque: int) -> dict:
+    """
+    Devuelve un bloque del tablero, generandolo si no esta en memoria.
+
+    Recibe:
+        tablero (dict): Tablero infinito.
+        fila_bloque (int): Fila del bloque.
+        columna_bloque (int): Columna del bloque.
+
+    Devuelve:
+        dict: Bloque con 'celdas' y 'modificado' (ver crear_tablero_infinito). Quien
+              cambie sus celdas debe poner 'modificado' en True en la misma jugada,
+              para que no se descarte.
+    """
+    clave = (fila_bloque, columna_bloque)
+    bloques = tablero['bloques']
+    bloque = bloques.get(clave)
+
+    if bloque is not None:
+        bloques.move_to_end(clave)
+        return bloque
+
+    liberar_bloques(tablero, MAXIMO_BLOQUES_EN_MEMORIA - 1)
+
+    bloque = {'celdas': generar_bloque(tablero, fila_bloque, columna_bloque), 'modificado': False}
+    bloques[clave] = bloque
+    tablero['generados'] += 1
+
+    return bloque
+
+
+def liberar_bloques(tablero: dict, maximo: int = MAXIMO_BLOQUES_EN_MEMORIA) -> int:
+    """
+    Descarta los bloques sin jugadas menos usados hasta dejar como mucho maximo bloques.
+
+    Los bloques modificados nunca se descartan, porque guardan jugadas que no
+    se pueden volver a generar; si todos lo estan, quedan mas de maximo.
+
+    Recibe:
+        tablero (dict): Tablero infinito.
+        maximo (int, opcional): Cantidad de bloques que se quiere dejar.
+
+    Devuelve:
+        int: Cantidad de bloques descartados.
+    """
+    bloques = tablero['bloques']
+    sobrantes = len(bloques) - maximo
+
+    if sobrantes <= 0:
+        return 0
+
+    descartables = []
+    for clave, bloque in bloques.items():
+        if not bloque['modificado']:
+            descartables.append(clave)
+            if len(descartables) == sobrantes:
+                break
+
+    for clave in descartables:
+        del bloques[clave]
+
+    tablero['descartados'] += len(descartables)
+
+    return len(descartables)
+
+
+def ubicar_casilla(tablero: dict, fila: int, columna: int) -> tuple:
+    """
+    Devuelve el bloque de una casilla y el indice de la casilla dentro del bloque.
+
+    Recibe:
+        tablero (dict): Tablero infinito.
+        fila (int): Fila de la casilla (puede ser negativa).
+        columna (int): Columna de la casilla (puede ser negativa).
+
+    Devuelve:
+        tuple: (bloque, indice), con bloque como en obtener_bloque.
+    """
+    lado = tablero['tamaño_bloque']
+    fila_bloque, fila_local = divmod(fila, lado)
+    columna_bloque, columna_local = divmod(columna, lado)
+
+    return obtener_bloque(tablero, fila_bloque, columna_bloque), fila_local * lado + columna_local
+
+
+def obtener_celda_infinita(tablero: dict, fila: int, columna: int) -> int:
+    """
+    Devuelve el byte de una casilla del tablero infinito.
+
+    Recibe:
+        tablero (dict): Tablero infinito.
+        fila (int): Fila de la casilla.
+        columna (int): Columna de la casilla.
+
+    Devuelve:
+        int: Numero y marcas de la casilla, como en el tablero compacto.
+    """
+    bloque, indice = ubicar_casilla(tablero, fila, columna)
+
+    return bloque['celdas'][indice]
+
+
+def descubrir_celda_infinita(tablero: dict, fila: int, columna: int,
+                             limite: int = MAXIMO_DESCUBIERTAS_POR_CLICK) -> list[tuple[int, int]]:
+    """
+    Descubre una casilla del tablero infinito y, si no tiene minas alrededor,
+    las casillas vacias conectadas y su borde numerado, aunque esten en otros bloques.
+
+    Si se llega al limite, las casillas que faltaban revisar quedan en
+    'pendientes' y la jugada siguiente sigue con ellas despues de la casilla
+    nueva, asi ninguna casilla vacia queda con vecinas sin abrir.
+
+    Recibe:
+        tablero (dict): Tablero infinito.
+        fila (int): Fila de la casilla.
+        columna (int): Columna de la casilla.
+        limite (int, opcional): Casillas que se descubren como maximo en esta jugada.
+
+    Devuelve:
+        List[Tuple[int, int]]: Posiciones descubiertas, como en descubrir_celda.
+    """
+    reveladas = []
+    pila = tablero['pendientes'] + [(fila, columna)]
+    ocupada = BIT_DESCUBIERTA | BIT_BANDERA
+
+    while pila and len(reveladas) < limite:
+        f, c = pila.pop()
+        bloque, indice = ubicar_casilla(tablero, f, c)
+        celdas = bloque['celdas']
+        valor = celdas[indice]
+
+        if valor & ocupada or (valor & BIT_MINA and reveladas):
+            continue
+
+        celdas[indice] = valor | BIT_DESCUBIERTA
+        bloque['modificado'] = True
+        reveladas.append((f, c))
+
+        if valor & BIT_MINA:
+            return reveladas
+
+        if not valor & MASCARA_NUMERO:
+            pila.extend((f + df, c + dc) for df in (-1, 0, 1) for dc in (-1, 0, 1) if df or dc)
+
+    tablero['descubiertas'] += len(reveladas)
+    tablero['pendientes'] = pila
+
+    return reveladas
+
+
+def alternar_bandera_infinita(tablero: dict, fila: int, columna: int) -> bool:
+    """
+    Pone o saca la bandera de una casilla del tablero infinito.
+
+    Recibe:
+        tablero (dict): Tablero infinito.
+        fila (int): Fila de la casilla.
+        columna (int): Columna de la casilla.
+
+    Devuelve:
+        bool: True si la casilla quedo con bandera.
+    """
+    bloque, indice = ubicar_casilla(tablero, fila, columna)
+    bloque['celdas'][indice] ^= BIT_BANDERA
+    bloque['modificado'] = True
+
+    return bool(bloque['celdas'][indice] & BIT_BANDERA)
+
+
+class CeldasInfinitas:
+    """
+    Muestra el tablero infinito como las celdas de un tablero compacto de
+    LADO_TABLERO_INFINITO x LADO_TABLERO_INFINITO con el origen en el centro,
+    para dibujarlo con las mismas funciones que los tableros comunes.
+    """
+
+    def __init__(self, tablero: dict, lado: int = LADO_TABLERO_INFINITO) -> None:
+        self.tablero = tablero
+        self.lado = lado
+        self.centro = lado // 2
+
+    def __getitem__(self, indice: int) -> int:
+        fila, columna = divmod(indice, self.lado)
+
+        return obtener_celda_infinita(self.tablero, fila - self.centro, columna - self.centro)
+
+    def __len__(self) -> int:
+        return self.lado * self.lado